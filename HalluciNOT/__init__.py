@@ -7,14 +7,13 @@ hallucinations in LLM outputs when working with document-based content.
 
 __version__ = "0.1.0"
 
-from .processor import VerificationProcessor
-from .claim_extraction.extractor import ClaimExtractor, ClaimMerger
+import importlib
+
 from .source_mapping.mapper import SourceMapper
 from .confidence.scorer import ConfidenceScorer, ConfidenceCalibrator
 from .handlers.strategies import InterventionSelector
 from .handlers.corrections import generate_corrected_response
 from .visualization.highlighter import highlight_verification_result, create_confidence_legend
-from .visualization.reporting import ReportGenerator
 from .utils.common import (
     Claim, 
     ClaimType, 
@@ -39,6 +38,30 @@ try:
 except ImportError:
     __has_bytemesumai__ = False
 
+# Heavier components are imported on first access (PEP 562), so importing
+# the package for its data classes doesn't load the claim extraction
+# pipeline or the report templates
+_LAZY_IMPORTS = {
+    "VerificationProcessor": ".processor",
+    "ReportGenerator": ".visualization.reporting",
+    "ClaimExtractor": ".claim_extraction.extractor",
+    "ClaimMerger": ".claim_extraction.extractor",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 # Create a default verifier factory function for easy usage
 def create_verifier(config=None):
     """
@@ -50,4 +73,5 @@ def create_verifier(config=None):
     Returns:
         Configured VerificationProcessor
     """
+    from .processor import VerificationProcessor
     return VerificationProcessor(config)
\ No newline at end of file
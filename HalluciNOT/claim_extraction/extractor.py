@@ -9,18 +9,362 @@ LLM responses. It identifies assertions that can be verified against
 source documents and classifies them by type.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+import dbm
+import hashlib
+import itertools
 import logging
+import operator
+import os
+import pickle
 import re
+import threading
 import uuid
-import spacy
-from collections import defaultdict
+import zlib
+import numpy as np
+from collections import OrderedDict, defaultdict
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 
 from ..utils.common import Claim, ClaimType
 
+# Bumped whenever cached claim pickles become unreadable (e.g. Claim gained
+# __slots__, or a slot was added or removed)
+_CACHE_FORMAT_VERSION = 5
+
+
+# Claim ids are a per-process prefix plus a counter, which is much cheaper
+# than drawing a random UUID for every claim. The random part of the prefix
+# keeps ids from different runs distinct even if a process id is reused
+# (ids can outlive the process through the extraction cache).
+def _reset_claim_ids():
+    """Start a new claim id sequence for the current process."""
+    global _CLAIM_ID_PREFIX, _CLAIM_ID_COUNTER
+    _CLAIM_ID_PREFIX = "%x-%s-" % (os.getpid(), uuid.uuid4().hex[:8])
+    _CLAIM_ID_COUNTER = itertools.count()
+
+
+_reset_claim_ids()
+
+# Forked workers must not continue the parent's sequence
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_claim_ids)
+
+
+def _next_claim_id() -> str:
+    """Generate a claim id unique within this process."""
+    return _CLAIM_ID_PREFIX + str(next(_CLAIM_ID_COUNTER))
+
+
+def _uuid_claim_id() -> str:
+    """Generate a random UUID claim id."""
+    return str(uuid.uuid4())
+
+
+# Optional Hyperscan support for single-pass multi-pattern scanning
+try:
+    import hyperscan
+    _HAS_HYPERSCAN = True
+except ImportError:
+    hyperscan = None
+    _HAS_HYPERSCAN = False
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Components that only set sentence boundaries
+_SENTENCE_PIPES = ("senter", "sentencizer")
+
+# spaCy components the extractor relies on: tagging (the attribute ruler maps
+# tags to coarse POS), sentence boundaries, and named entities
+_EXTRACTION_PIPES = (
+    "transformer", "tok2vec", "tagger", "attribute_ruler", "senter", "sentencizer",
+    "ner", "entity_ruler", "doc_cleaner"
+)
+
+# Precompiled patterns for the rule-based heuristics. Marker lists that lead
+# to the same decision are fused into a single alternation so each category
+# costs one scan of the text.
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s')
+_FACT_RE = re.compile(
+    r'(?:^| )(?:is|are|was|were|has|have|contains|includes|consists|comprises|'
+    r'equals|means|involves|occurs|happens)(?: |$)'
+)
+_DIGIT_RE = re.compile(r'\d')
+_SIMPLE_DATE_RE = re.compile(r'\b(in|on|during|since) (the )?\d{4}\b|\b\d{1,2}/\d{1,2}/\d{2,4}\b')
+_CAPITALIZED_WORD_RE = re.compile(r'\b[A-Z][a-z]+\b')
+_NUMBER_RE = re.compile(r'\b\d+(\.\d+)?\b')
+_NUMBER_WORD_RE = re.compile(r'\b(zero|one|two|three|four|five|six|seven|eight|nine|ten)\b')
+_NUMERIC_UNIT_RE = re.compile(
+    r'\$\d+|\d+ dollars|\d+ euros|\d+ yen'                               # money
+    r'|\d+(\.\d+)?( )?%|\d+( )?(percent|percentage)'                     # percentages
+    r'|\d+( )?(kg|mb|gb|tb|mm|cm|m|km|inch|inches|feet|foot|yards|miles)'  # quantities
+)
+_TEMPORAL_RE = re.compile(
+    r'\b(in|on|during|since) (the )?\d{4}\b'
+    r'|\b\d{1,2}/\d{1,2}/\d{2,4}\b'
+    r'|\b(January|February|March|April|May|June|July|August|September|October|November|December)\b'
+    r'|\b\d{1,2}(st|nd|rd|th)?\b'
+    r'|\b(yesterday|today|tomorrow)\b'
+    r'|\b(year|month|week|day|hour|minute|century|decade)\b',
+    re.IGNORECASE
+)
+_ENTITY_STATEMENT_RE = re.compile(r'\b[A-Z][a-z]+ (is|was|has|have|will)\b')
+_CAUSAL_MARKERS = r'because|due to|as a result|therefore|thus|consequently|leads to|causes'
+_COMPARATIVE_MARKERS = r'more|less|greater|fewer|better|worse|higher|lower|compared to'
+_CITATION_MARKERS = r'according to|cited by|as stated in|as reported by|as shown by'
+_CAUSAL_RE = re.compile(r'\b(' + _CAUSAL_MARKERS + r')\b')
+_COMPARATIVE_RE = re.compile(r'\b(' + _COMPARATIVE_MARKERS + r')\b')
+_DEFINITION_RE = re.compile(r'\b[A-Za-z]+ (is|are) (a|an|the) [A-Za-z]+\b')
+_CITATION_RE = re.compile(r'\b(' + _CITATION_MARKERS + r')\b')
+# All marker categories in one alternation; the matching group names the category
+_MARKER_RE = re.compile(
+    r'\b(?:(?P<causal>' + _CAUSAL_MARKERS + r')'
+    r'|(?P<comparative>' + _COMPARATIVE_MARKERS + r')'
+    r'|(?P<citation>' + _CITATION_MARKERS + r'))\b'
+)
+_PROPER_NOUN_RE = re.compile(r'\b[A-Z][a-zA-Z]+ (?:[A-Z][a-zA-Z]+\s?)*')
+_DATE_ENTITY_RE = re.compile(
+    r'\b\d{1,2}/\d{1,2}/\d{2,4}\b'
+    r'|\b(January|February|March|April|May|June|July|August|September|October|November|December) \d{1,2}(st|nd|rd|th)?, \d{4}\b',
+    re.IGNORECASE
+)
+_MONEY_ENTITY_RE = re.compile(
+    r'\$\d+(?:,\d{3})*(?:\.\d{2})?|\d+(?:,\d{3})*(?:\.\d{2})? (dollars|euros|pounds)'
+)
+
+# Feature bits reported by the Hyperscan database for the rule-based path
+_F_FACT = 1 << 0
+_F_DIGIT = 1 << 1
+_F_SIMPLE_DATE = 1 << 2
+_F_CAPITALIZED = 1 << 3
+_F_NUMBER = 1 << 4
+_F_NUMERIC_UNIT = 1 << 5
+_F_TEMPORAL = 1 << 6
+_F_ENTITY_STATEMENT = 1 << 7
+_F_CAUSAL = 1 << 8
+_F_COMPARATIVE = 1 << 9
+_F_DEFINITION = 1 << 10
+_F_CITATION = 1 << 11
+
+# Any of these marks a sentence as a potential factual claim
+_FACTUAL_SIGNALS = _F_FACT | _F_DIGIT | _F_SIMPLE_DATE | _F_CAPITALIZED
+
+# Claim type precedence for the rule-based path (required bits, claim type)
+_RULE_TYPE_PRECEDENCE = (
+    (_F_NUMBER | _F_NUMERIC_UNIT, ClaimType.NUMERICAL),
+    (_F_TEMPORAL, ClaimType.TEMPORAL),
+    (_F_ENTITY_STATEMENT, ClaimType.ENTITY),
+    (_F_CAUSAL, ClaimType.CAUSAL),
+    (_F_COMPARATIVE, ClaimType.COMPARATIVE),
+    (_F_DEFINITION, ClaimType.DEFINITIONAL),
+    (_F_CITATION, ClaimType.CITATION),
+)
+
+# (feature bit, pattern, case-insensitive). Patterns the heuristics apply to
+# lowercased text are matched case-insensitively against the original text.
+_RULE_FEATURE_PATTERNS = (
+    (_F_FACT, _FACT_RE, True),
+    (_F_DIGIT, _DIGIT_RE, False),
+    (_F_SIMPLE_DATE, _SIMPLE_DATE_RE, False),
+    (_F_CAPITALIZED, _CAPITALIZED_WORD_RE, False),
+    (_F_NUMBER, _NUMBER_RE, False),
+    (_F_NUMBER, _NUMBER_WORD_RE, True),
+    (_F_NUMERIC_UNIT, _NUMERIC_UNIT_RE, True),
+    (_F_TEMPORAL, _TEMPORAL_RE, True),
+    (_F_ENTITY_STATEMENT, _ENTITY_STATEMENT_RE, False),
+    (_F_CAUSAL, _CAUSAL_RE, True),
+    (_F_COMPARATIVE, _COMPARATIVE_RE, True),
+    (_F_DEFINITION, _DEFINITION_RE, False),
+    (_F_CITATION, _CITATION_RE, True),
+)
+
+_feature_database = None
+
+# Feature bits collected in a single pass over the tokens of a spaCy span
+_S_VERB = 1 << 0
+_S_NOUN = 1 << 1
+_S_NUM = 1 << 2
+_S_MONEY = 1 << 3
+_S_QUANTITY = 1 << 4
+_S_DATE = 1 << 5
+_S_PRON_FIRST = 1 << 6
+_S_NAMED_ENT = 1 << 7
+
+_FIRST_PERSON_WORDS = frozenset(("i", "we", "my", "our"))
+
+# Entity labels mapped to their span feature bits
+_ENT_LABEL_FEATURES = {
+    "MONEY": _S_MONEY,
+    "QUANTITY": _S_QUANTITY,
+    "PERCENT": _S_QUANTITY,
+    "CARDINAL": _S_QUANTITY,
+    "DATE": _S_DATE,
+    "TIME": _S_DATE,
+    "PERSON": _S_NAMED_ENT,
+    "ORG": _S_NAMED_ENT,
+    "GPE": _S_NAMED_ENT,
+    "LOC": _S_NAMED_ENT,
+    "PRODUCT": _S_NAMED_ENT,
+}
+
+_span_feature_ids = None
+
+# Claim type priority when merging claims: numerical > temporal > entity > others
+_MERGE_TYPE_PRIORITY_BY_TYPE = {
+    ClaimType.NUMERICAL: 5,
+    ClaimType.TEMPORAL: 4,
+    ClaimType.ENTITY: 3,
+    ClaimType.CAUSAL: 2,
+    ClaimType.COMPARATIVE: 2,
+    ClaimType.DEFINITIONAL: 2,
+    ClaimType.CITATION: 1,
+    ClaimType.OTHER: 0
+}
+
+# The same priorities indexed by ClaimType.ordinal
+_MERGE_TYPE_PRIORITY = tuple(_MERGE_TYPE_PRIORITY_BY_TYPE.get(claim_type, 0) for claim_type in ClaimType)
+
+
+def _get_span_feature_ids(strings) -> Tuple[int, int, int, int, Dict[int, int]]:
+    """
+    Resolve the POS and entity label hashes used by ``_span_features``.
+    
+    spaCy's built-in labels hash to fixed symbol ids, so this is done once
+    per process and comparisons on tokens are integer rather than string.
+    """
+    global _span_feature_ids
+    if _span_feature_ids is None:
+        _span_feature_ids = (
+            strings["VERB"],
+            strings["NOUN"],
+            strings["PROPN"],
+            strings["PRON"],
+            {strings[label]: bit for label, bit in _ENT_LABEL_FEATURES.items()}
+        )
+    return _span_feature_ids
+
+
+def _marker_categories(text_lower: str) -> set:
+    """
+    Find which marker categories (causal, comparative, citation) occur in text.
+    
+    Scans the text once for all markers. Causal markers take precedence over
+    the other categories, so the scan stops at the first one found.
+    """
+    categories = set()
+    for match in _MARKER_RE.finditer(text_lower):
+        categories.add(match.lastgroup)
+        if match.lastgroup == "causal":
+            break
+    return categories
+
+
+def _iter_sentence_spans(text: str) -> Iterator[Tuple[int, int]]:
+    """
+    Yield the ``(start, end)`` offsets of each whitespace-stripped sentence.
+    
+    Offsets are tracked with a cursor while splitting, so no search for the
+    sentence in the original text is needed afterwards.
+    """
+    cursor = 0
+    for boundary in _SENTENCE_SPLIT_RE.finditer(text):
+        yield _strip_span(text, cursor, boundary.start())
+        cursor = boundary.end()
+    yield _strip_span(text, cursor, len(text))
+
+
+def _strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Narrow ``text[start:end]`` to exclude leading and trailing whitespace."""
+    segment = text[start:end]
+    stripped = segment.lstrip()
+    start += len(segment) - len(stripped)
+    return start, start + len(stripped.rstrip())
+
+
+def _get_feature_database():
+    """Compile (once per process) the Hyperscan database of rule-based features."""
+    global _feature_database
+    if _feature_database is None:
+        base_flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.pattern.encode("utf-8") for _, pattern, _ in _RULE_FEATURE_PATTERNS],
+            ids=[bit for bit, _, _ in _RULE_FEATURE_PATTERNS],
+            elements=len(_RULE_FEATURE_PATTERNS),
+            flags=[
+                base_flags | (hyperscan.HS_FLAG_CASELESS if caseless else 0)
+                for _, _, caseless in _RULE_FEATURE_PATTERNS
+            ]
+        )
+        _feature_database = database
+    return _feature_database
+
+
+# Loaded spaCy pipelines, each with the lock serializing its use, by (model
+# name, whether spaCy runs on the GPU), and the lock guarding their loading
+_spacy_pipelines: Dict[Tuple[str, bool], Tuple[Any, threading.Lock]] = {}
+_spacy_pipelines_lock = threading.Lock()
+
+
+def _get_spacy_pipeline(model: str, gpu: bool) -> Tuple[Any, threading.Lock]:
+    """
+    Load (once per process) the spaCy pipeline used for claim extraction.
+    
+    Extractors created with the same model share the pipeline, so only the
+    first of them pays for loading it. select_pipes and memory_zone change
+    the state of the pipeline itself, so sharing it across threads is only
+    safe while holding its lock: extractors hold it around each use of the
+    pipeline, which serializes extraction with the same model. Loading a
+    model per extractor instead would cost its full memory every time.
+    
+    Returns:
+        The pipeline and its lock
+    """
+    key = (model, gpu)
+    with _spacy_pipelines_lock:
+        entry = _spacy_pipelines.get(key)
+        if entry is None:
+            entry = (_load_spacy_pipeline(model), threading.Lock())
+            _spacy_pipelines[key] = entry
+    return entry
+
+
+def _load_spacy_pipeline(model: str):
+    """Load a spaCy pipeline with only the components claim extraction needs."""
+    import spacy
+    
+    # Load a spaCy model for NLP tasks
+    # Use 'en_core_web_sm' for better performance, 'en_core_web_md' for better accuracy,
+    # or 'en_core_web_trf' with use_gpu for batched transformer inference
+    # The dependency parser and lemmatizer are never used, so don't even load them
+    nlp = spacy.load(model, exclude=["parser", "lemmatizer"])
+    
+    # doc.sents needs a sentence boundary component once the parser is gone:
+    # prefer the model's (disabled by default) statistical senter, else a sentencizer
+    if "senter" in nlp.disabled:
+        nlp.enable_pipe("senter")
+    elif not {"senter", "sentencizer"} & set(nlp.pipe_names):
+        nlp.add_pipe("sentencizer", first=True)
+    
+    if "ner" not in nlp.pipe_names:
+        logger.warning("spaCy model has no NER component; no entities will be extracted")
+    
+    # Drop transformer outputs from each doc once the pipeline has run
+    if "transformer" in nlp.pipe_names and "doc_cleaner" not in nlp.pipe_names:
+        nlp.add_pipe("doc_cleaner")
+    
+    logger.debug("Loaded spaCy model for claim extraction: %s", nlp.pipe_names)
+    
+    return nlp
+
+
+def _collect_feature(feature_bit, start, end, flags, context):
+    """Hyperscan match handler: accumulate the matched feature bit."""
+    context[0] |= feature_bit
+
 
 class ClaimExtractor:
     """
@@ -43,22 +387,41 @@ class ClaimExtractor:
         self.min_claim_length = self.config.get("min_claim_length", 5)
         self.max_claim_length = self.config.get("max_claim_length", 200)
         self.use_spacy = self.config.get("use_spacy", True)
+        self.spacy_model = self.config.get("spacy_model", "en_core_web_sm")  # e.g. "en_core_web_trf" on GPU
+        self.use_gpu = self.config.get("use_gpu", False)
         self.use_sentence_boundaries = self.config.get("use_sentence_boundaries", True)
         self.enable_entity_extraction = self.config.get("enable_entity_extraction", True)
+        self.num_workers = self.config.get("num_workers", 1)
+        self.batch_size = self.config.get("batch_size", 64)
+        self.use_hyperscan = self.config.get("use_hyperscan", True) and _HAS_HYPERSCAN
+        self.cache_path = self.config.get("cache_path")  # Disk cache of extraction results
+        self.cache_size = self.config.get("cache_size", 0)  # In-memory cache entries (0 disables)
+        self.dedupe_sentences = self.config.get("dedupe_sentences", False)  # Analyze repeated sentences once
+        self._new_claim_id = _uuid_claim_id if self.config.get("uuid_ids", False) else _next_claim_id
         
         # Initialize components
         self._initialize_components()
+        self._initialize_cache()
         
         logger.debug("ClaimExtractor initialized with config: %s", self.config)
     
     def _initialize_components(self):
         """Initialize components needed for claim extraction."""
+        self._gpu_active = False
+        self._nlp_lock = threading.Lock()
         try:
             if self.use_spacy:
-                # Load a spaCy model for NLP tasks
-                # Use 'en_core_web_sm' for better performance or 'en_core_web_md' for better accuracy
-                self.nlp = spacy.load("en_core_web_sm")
-                logger.debug("Loaded spaCy model for claim extraction")
+                # Imported here so that importing the package doesn't pay for spaCy
+                import spacy
+                
+                # Run the pipeline on the GPU if requested and one is available
+                if self.use_gpu:
+                    self._gpu_active = spacy.prefer_gpu()
+                    logger.debug("spaCy GPU %s", "enabled" if self._gpu_active else "not available, using CPU")
+                
+                # Load a spaCy model for NLP tasks, shared by all the extractors
+                # of the process (see _get_spacy_pipeline for thread safety)
+                self.nlp, self._nlp_lock = _get_spacy_pipeline(self.spacy_model, self._gpu_active)
             else:
                 self.nlp = None
                 logger.debug("Not using spaCy for claim extraction")
@@ -66,6 +429,86 @@ class ClaimExtractor:
             logger.warning("Could not load spaCy model; falling back to rule-based extraction: %s", e)
             self.nlp = None
             self.use_spacy = False
+        
+        # Scan all rule-based patterns in a single pass when Hyperscan is available
+        self._feature_db = _get_feature_database() if self.use_hyperscan else None
+    
+    def _initialize_cache(self):
+        """Initialize the in-memory and (optional) disk caches of extraction results."""
+        self._memory_cache = OrderedDict()
+        self._disk_cache = dbm.open(self.cache_path, "c") if self.cache_path else None
+        
+        # Results depend on the configuration, on which extraction path is
+        # used (and, for spaCy, on the library and model versions), and their
+        # pickles on the layout of the Claim class
+        config_items = sorted((key, repr(value)) for key, value in self.config.items())
+        self._config_digest = hashlib.sha256(
+            pickle.dumps((
+                _CACHE_FORMAT_VERSION,
+                config_items,
+                self._spacy_versions()
+            ))
+        ).digest()
+    
+    def _spacy_versions(self) -> Optional[Tuple[str, str, str]]:
+        """spaCy, model name and model versions, or None on the rule-based path."""
+        if not (self.use_spacy and self.nlp is not None):
+            return None
+        
+        import spacy
+        meta = self.nlp.meta
+        return spacy.__version__, meta.get("name", ""), meta.get("version", "")
+    
+    def close(self):
+        """Close the disk cache, if one is open."""
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+    
+    def _cache_key(self, text: str) -> bytes:
+        """Compute the cache key for extracting claims from text."""
+        return hashlib.sha256(self._config_digest + text.encode("utf-8")).digest()
+    
+    def _get_cached_claims(self, key: bytes) -> Optional[List[Claim]]:
+        """
+        Look up cached claims for a cache key.
+        
+        Entries are stored pickled, so every hit returns fresh Claim objects
+        that callers are free to modify, with new claim IDs.
+        """
+        data = self._memory_cache.get(key)
+        if data is not None:
+            self._memory_cache.move_to_end(key)
+        elif self._disk_cache is not None and key in self._disk_cache:
+            data = zlib.decompress(self._disk_cache[key])
+            self._remember(key, data)
+        else:
+            return None
+        
+        claims = pickle.loads(data)
+        for claim in claims:
+            claim.id = self._new_claim_id()
+        return claims
+    
+    def _cache_claims(self, key: bytes, claims: List[Claim]):
+        """Store extracted claims in the in-memory and disk caches."""
+        if not self.cache_size and self._disk_cache is None:
+            return
+        
+        data = pickle.dumps(claims, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, data)
+        if self._disk_cache is not None:
+            self._disk_cache[key] = zlib.compress(data, 1)
+    
+    def _remember(self, key: bytes, data: bytes):
+        """Add an entry to the in-memory LRU cache."""
+        if not self.cache_size:
+            return
+        
+        self._memory_cache[key] = data
+        self._memory_cache.move_to_end(key)
+        if len(self._memory_cache) > self.cache_size:
+            self._memory_cache.popitem(last=False)
     
     def extract_claims(self, text: str) -> List[Claim]:
         """
@@ -79,12 +522,220 @@ class ClaimExtractor:
         """
         logger.debug("Extracting claims from text (%d characters)", len(text))
         
+        # Re-verifying the same response skips extraction entirely
+        key = self._cache_key(text)
+        cached = self._get_cached_claims(key)
+        if cached is not None:
+            logger.debug("Using cached claims for text")
+            return cached
+        
         if self.use_spacy and self.nlp is not None:
             # Use spaCy for claim extraction
-            return self._extract_claims_spacy(text)
+            if self._can_dedupe_sentences():
+                claims = self._extract_claims_deduplicated([text])[0]
+            else:
+                claims = self._extract_claims_spacy(text)
         else:
             # Fall back to rule-based extraction
-            return self._extract_claims_rule_based(text)
+            claims = self._extract_claims_rule_based(text)
+        
+        self._cache_claims(key, claims)
+        return claims
+    
+    def extract_claims_parallel(self, text: str, num_workers: int = 4) -> List[Claim]:
+        """
+        Extract factual claims from a long text using several processes.
+        
+        The text is split on blank lines into paragraphs, which are processed
+        by a pool of worker processes (each loading its own extractor once).
+        Claim positions are shifted back into the original text.
+        
+        Args:
+            text: Text to extract claims from (typically a long LLM response)
+            num_workers: Number of worker processes
+            
+        Returns:
+            List of extracted claims
+        """
+        # Paragraphs with their offsets in the original text
+        paragraphs = []
+        cursor = 0
+        for boundary in _PARAGRAPH_BREAK_RE.finditer(text):
+            paragraphs.append((cursor, text[cursor:boundary.start()]))
+            cursor = boundary.end()
+        paragraphs.append((cursor, text[cursor:]))
+        
+        if num_workers <= 1 or len(paragraphs) <= 1:
+            return self.extract_claims(text)
+        
+        logger.debug("Extracting claims from %d paragraphs with %d workers", len(paragraphs), num_workers)
+        
+        # Workers get their own extractor; they must not share the disk cache
+        worker_config = {key: value for key, value in self.config.items() if key != "cache_path"}
+        
+        with ProcessPoolExecutor(
+            max_workers=min(num_workers, len(paragraphs)),
+            initializer=_init_extraction_worker,
+            initargs=(worker_config,)
+        ) as executor:
+            results = executor.map(_extract_worker_claims, [paragraph for _, paragraph in paragraphs])
+            
+            claims = []
+            for (offset, _), paragraph_claims in zip(paragraphs, results):
+                for claim in paragraph_claims:
+                    claim.start_idx += offset
+                    claim.end_idx += offset
+                    claims.append(claim)
+        
+        return claims
+    
+    def extract_claims_batch(
+        self,
+        texts: List[str],
+        n_process: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> Iterator[List[Claim]]:
+        """
+        Extract factual claims from several texts at once.
+        
+        With spaCy available, the texts are streamed through ``nlp.pipe`` so
+        the pipeline runs on mini-batches (optionally across processes)
+        instead of paying the per-call overhead for every text.
+        
+        Args:
+            texts: Texts to extract claims from
+            n_process: Number of worker processes (defaults to ``num_workers``)
+            batch_size: Number of texts per mini-batch (defaults to ``batch_size``)
+            
+        Yields:
+            List of extracted claims for each text, in input order
+        """
+        logger.debug("Extracting claims from batch of %d texts", len(texts))
+        
+        if not (self.use_spacy and self.nlp is not None):
+            for text in texts:
+                yield self._extract_claims_rule_based(text)
+            return
+        
+        if self._can_dedupe_sentences():
+            yield from self._extract_claims_deduplicated(texts, n_process, batch_size)
+            return
+        
+        # Only run the components claim extraction actually needs. The
+        # pipeline is shared by every extractor of the process, so it is
+        # locked while pipes are disabled, and the claims are all collected
+        # before yielding: a caller pausing or abandoning the iteration must
+        # not leave the pipeline locked or its pipes disabled for the others
+        active_pipes = [name for name in self.nlp.pipe_names if name in _EXTRACTION_PIPES]
+        
+        with self._nlp_lock, self._memory_zone(), self.nlp.select_pipes(enable=active_pipes):
+            docs = self.nlp.pipe(
+                texts,
+                batch_size=batch_size or self.batch_size,
+                n_process=self._resolve_n_process(n_process)
+            )
+            claims_per_text = [self._claims_from_doc(doc) for doc in docs]
+        
+        yield from claims_per_text
+    
+    def _memory_zone(self):
+        """
+        Scope the strings spaCy interns while processing to a single request.
+        
+        Uses ``nlp.memory_zone()`` (spaCy 3.8+) so the vocabulary doesn't grow
+        without bound in long-running services; a no-op on older versions.
+        Claims only hold plain Python values, so nothing from the docs needs
+        to outlive the zone.
+        """
+        if hasattr(self.nlp, "memory_zone"):
+            return self.nlp.memory_zone()
+        return nullcontext()
+    
+    def _resolve_n_process(self, n_process: Optional[int]) -> int:
+        """
+        Determine the number of worker processes for ``nlp.pipe``.
+        
+        A GPU pipeline runs in the main process, since the model is already
+        batched on the device and worker processes would each need their own
+        copy of it.
+        """
+        if self._gpu_active:
+            return 1
+        return n_process or self.num_workers
+    
+    def _can_dedupe_sentences(self) -> bool:
+        """Check whether repeated sentences can be analyzed only once."""
+        return (
+            self.dedupe_sentences and
+            self.use_sentence_boundaries and
+            any(name in _SENTENCE_PIPES for name in self.nlp.pipe_names)
+        )
+    
+    def _extract_claims_deduplicated(
+        self,
+        texts: List[str],
+        n_process: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> List[List[Claim]]:
+        """
+        Extract claims with spaCy, analyzing each distinct sentence only once.
+        
+        The texts are first split into sentences with the sentence boundary
+        component alone. The full pipeline then runs once per distinct
+        sentence, and the resulting claims are copied to every occurrence
+        with their positions shifted accordingly.
+        
+        Args:
+            texts: Texts to extract claims from
+            n_process: Number of worker processes (defaults to ``num_workers``)
+            batch_size: Number of texts per mini-batch (defaults to ``batch_size``)
+            
+        Returns:
+            List of extracted claims for each text, in input order
+        """
+        batch_size = batch_size or self.batch_size
+        n_process = self._resolve_n_process(n_process)
+        
+        # Split into sentences, keeping one exemplar per distinct sentence
+        sentence_pipes = [name for name in self.nlp.pipe_names if name in _SENTENCE_PIPES]
+        exemplars = {}
+        occurrences = []
+        
+        with self._nlp_lock, self._memory_zone():
+            with self.nlp.select_pipes(enable=sentence_pipes):
+                for doc in self.nlp.pipe(texts, batch_size=batch_size):
+                    occurrences.append([
+                        (exemplars.setdefault(sent.text, len(exemplars)), sent.start_char)
+                        for sent in doc.sents
+                    ])
+            
+            # Run the extraction pipeline on the distinct sentences only
+            active_pipes = [name for name in self.nlp.pipe_names if name in _EXTRACTION_PIPES]
+            
+            with self.nlp.select_pipes(enable=active_pipes):
+                docs = self.nlp.pipe(exemplars, batch_size=batch_size, n_process=n_process)
+                sentence_claims = [self._claims_from_doc(doc) for doc in docs]
+        
+        logger.debug("Analyzed %d distinct sentences for %d texts", len(sentence_claims), len(texts))
+        
+        # Fan the claims back out to every occurrence
+        results = []
+        for text_occurrences in occurrences:
+            claims = []
+            for index, offset in text_occurrences:
+                for claim in sentence_claims[index]:
+                    claims.append(replace(
+                        claim,
+                        id=self._new_claim_id(),
+                        start_idx=claim.start_idx + offset,
+                        end_idx=claim.end_idx + offset,
+                        entities=[entity.copy() for entity in claim.entities],
+                        context=dict(claim.context),
+                        sources=list(claim.sources)
+                    ))
+            results.append(claims)
+        
+        return results
     
     def _extract_claims_spacy(self, text: str) -> List[Claim]:
         """
@@ -92,10 +743,18 @@ class ClaimExtractor:
         
         This approach uses linguistic features to identify factual statements.
         """
-        claims = []
+        # Process the text with spaCy; no doc references survive the zone
+        with self._nlp_lock, self._memory_zone():
+            doc = self.nlp(text)
+            return self._claims_from_doc(doc)
+    
+    def _claims_from_doc(self, doc) -> List[Claim]:
+        """
+        Extract claims from a document already processed by spaCy.
         
-        # Process the text with spaCy
-        doc = self.nlp(text)
+        Shared by the single-text and batched extraction paths.
+        """
+        claims = []
         
         # Extract sentences as potential claims
         if self.use_sentence_boundaries:
@@ -108,27 +767,24 @@ class ClaimExtractor:
         # Process each potential claim
         for span in potential_claims:
             # Skip if too short or too long
-            if len(span.text) < self.min_claim_length or len(span.text) > self.max_claim_length:
+            span_text = span.text
+            if len(span_text) < self.min_claim_length or len(span_text) > self.max_claim_length:
                 continue
             
-            # Skip if not a factual claim
-            if not self._is_factual_claim(span):
+            # Skip if not a factual claim; otherwise get its type and entities
+            analysis = self._analyze_span(span, span_text)
+            if analysis is None:
                 continue
             
             # Create a claim object
-            claim_type = self._determine_claim_type(span)
-            claim_text = span.text.strip()
+            claim_type, entities = analysis
+            claim_text = span_text.strip()
             start_idx = span.start_char
             end_idx = span.end_char
             
-            # Extract entities if enabled
-            entities = []
-            if self.enable_entity_extraction:
-                entities = self._extract_entities(span)
-            
             # Create and add the claim
             claim = Claim(
-                id=str(uuid.uuid4()),
+                id=self._new_claim_id(),
                 text=claim_text,
                 type=claim_type,
                 start_idx=start_idx,
@@ -149,35 +805,25 @@ class ClaimExtractor:
         """
         claims = []
         
-        # Split into sentences using regex
-        sentences = re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s', text)
-        
-        # Process each sentence as a potential claim
-        for sentence in sentences:
-            clean_sentence = sentence.strip()
-            
+        # Split into sentences, tracking their positions in the original text
+        for start_idx, end_idx in _iter_sentence_spans(text):
             # Skip if too short or too long
-            if len(clean_sentence) < self.min_claim_length or len(clean_sentence) > self.max_claim_length:
+            if end_idx - start_idx < self.min_claim_length or end_idx - start_idx > self.max_claim_length:
                 continue
             
-            # Skip if not a factual claim (basic heuristics)
-            if not self._is_factual_claim_text(clean_sentence):
-                continue
+            clean_sentence = text[start_idx:end_idx]
             
-            # Find the start and end indices in the original text
-            # This is a simplified approach that may not be 100% accurate
-            start_idx = text.find(clean_sentence)
-            if start_idx == -1:
-                # If exact match isn't found, use approximate position
-                start_idx = text.lower().find(clean_sentence.lower())
-                if start_idx == -1:
-                    # Skip if we can't find position
-                    continue
+            # Scan every rule-based pattern at once if Hyperscan is available
+            # (None runs the individual patterns)
+            features = self._scan_rule_features(clean_sentence) if self._feature_db is not None else None
             
-            end_idx = start_idx + len(clean_sentence)
+            # Skip if not a factual claim (basic heuristics)
+            text_lower = clean_sentence.lower()
+            if not self._is_factual_claim_text(clean_sentence, text_lower, features):
+                continue
             
             # Determine claim type using text-based heuristics
-            claim_type = self._determine_claim_type_text(clean_sentence)
+            claim_type = self._determine_claim_type_text(clean_sentence, text_lower, features)
             
             # Extract entities if enabled (simplified approach)
             entities = []
@@ -186,7 +832,7 @@ class ClaimExtractor:
             
             # Create and add the claim
             claim = Claim(
-                id=str(uuid.uuid4()),
+                id=self._new_claim_id(),
                 text=clean_sentence,
                 type=claim_type,
                 start_idx=start_idx,
@@ -199,190 +845,264 @@ class ClaimExtractor:
         logger.debug("Extracted %d claims using rule-based approach", len(claims))
         return claims
     
-    def _is_factual_claim(self, span) -> bool:
+    def _span_features(self, span) -> int:
+        """
+        Collect the token-level features of a spaCy span in a single pass.
+        
+        Returns a bitmask of ``_S_*`` flags (verbs, nouns, numbers, entity
+        categories, leading first-person pronouns).
+        """
+        verb, noun, propn, pron, ent_features = _get_span_feature_ids(span.doc.vocab.strings)
+        
+        mask = 0
+        for i, token in enumerate(span):
+            pos = token.pos
+            if pos == verb:
+                mask |= _S_VERB
+            elif pos == noun or pos == propn:
+                mask |= _S_NOUN
+            elif pos == pron and i < 3 and token.lower_ in _FIRST_PERSON_WORDS:
+                mask |= _S_PRON_FIRST
+            
+            if token.like_num:
+                mask |= _S_NUM
+            
+            ent_type = token.ent_type
+            if ent_type:
+                mask |= ent_features.get(ent_type, 0)
+        
+        return mask
+    
+    def _analyze_span(self, span, span_text: str) -> Optional[Tuple[ClaimType, List[Dict[str, Any]]]]:
+        """
+        Analyze a spaCy span as a potential claim in a single pass.
+        
+        Runs the cheap text checks first, then walks the tokens once for
+        the features that decide both factuality and claim type, and only
+        extracts entities for spans that are factual claims.
+        
+        Returns:
+            ``(claim_type, entities)``, or None if the span is not a factual claim
+        """
+        if not self._is_statement(span, span_text):
+            return None
+        
+        features = self._span_features(span)
+        if not self._has_factual_features(features):
+            return None
+        
+        claim_type = self._determine_claim_type(span, features, span_text.lower())
+        entities = self._extract_entities(span) if self.enable_entity_extraction else []
+        
+        return claim_type, entities
+    
+    def _is_factual_claim(self, span, features: Optional[int] = None) -> bool:
         """
         Determine if a spaCy span represents a factual claim.
         
         Uses linguistic features to identify statements of fact.
         """
+        if not self._is_statement(span, span.text):
+            return False
+        
+        if features is None:
+            features = self._span_features(span)
+        
+        return self._has_factual_features(features)
+    
+    def _is_statement(self, span, span_text: str) -> bool:
+        """Check that a span is neither a question nor a command."""
         # Skip questions
-        if span.text.endswith("?"):
+        if span_text.endswith("?"):
             return False
         
         # Skip imperative sentences (commands)
-        if span[0].pos_ == "VERB" and span[0].tag_ in ["VB", "VBP"]:
+        first_token = span[0]
+        if first_token.pos_ == "VERB" and first_token.tag_ in ["VB", "VBP"]:
             return False
         
+        return True
+    
+    def _has_factual_features(self, features: int) -> bool:
+        """Check the token features of a span for a statement of fact."""
         # Skip first-person statements (opinions)
-        if any(token.text.lower() in ["i", "we", "my", "our"] and 
-               token.pos_ == "PRON" for token in span[:3]):
+        if features & _S_PRON_FIRST:
             return False
         
-        # Look for indicators of factual claims
-        has_verb = any(token.pos_ == "VERB" for token in span)
-        has_noun = any(token.pos_ == "NOUN" or token.pos_ == "PROPN" for token in span)
-        
         # Most factual claims have both a noun and a verb
-        return has_verb and has_noun
+        return features & (_S_VERB | _S_NOUN) == _S_VERB | _S_NOUN
+    
+    def _scan_rule_features(self, text: str) -> Optional[int]:
+        """
+        Scan text once with the Hyperscan database.
+        
+        Returns a bitmask of the rule-based features (fact verbs, dates,
+        numbers, markers, ...) found anywhere in the text, or None for text
+        with non-ASCII characters. Hyperscan's \\b, \\w and \\d only know
+        ASCII, where re's are Unicode-aware, so such text goes through the
+        individual patterns to get the same results.
+        """
+        if not text.isascii():
+            return None
+        
+        found = [0]
+        self._feature_db.scan(text.encode("utf-8"), match_event_handler=_collect_feature, context=found)
+        return found[0]
     
-    def _is_factual_claim_text(self, text: str) -> bool:
+    def _is_factual_claim_text(
+        self,
+        text: str,
+        text_lower: Optional[str] = None,
+        features: Optional[int] = None
+    ) -> bool:
         """
         Determine if text represents a factual claim using rule-based heuristics.
         
-        This is a simplified approach when spaCy is not available.
+        This is a simplified approach when spaCy is not available. Callers
+        that already have the lowercased text can pass it as ``text_lower``.
+        If ``features`` (a bitmask from ``_scan_rule_features``) is given, it
+        is used instead of running the individual patterns.
         """
+        if text_lower is None:
+            text_lower = text.lower()
+        
         # Skip questions
         if text.endswith("?"):
             return False
         
         # Skip imperatives (simplified check)
-        first_word = text.split()[0].lower() if text.split() else ""
+        words = text_lower.split(None, 1)
+        first_word = words[0] if words else ""
         if first_word in ["go", "do", "make", "try", "use", "find", "get", "see", "let", "take"]:
             return False
         
         # Skip first-person statements (opinions)
-        if text.lower().startswith(("i ", "we ", "my ", "our ")):
+        if text_lower.startswith(("i ", "we ", "my ", "our ")):
             return False
         
+        if features is not None:
+            return bool(features & _FACTUAL_SIGNALS)
+        
         # Simple pattern matching for factual claims
-        fact_patterns = [
-            r' is ',
-            r' are ',
-            r' was ',
-            r' were ',
-            r' has ',
-            r' have ',
-            r' contains ',
-            r' includes ',
-            r' consists ',
-            r' comprises ',
-            r' equals ',
-            r' means ',
-            r' involves ',
-            r' occurs ',
-            r' happens ',
-        ]
-        
-        for pattern in fact_patterns:
-            if re.search(pattern, ' ' + text.lower() + ' '):
-                return True
+        if _FACT_RE.search(text_lower):
+            return True
         
         # Check for statements with dates, numbers, or proper nouns
-        # This is a simplified check; would be more sophisticated in practice
-        has_number = bool(re.search(r'\d', text))
-        has_date_pattern = bool(re.search(r'\b(in|on|during|since) (the )?\d{4}\b|\b\d{1,2}/\d{1,2}/\d{2,4}\b', text))
-        has_proper_noun = bool(re.search(r'\b[A-Z][a-z]+\b', text))
+        # This is a simplified check; would be more sophisticated in practice.
+        # Every date pattern contains a digit, so the digit check covers dates.
+        if _DIGIT_RE.search(text):
+            return True
         
-        return has_number or has_date_pattern or has_proper_noun
+        # Only look for proper nouns if the text has any uppercase letters
+        return text != text_lower and bool(_CAPITALIZED_WORD_RE.search(text))
     
-    def _determine_claim_type(self, span) -> ClaimType:
+    def _determine_claim_type(
+        self,
+        span,
+        features: Optional[int] = None,
+        text_lower: Optional[str] = None
+    ) -> ClaimType:
         """
         Determine the type of a claim based on linguistic features.
         
-        Uses spaCy analysis to categorize claims by content type.
+        Uses spaCy analysis to categorize claims by content type. Callers
+        that already have the lowercased span text can pass it as
+        ``text_lower``.
         """
-        text = span.text.lower()
+        if features is None:
+            features = self._span_features(span)
         
-        # Check for numerical claims
-        has_number = any(token.like_num for token in span)
-        has_money = any(token.ent_type_ == "MONEY" for token in span)
-        has_quantity = any(token.ent_type_ in ["QUANTITY", "PERCENT", "CARDINAL"] for token in span)
+        text = text_lower if text_lower is not None else span.text.lower()
         
-        if has_money or has_quantity or has_number:
+        # Check for numerical claims
+        if features & (_S_NUM | _S_MONEY | _S_QUANTITY):
             return ClaimType.NUMERICAL
         
         # Check for temporal claims
-        has_date = any(token.ent_type_ in ["DATE", "TIME"] for token in span)
-        date_patterns = [r'\b(in|on|during|since) (the )?\d{4}\b', r'\b\d{1,2}/\d{1,2}/\d{2,4}\b']
-        
-        if has_date or any(re.search(pattern, text) for pattern in date_patterns):
+        if features & _S_DATE or _SIMPLE_DATE_RE.search(text):
             return ClaimType.TEMPORAL
         
         # Check for entity-focused claims
-        named_entities = [ent for ent in span.ents if ent.label_ in ["PERSON", "ORG", "GPE", "LOC", "PRODUCT"]]
-        if named_entities:
+        if features & _S_NAMED_ENT:
             return ClaimType.ENTITY
         
+        # Find causal, comparative and citation markers in a single scan
+        markers = _marker_categories(text)
+        
         # Check for causal claims
-        causal_markers = ["because", "due to", "as a result", "therefore", "thus", "consequently", "leads to", "causes"]
-        if any(marker in text for marker in causal_markers):
+        if "causal" in markers:
             return ClaimType.CAUSAL
         
         # Check for comparative claims
-        comparative_markers = ["more", "less", "greater", "fewer", "better", "worse", "higher", "lower", "compared to"]
-        if any(marker in text for marker in comparative_markers):
+        if "comparative" in markers:
             return ClaimType.COMPARATIVE
         
         # Check for definitional claims
         if " is " in text or " are " in text:
-            def_pattern = r'\b[A-Za-z]+ (is|are) (a|an|the) [A-Za-z]+\b'
-            if re.search(def_pattern, text):
+            if _DEFINITION_RE.search(text):
                 return ClaimType.DEFINITIONAL
         
         # Check for citation claims
-        citation_markers = ["according to", "cited by", "as stated in", "as reported by", "as shown by"]
-        if any(marker in text for marker in citation_markers):
+        if "citation" in markers:
             return ClaimType.CITATION
         
         # Default to other
         return ClaimType.OTHER
     
-    def _determine_claim_type_text(self, text: str) -> ClaimType:
+    def _determine_claim_type_text(
+        self,
+        text: str,
+        text_lower: Optional[str] = None,
+        features: Optional[int] = None
+    ) -> ClaimType:
         """
         Determine the type of a claim based on text patterns.
         
-        Uses regex and text analysis when spaCy is not available.
+        Uses regex and text analysis when spaCy is not available. Callers
+        that already have the lowercased text can pass it as ``text_lower``.
+        If ``features`` (a bitmask from ``_scan_rule_features``) is given, the
+        type is looked up from it instead of running the individual patterns.
         """
-        text_lower = text.lower()
-        
-        # Check for numerical claims
-        if re.search(r'\b\d+(\.\d+)?\b', text) or re.search(r'\b(zero|one|two|three|four|five|six|seven|eight|nine|ten)\b', text_lower):
-            # Check for money specifically
-            if re.search(r'\$\d+|\d+ dollars|\d+ euros|\d+ yen', text_lower):
-                return ClaimType.NUMERICAL
-            # Check for percentages
-            if re.search(r'\d+(\.\d+)?( )?%|\d+( )?(percent|percentage)', text_lower):
-                return ClaimType.NUMERICAL
-            # Check for quantities
-            if re.search(r'\d+( )?(kg|mb|gb|tb|mm|cm|m|km|inch|inches|feet|foot|yards|miles)', text_lower):
+        if features is not None:
+            for required, claim_type in _RULE_TYPE_PRECEDENCE:
+                if features & required == required:
+                    return claim_type
+            return ClaimType.OTHER
+        
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # Check for numerical claims (money, percentages, or quantities)
+        if _NUMBER_RE.search(text) or _NUMBER_WORD_RE.search(text_lower):
+            if _NUMERIC_UNIT_RE.search(text_lower):
                 return ClaimType.NUMERICAL
         
         # Check for temporal claims
-        date_patterns = [
-            r'\b(in|on|during|since) (the )?\d{4}\b',
-            r'\b\d{1,2}/\d{1,2}/\d{2,4}\b',
-            r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b',
-            r'\b\d{1,2}(st|nd|rd|th)?\b',
-            r'\b(yesterday|today|tomorrow)\b',
-            r'\b(year|month|week|day|hour|minute|century|decade)\b'
-        ]
-        
-        if any(re.search(pattern, text, re.IGNORECASE) for pattern in date_patterns):
+        if _TEMPORAL_RE.search(text):
             return ClaimType.TEMPORAL
         
         # Check for entity-focused claims
         # This is a simplified approach; would be more sophisticated in practice
-        if re.search(r'\b[A-Z][a-z]+ (is|was|has|have|will)\b', text):
+        if _ENTITY_STATEMENT_RE.search(text):
             return ClaimType.ENTITY
         
+        # Find causal, comparative and citation markers in a single scan
+        markers = _marker_categories(text_lower)
+        
         # Check for causal claims
-        causal_markers = ["because", "due to", "as a result", "therefore", "thus", "consequently", "leads to", "causes"]
-        if any(marker in text_lower for marker in causal_markers):
+        if "causal" in markers:
             return ClaimType.CAUSAL
         
         # Check for comparative claims
-        comparative_markers = ["more", "less", "greater", "fewer", "better", "worse", "higher", "lower", "compared to"]
-        if any(marker in text_lower for marker in comparative_markers):
+        if "comparative" in markers:
             return ClaimType.COMPARATIVE
         
         # Check for definitional claims
-        def_pattern = r'\b[A-Za-z]+ (is|are) (a|an|the) [A-Za-z]+\b'
-        if re.search(def_pattern, text):
+        if _DEFINITION_RE.search(text):
             return ClaimType.DEFINITIONAL
         
         # Check for citation claims
-        citation_markers = ["according to", "cited by", "as stated in", "as reported by", "as shown by"]
-        if any(marker in text_lower for marker in citation_markers):
+        if "citation" in markers:
             return ClaimType.CITATION
         
         # Default to other
@@ -416,8 +1136,7 @@ class ClaimExtractor:
         entities = []
         
         # Match potential proper nouns (simplified approach)
-        proper_noun_pattern = r'\b[A-Z][a-zA-Z]+ (?:[A-Z][a-zA-Z]+\s?)*'
-        for match in re.finditer(proper_noun_pattern, text):
+        for match in _PROPER_NOUN_RE.finditer(text):
             entity = {
                 "text": match.group(0).strip(),
                 "label": "ENTITY",  # Generic label since we can't classify without NLP
@@ -427,24 +1146,17 @@ class ClaimExtractor:
             entities.append(entity)
         
         # Match dates (simplified approach)
-        date_patterns = [
-            r'\b\d{1,2}/\d{1,2}/\d{2,4}\b',
-            r'\b(January|February|March|April|May|June|July|August|September|October|November|December) \d{1,2}(st|nd|rd|th)?, \d{4}\b'
-        ]
-        
-        for pattern in date_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entity = {
-                    "text": match.group(0),
-                    "label": "DATE",
-                    "start": match.start(),
-                    "end": match.end()
-                }
-                entities.append(entity)
+        for match in _DATE_ENTITY_RE.finditer(text):
+            entity = {
+                "text": match.group(0),
+                "label": "DATE",
+                "start": match.start(),
+                "end": match.end()
+            }
+            entities.append(entity)
         
         # Match monetary values
-        money_pattern = r'\$\d+(?:,\d{3})*(?:\.\d{2})?|\d+(?:,\d{3})*(?:\.\d{2})? (dollars|euros|pounds)'
-        for match in re.finditer(money_pattern, text):
+        for match in _MONEY_ENTITY_RE.finditer(text):
             entity = {
                 "text": match.group(0),
                 "label": "MONEY",
@@ -456,6 +1168,21 @@ class ClaimExtractor:
         return entities
 
 
+# Claim extractor of a worker process used by extract_claims_parallel
+_worker_extractor = None
+
+
+def _init_extraction_worker(config: Dict[str, Any]):
+    """Create the worker process's claim extractor (and spaCy model) once."""
+    global _worker_extractor
+    _worker_extractor = ClaimExtractor(config)
+
+
+def _extract_worker_claims(text: str) -> List[Claim]:
+    """Extract claims from text in a worker process."""
+    return _worker_extractor.extract_claims(text)
+
+
 class ClaimMerger:
     """
     Merges related claims to avoid excessive fragmentation.
@@ -476,6 +1203,7 @@ class ClaimMerger:
         # Default configuration values
         self.max_distance = self.config.get("max_distance", 20)  # Max distance between claims to merge
         self.merge_same_type = self.config.get("merge_same_type", True)  # Only merge claims of same type
+        self._new_claim_id = _uuid_claim_id if self.config.get("uuid_ids", False) else _next_claim_id
         
         logger.debug("ClaimMerger initialized with config: %s", self.config)
     
@@ -493,45 +1221,52 @@ class ClaimMerger:
             return claims
         
         # Sort claims by position
-        sorted_claims = sorted(claims, key=lambda c: c.start_idx)
-        
-        # Track which claims should be merged
-        merge_groups = []
-        current_group = [0]  # Start with first claim
-        
-        for i in range(1, len(sorted_claims)):
-            prev_claim = sorted_claims[current_group[-1]]
-            current_claim = sorted_claims[i]
-            
-            # Check if claims should be merged
-            if (current_claim.start_idx - prev_claim.end_idx <= self.max_distance and
-                (not self.merge_same_type or current_claim.type == prev_claim.type)):
-                # Add to current group
-                current_group.append(i)
-            else:
-                # Finish current group and start a new one
-                merge_groups.append(current_group)
-                current_group = [i]
-        
-        # Add the last group
-        if current_group:
-            merge_groups.append(current_group)
+        sorted_claims = sorted(claims, key=operator.attrgetter("start_idx"))
         
         # Create merged claims
         merged_claims = []
         
-        for group in merge_groups:
-            if len(group) == 1:
+        for group_start, group_end in self._find_merge_groups(sorted_claims):
+            if group_end - group_start == 1:
                 # No need to merge, just add the claim
-                merged_claims.append(sorted_claims[group[0]])
+                merged_claims.append(sorted_claims[group_start])
             else:
                 # Merge claims in this group
-                merged_claim = self._merge_claim_group([sorted_claims[i] for i in group])
+                merged_claim = self._merge_claim_group(sorted_claims[group_start:group_end])
                 merged_claims.append(merged_claim)
         
         logger.debug("Merged %d claims into %d claims", len(claims), len(merged_claims))
         return merged_claims
     
+    def _find_merge_groups(self, sorted_claims: List[Claim]) -> List[Tuple[int, int]]:
+        """
+        Find the runs of consecutive claims that should be merged.
+        
+        A claim joins the group of the claim before it if it starts within
+        ``max_distance`` of that claim's end (and has the same type when
+        ``merge_same_type`` is set). The test only involves neighbouring
+        claims, so it is evaluated for all pairs at once on position and
+        type arrays.
+        
+        Args:
+            sorted_claims: Claims sorted by start position
+            
+        Returns:
+            List of ``(start, end)`` index ranges into ``sorted_claims``
+        """
+        n = len(sorted_claims)
+        starts = np.fromiter((claim.start_idx for claim in sorted_claims), dtype=np.int64, count=n)
+        ends = np.fromiter((claim.end_idx for claim in sorted_claims), dtype=np.int64, count=n)
+        
+        # A new group starts wherever a claim cannot join its predecessor
+        breaks = starts[1:] - ends[:-1] > self.max_distance
+        if self.merge_same_type:
+            types = np.fromiter((claim.type_idx for claim in sorted_claims), dtype=np.int32, count=n)
+            breaks |= types[1:] != types[:-1]
+        
+        boundaries = [0] + (np.flatnonzero(breaks) + 1).tolist() + [n]
+        return list(zip(boundaries[:-1], boundaries[1:]))
+    
     def _merge_claim_group(self, claims: List[Claim]) -> Claim:
         """
         Merge a group of related claims into a single claim.
@@ -542,50 +1277,51 @@ class ClaimMerger:
         Returns:
             Merged claim
         """
-        # Get the full text span that encompasses all claims
-        start_idx = min(claim.start_idx for claim in claims)
-        end_idx = max(claim.end_idx for claim in claims)
+        # In one pass, find the claims that open and close the merged span
+        # and the highest-priority claim type
+        first_claim = last_claim = claims[0]
+        claim_type = first_claim.type
+        best_priority = _MERGE_TYPE_PRIORITY[first_claim.type_idx]
         
-        # Get the full text
-        first_claim = min(claims, key=lambda c: c.start_idx)
-        last_claim = max(claims, key=lambda c: c.end_idx)
-        full_text = first_claim.text[:last_claim.start_idx - first_claim.start_idx] + last_claim.text
+        for claim in claims:
+            if claim.start_idx < first_claim.start_idx:
+                first_claim = claim
+            if claim.end_idx > last_claim.end_idx:
+                last_claim = claim
+            priority = _MERGE_TYPE_PRIORITY[claim.type_idx]
+            if priority > best_priority:
+                best_priority = priority
+                claim_type = claim.type
         
-        # Determine the most appropriate claim type
-        # Priority: numerical > temporal > entity > others
-        type_priority = {
-            ClaimType.NUMERICAL.value: 5,
-            ClaimType.TEMPORAL.value: 4,
-            ClaimType.ENTITY.value: 3,
-            ClaimType.CAUSAL.value: 2,
-            ClaimType.COMPARATIVE.value: 2,
-            ClaimType.DEFINITIONAL.value: 2,
-            ClaimType.CITATION.value: 1,
-            ClaimType.OTHER.value: 0
-        }
-        
-        claim_type = max(claims, key=lambda c: type_priority.get(c.type.value, 0)).type
+        # Get the full text span that encompasses all claims
+        start_idx = first_claim.start_idx
+        end_idx = last_claim.end_idx
+        full_text = first_claim.text[:last_claim.start_idx - first_claim.start_idx] + last_claim.text
         
         # Combine entities
         combined_entities = []
         seen_entity_texts = set()
         
         for claim in claims:
+            offset = claim.start_idx - start_idx
+            
             for entity in claim.entities:
-                # Adjust entity position relative to the merged claim
-                adjusted_entity = entity.copy()
-                adjusted_entity["start"] = entity["start"] + (claim.start_idx - start_idx)
-                adjusted_entity["end"] = entity["end"] + (claim.start_idx - start_idx)
+                # Only add if not already seen (checked before copying anything)
+                entity_key = (entity["text"], entity["label"])
+                if entity_key in seen_entity_texts:
+                    continue
+                seen_entity_texts.add(entity_key)
                 
-                # Only add if not already seen
-                entity_key = (adjusted_entity["text"], adjusted_entity["label"])
-                if entity_key not in seen_entity_texts:
-                    combined_entities.append(adjusted_entity)
-                    seen_entity_texts.add(entity_key)
+                # Adjust entity position relative to the merged claim
+                combined_entities.append({
+                    **entity,
+                    "start": entity["start"] + offset,
+                    "end": entity["end"] + offset
+                })
         
         # Create the merged claim
         merged_claim = Claim(
-            id=str(uuid.uuid4()),
+            id=self._new_claim_id(),
             text=full_text,
             type=claim_type,
             start_idx=start_idx,
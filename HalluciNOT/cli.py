@@ -264,7 +264,7 @@ def main():
     print("\nVerification Summary:")
     print(f"Overall confidence score: {result.confidence_score:.2f}")
     print(f"Hallucination score: {result.hallucination_score:.2f}")
-    print(f"Claims verified: {sum(1 for c in result.claims if c.has_source)}/{len(result.claims)}")
+    print(f"Claims verified: {result.n_claims_with_source}/{len(result.claims)}")
     print(f"Interventions recommended: {len(result.interventions)}")
     
     # Save or print output
@@ -8,14 +8,101 @@ verification results and intervention strategies.
 """
 
 from typing import List, Dict, Any, Optional, Tuple, Set
-import re
+from dataclasses import dataclass
+import operator
 import logging
 
-from ..utils.common import VerificationResult, Claim, InterventionType
+from ..utils.common import VerificationResult, Claim, Intervention, InterventionType
+
+# Optional Aho-Corasick automaton for locating many claims in one sweep
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    _HAS_AHOCORASICK = False
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# A text edit as (start, end, replacement), in original-response positions
+Edit = Tuple[int, int, str]
+
+# Verbs an uncertainty qualifier is inserted in front of ("X is Y" claims)
+_BE_VERBS = ("is ", "are ", "was ", "were ")
+
+# Conservative uncertainty qualifiers
+_CONSERVATIVE_QUALIFIERS = (
+    "may", "might", "could", "reportedly", "according to sources",
+    "seems to", "appears to"
+)
+
+# Stronger uncertainty qualifiers
+_STRONG_QUALIFIERS = (
+    "uncertain if", "limited evidence suggests", "not clearly supported",
+    "sources partially indicate", "questionable whether",
+    "unverified claim that", "limited support for the claim that"
+)
+
+
+@dataclass(frozen=True)
+class StrategyParams:
+    """
+    Thresholds and behaviours that distinguish the correction strategies.
+    
+    Attributes:
+        name: Strategy name, used for logging
+        uncertainty_conservative: Whether uncertainty qualifiers are the weaker kind
+        correction_confidence_threshold: Minimum intervention confidence for
+            applying a correction (None applies every correction)
+        removal_confidence_threshold: Claims below this confidence score are
+            removed (None never removes claims)
+        source_alignment_for_uncertainty: Replace uncertain claims with their
+            best source excerpt when it aligns above this score (None always
+            adds a qualifier)
+        correct_from_source: Fall back to the best source excerpt for
+            corrections that have no corrected text
+    """
+    name: str
+    uncertainty_conservative: bool
+    correction_confidence_threshold: Optional[float]
+    removal_confidence_threshold: Optional[float]
+    source_alignment_for_uncertainty: Optional[float] = None
+    correct_from_source: bool = False
+
+
+# Conservative: minimal changes, mostly uncertainty qualifiers and clarifications
+_CONSERVATIVE = StrategyParams(
+    name="conservative",
+    uncertainty_conservative=True,
+    correction_confidence_threshold=0.8,
+    removal_confidence_threshold=None
+)
+
+# Balanced: corrections, uncertainty qualifiers, and limited removals
+_BALANCED = StrategyParams(
+    name="balanced",
+    uncertainty_conservative=False,
+    correction_confidence_threshold=0.6,
+    removal_confidence_threshold=0.2
+)
+
+# Aggressive: corrections (preferred over uncertainty), removals, and restructuring
+_AGGRESSIVE = StrategyParams(
+    name="aggressive",
+    uncertainty_conservative=False,
+    correction_confidence_threshold=None,
+    removal_confidence_threshold=0.3,
+    source_alignment_for_uncertainty=0.4,
+    correct_from_source=True
+)
+
+_STRATEGIES = {
+    "conservative": _CONSERVATIVE,
+    "balanced": _BALANCED,
+    "aggressive": _AGGRESSIVE
+}
+
 
 def generate_corrected_response(
     verification_result: VerificationResult,
@@ -38,234 +125,245 @@ def generate_corrected_response(
         logger.debug("No interventions required, returning original response")
         return verification_result.original_response
     
-    # Select correction strategy
-    if strategy == "conservative":
-        return _conservative_correction(verification_result)
-    elif strategy == "aggressive":
-        return _aggressive_correction(verification_result)
-    else:  # balanced is the default
-        return _balanced_correction(verification_result)
+    # Select correction strategy (balanced is the default)
+    return _apply_strategy(verification_result, _STRATEGIES.get(strategy, _BALANCED))
 
 
-def _conservative_correction(verification_result: VerificationResult) -> str:
+def _apply_strategy(verification_result: VerificationResult, params: StrategyParams) -> str:
     """
-    Apply a conservative correction strategy.
+    Apply a correction strategy.
     
-    This strategy only makes minimal changes to the original response,
-    primarily adding uncertainty qualifiers and clarifications.
+    Args:
+        verification_result: Verification result with interventions
+        params: Parameters of the strategy to apply
+        
+    Returns:
+        Corrected response text
     """
-    logger.debug("Applying conservative correction strategy")
+    logger.debug("Applying %s correction strategy", params.name)
     
-    corrected_text = verification_result.original_response
+    original_text = verification_result.original_response
+    interventions = _interventions_by_claim(verification_result)
+    positions = _locate_claims(original_text, verification_result)
+    edits = []
     
-    # Get all claims sorted by position (to process from end to beginning)
-    all_claims = sorted(
-        verification_result.claims, 
-        key=lambda c: c.start_idx,
-        reverse=True  # Process from end to beginning to avoid index shifts
-    )
+    correction_threshold = params.correction_confidence_threshold
+    removal_threshold = params.removal_confidence_threshold
+    source_threshold = params.source_alignment_for_uncertainty
     
-    # Process each claim and its corresponding intervention
-    for claim in all_claims:
+    # Resolve each claim's intervention into an edit of the original text
+    for claim in verification_result.claims:
         # Find the intervention for this claim
-        intervention = next(
-            (i for i in verification_result.interventions if i.claim_id == claim.id), 
-            None
-        )
+        intervention = interventions.get(claim.id)
         
-        if not intervention:
+        span = positions.get(claim.id)
+        if not intervention or span is None:
             continue
         
         # Apply the intervention based on its type
-        if intervention.intervention_type == InterventionType.UNCERTAINTY:
-            # Add uncertainty qualifier
-            corrected_text = _add_uncertainty_qualifier(
-                corrected_text, claim, conservative=True
-            )
+        intervention_type = intervention.intervention_type
+        if intervention_type == InterventionType.UNCERTAINTY:
+            # Some strategies prefer correction over uncertainty
+            if (source_threshold is not None and claim.has_source and
+                    claim.best_source.alignment_score > source_threshold):
+                edits.append(_apply_correction(
+                    original_text, claim, span, claim.best_source.text_excerpt
+                ))
+            else:
+                # Add uncertainty qualifier
+                edits.append(_add_uncertainty_qualifier(
+                    original_text, claim, span, params.uncertainty_conservative
+                ))
+        
+        elif intervention_type == InterventionType.CORRECTION:
+            if correction_threshold is None or intervention.confidence > correction_threshold:
+                if intervention.corrected_text:
+                    edits.append(_apply_correction(
+                        original_text, claim, span, intervention.corrected_text
+                    ))
+                elif params.correct_from_source and claim.has_source:
+                    edits.append(_apply_correction(
+                        original_text, claim, span, claim.best_source.text_excerpt
+                    ))
         
-        elif intervention.intervention_type == InterventionType.CORRECTION:
-            # Only apply corrections with high intervention confidence
-            if intervention.confidence > 0.8 and intervention.corrected_text:
-                corrected_text = _apply_correction(
-                    corrected_text, claim, intervention.corrected_text
-                )
+        elif intervention_type == InterventionType.REMOVAL:
+            # Only remove claims with low enough confidence
+            if removal_threshold is not None and claim.confidence_score < removal_threshold:
+                edits.append(_remove_claim(original_text, claim, span))
     
-    return corrected_text
+    return _apply_edits(original_text, edits)
 
 
-def _balanced_correction(verification_result: VerificationResult) -> str:
+def _interventions_by_claim(verification_result: VerificationResult) -> Dict[str, Intervention]:
     """
-    Apply a balanced correction strategy.
+    Index the interventions of a verification result by claim id.
     
-    This strategy makes moderate changes, including corrections,
-    uncertainty qualifiers, and limited removals.
+    If a claim has several interventions, the first one is used.
     """
-    logger.debug("Applying balanced correction strategy")
-    
-    corrected_text = verification_result.original_response
+    interventions = {}
+    for intervention in verification_result.interventions:
+        interventions.setdefault(intervention.claim_id, intervention)
+    return interventions
+
+
+def _apply_edits(text: str, edits: List[Edit]) -> str:
+    """
+    Apply edits to the original text in a single pass.
     
-    # Get all claims sorted by position (to process from end to beginning)
-    all_claims = sorted(
-        verification_result.claims, 
-        key=lambda c: c.start_idx,
-        reverse=True  # Process from end to beginning to avoid index shifts
-    )
+    Edits are applied in position order by joining the untouched slices of
+    the original text with the replacements, so every edit's positions
+    refer to the original text. An edit overlapping an earlier one is
+    skipped.
     
-    # Process each claim and its corresponding intervention
-    for claim in all_claims:
-        # Find the intervention for this claim
-        intervention = next(
-            (i for i in verification_result.interventions if i.claim_id == claim.id), 
-            None
-        )
+    Args:
+        text: The original text
+        edits: Edits as (start, end, replacement)
         
-        if not intervention:
+    Returns:
+        Text with all edits applied
+    """
+    parts = []
+    cursor = 0
+    
+    for start, end, replacement in sorted(edits, key=operator.itemgetter(0)):
+        if start < cursor:
+            logger.debug("Skipping edit at %d overlapping a previous edit", start)
             continue
         
-        # Apply the intervention based on its type
-        if intervention.intervention_type == InterventionType.UNCERTAINTY:
-            # Add uncertainty qualifier
-            corrected_text = _add_uncertainty_qualifier(
-                corrected_text, claim, conservative=False
-            )
-        
-        elif intervention.intervention_type == InterventionType.CORRECTION:
-            # Apply corrections with reasonable confidence
-            if intervention.confidence > 0.6 and intervention.corrected_text:
-                corrected_text = _apply_correction(
-                    corrected_text, claim, intervention.corrected_text
-                )
-        
-        elif intervention.intervention_type == InterventionType.REMOVAL:
-            # Only remove claims with very low confidence
-            if claim.confidence_score < 0.2:
-                corrected_text = _remove_claim(corrected_text, claim)
+        parts.append(text[cursor:start])
+        parts.append(replacement)
+        cursor = end
     
-    return corrected_text
+    parts.append(text[cursor:])
+    return "".join(parts)
 
 
-def _aggressive_correction(verification_result: VerificationResult) -> str:
+def _locate_claims(
+    text: str,
+    verification_result: VerificationResult
+) -> Dict[str, Tuple[int, int]]:
     """
-    Apply an aggressive correction strategy.
+    Find the positions of the claims that have interventions.
+    
+    Claims found exactly at their recorded position keep it. The others
+    are searched for in the text all at once (see ``_find_first_occurrences``).
     
-    This strategy makes extensive changes, including corrections,
-    removals, and restructuring where necessary.
+    Args:
+        text: The text containing the claims
+        verification_result: Verification result with claims and interventions
+        
+    Returns:
+        Mapping of claim id to (start, end); claims that can't be found are
+        left out
     """
-    logger.debug("Applying aggressive correction strategy")
+    claim_ids = {intervention.claim_id for intervention in verification_result.interventions}
+    positions = {}
+    missing = {}
+    
+    for claim in verification_result.claims:
+        if claim.id not in claim_ids:
+            continue
+        
+        # Ensure the claim text is exactly at its expected position
+        if (claim.end_idx - claim.start_idx == len(claim.text) and
+                text.startswith(claim.text, claim.start_idx)):
+            positions[claim.id] = (claim.start_idx, claim.end_idx)
+        else:
+            missing.setdefault(claim.text, []).append(claim.id)
+    
+    # Claim text doesn't match expected position, try to find it
+    if missing:
+        for claim_text, match_pos in _find_first_occurrences(text, list(missing)).items():
+            for claim_id in missing[claim_text]:
+                positions[claim_id] = (match_pos, match_pos + len(claim_text))
     
-    corrected_text = verification_result.original_response
+    return positions
+
+
+def _find_first_occurrences(text: str, patterns: List[str]) -> Dict[str, int]:
+    """
+    Find the first occurrence of each pattern in the text.
     
-    # Get all claims sorted by position (to process from end to beginning)
-    all_claims = sorted(
-        verification_result.claims, 
-        key=lambda c: c.start_idx,
-        reverse=True  # Process from end to beginning to avoid index shifts
-    )
+    With pyahocorasick available, several patterns are found in a single
+    sweep over the text; otherwise each one is searched with ``str.find``.
     
-    # Process each claim and its corresponding intervention
-    for claim in all_claims:
-        # Find the intervention for this claim
-        intervention = next(
-            (i for i in verification_result.interventions if i.claim_id == claim.id), 
-            None
-        )
-        
-        if not intervention:
-            continue
+    Args:
+        text: The text to search
+        patterns: Strings to search for
         
-        # Apply the intervention based on its type
-        if intervention.intervention_type == InterventionType.UNCERTAINTY:
-            # For aggressive strategy, prefer correction over uncertainty
-            if claim.has_source and claim.best_source.alignment_score > 0.4:
-                corrected_text = _apply_correction(
-                    corrected_text, claim, claim.best_source.text_excerpt
-                )
-            else:
-                # Add uncertainty qualifier
-                corrected_text = _add_uncertainty_qualifier(
-                    corrected_text, claim, conservative=False
-                )
+    Returns:
+        Mapping of pattern to its first position; patterns that don't occur
+        are left out
+    """
+    found = {}
+    
+    if _HAS_AHOCORASICK and len(patterns) > 1:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            if pattern:
+                automaton.add_word(pattern, pattern)
         
-        elif intervention.intervention_type == InterventionType.CORRECTION:
-            # Apply corrections more liberally
-            if intervention.corrected_text:
-                corrected_text = _apply_correction(
-                    corrected_text, claim, intervention.corrected_text
-                )
-            elif claim.has_source:
-                corrected_text = _apply_correction(
-                    corrected_text, claim, claim.best_source.text_excerpt
-                )
+        if len(automaton):
+            automaton.make_automaton()
+            for end_pos, pattern in automaton.iter(text):
+                if pattern not in found:
+                    found[pattern] = end_pos - len(pattern) + 1
+                    if len(found) == len(automaton):
+                        break
         
-        elif intervention.intervention_type == InterventionType.REMOVAL:
-            # Remove claims with low confidence
-            if claim.confidence_score < 0.3:
-                corrected_text = _remove_claim(corrected_text, claim)
+        # The automaton can't hold an empty pattern
+        if "" in patterns:
+            found[""] = 0
+        return found
+    
+    for pattern in patterns:
+        match_pos = text.find(pattern)
+        if match_pos != -1:
+            found[pattern] = match_pos
     
-    return corrected_text
+    return found
 
 
 def _add_uncertainty_qualifier(
     text: str, 
     claim: Claim,
+    span: Tuple[int, int],
     conservative: bool = True
-) -> str:
+) -> Edit:
     """
-    Add an uncertainty qualifier to a claim in the text.
+    Build the edit adding an uncertainty qualifier to a claim in the text.
     
     Args:
-        text: The text to modify
+        text: The original text
         claim: The claim to add uncertainty qualifier to
+        span: Position of the claim in the text
         conservative: Whether to use conservative (weaker) qualifiers
         
     Returns:
-        Modified text with uncertainty qualifier
+        Edit replacing the claim with its qualified version
     """
-    # Ensure the claim text exists in the current text
-    if claim.text not in text[claim.start_idx:claim.end_idx + 10]:
-        # Claim text doesn't match expected position, try to find it
-        match_pos = text.find(claim.text)
-        if match_pos == -1:
-            # Can't find the claim text, don't modify
-            return text
-        
-        # Update indices based on found position
-        claim.start_idx = match_pos
-        claim.end_idx = match_pos + len(claim.text)
+    start, end = span
     
     # Select appropriate uncertainty qualifier based on conservativeness
-    if conservative:
-        # Conservative qualifiers
-        qualifiers = [
-            "may", "might", "could", "reportedly", "according to sources",
-            "seems to", "appears to"
-        ]
-    else:
-        # Stronger qualifiers
-        qualifiers = [
-            "uncertain if", "limited evidence suggests", "not clearly supported",
-            "sources partially indicate", "questionable whether", 
-            "unverified claim that", "limited support for the claim that"
-        ]
+    qualifiers = _CONSERVATIVE_QUALIFIERS if conservative else _STRONG_QUALIFIERS
     
-    # Different claim types might use different qualifiers
-    qualifier = qualifiers[hash(claim.text) % len(qualifiers)]
+    # Different claims get different qualifiers; a cheap fingerprint is enough
+    # here (and unlike hash() it is stable across interpreter runs)
+    claim_key = claim.text
+    fingerprint = len(claim_key) ^ (ord(claim_key[0]) if claim_key else 0)
+    qualifier = qualifiers[fingerprint % len(qualifiers)]
     
     # Extract the part of the claim to qualify
-    claim_text = text[claim.start_idx:claim.end_idx]
+    claim_text = text[start:end]
     
     # Check if the claim starts with a capital letter
     starts_with_capital = claim_text[0].isupper() if claim_text else False
     
-    # Different insertion strategies based on claim structure
-    if re.match(r'^[A-Z][a-z]+ (is|are|was|were) ', claim_text):
-        # For "X is Y" type claims
-        pattern = r'^([A-Z][a-z]+ )(is|are|was|were) '
-        qualified_text = re.sub(pattern, r'\1' + qualifier + r' \2 ', claim_text)
-    elif re.match(r'^The [a-z]+ (is|are|was|were) ', claim_text):
-        # For "The X is Y" type claims
-        pattern = r'^(The [a-z]+ )(is|are|was|were) '
-        qualified_text = re.sub(pattern, r'\1' + qualifier + r' \2 ', claim_text)
+    # Different insertion strategies based on claim structure:
+    # for "X is Y" and "The X is Y" type claims, qualify the verb
+    subject_end = _be_statement_subject_end(claim_text)
+    if subject_end:
+        qualified_text = f"{claim_text[:subject_end]}{qualifier} {claim_text[subject_end:]}"
     else:
         # Default approach: insert at beginning
         if starts_with_capital:
@@ -276,88 +374,109 @@ def _add_uncertainty_qualifier(
             qualified_text = f"{qualifier} {claim_text}"
     
     # Replace the original claim with the qualified version
-    return text[:claim.start_idx] + qualified_text + text[claim.end_idx:]
+    return start, end, qualified_text
+
+
+def _be_statement_subject_end(claim_text: str) -> int:
+    """
+    Find where the verb starts in an "X is Y" or "The x is Y" claim.
+    
+    Matches a capitalized word ("Paris is ...") or "The" followed by a
+    lowercase word ("The company was ...") as the subject, followed by
+    is/are/was/were, using plain string checks.
+    
+    Returns:
+        Position of the verb, or 0 if the claim doesn't have this structure
+    """
+    first_space = claim_text.find(" ")
+    if first_space < 2:
+        return 0
+    
+    # Subject: a capitalized ASCII word
+    if not ("A" <= claim_text[0] <= "Z" and _is_lowercase_word(claim_text[1:first_space])):
+        return 0
+    
+    subject_end = first_space + 1
+    if claim_text.startswith(_BE_VERBS, subject_end):
+        return subject_end
+    
+    # Subject: "The" followed by a lowercase ASCII word
+    if claim_text[:first_space] != "The":
+        return 0
+    
+    second_space = claim_text.find(" ", subject_end)
+    if second_space == -1 or not _is_lowercase_word(claim_text[subject_end:second_space]):
+        return 0
+    
+    subject_end = second_space + 1
+    return subject_end if claim_text.startswith(_BE_VERBS, subject_end) else 0
+
+
+def _is_lowercase_word(word: str) -> bool:
+    """Check that a word consists only of lowercase ASCII letters."""
+    return word.isascii() and word.isalpha() and word.islower()
 
 
 def _apply_correction(
     text: str, 
     claim: Claim,
+    span: Tuple[int, int],
     correction: str
-) -> str:
+) -> Edit:
     """
-    Replace a claim with its correction in the text.
+    Build the edit replacing a claim with its correction in the text.
     
     Args:
-        text: The text to modify
+        text: The original text
         claim: The claim to correct
+        span: Position of the claim in the text
         correction: The corrected text to insert
         
     Returns:
-        Modified text with correction applied
+        Edit replacing the claim with the correction
     """
-    # Ensure the claim text exists in the current text
-    if claim.text not in text[claim.start_idx:claim.end_idx + 10]:
-        # Claim text doesn't match expected position, try to find it
-        match_pos = text.find(claim.text)
-        if match_pos == -1:
-            # Can't find the claim text, don't modify
-            return text
-        
-        # Update indices based on found position
-        claim.start_idx = match_pos
-        claim.end_idx = match_pos + len(claim.text)
+    start, end = span
     
     # Check if the claim starts with a capital letter
-    starts_with_capital = text[claim.start_idx].isupper() if claim.start_idx < len(text) else False
+    starts_with_capital = text[start].isupper() if start < len(text) else False
     
-    # Check if the correction needs capitalization adjustment
-    if starts_with_capital and not correction[0].isupper():
-        correction = correction[0].upper() + correction[1:]
-    elif not starts_with_capital and correction[0].isupper():
-        correction = correction[0].lower() + correction[1:]
+    # Only rebuild the correction when its first character's case disagrees
+    first = correction[:1]
+    if starts_with_capital:
+        if first.islower():
+            correction = first.upper() + correction[1:]
+    elif first.isupper():
+        correction = first.lower() + correction[1:]
     
     # Replace the original claim with the correction
-    return text[:claim.start_idx] + correction + text[claim.end_idx:]
+    return start, end, correction
 
 
-def _remove_claim(text: str, claim: Claim) -> str:
+def _remove_claim(text: str, claim: Claim, span: Tuple[int, int]) -> Edit:
     """
-    Remove a claim from the text.
+    Build the edit removing a claim from the text.
     
     Args:
-        text: The text to modify
+        text: The original text
         claim: The claim to remove
+        span: Position of the claim in the text
         
     Returns:
-        Modified text with claim removed
+        Edit deleting the claim
     """
-    # Ensure the claim text exists in the current text
-    if claim.text not in text[claim.start_idx:claim.end_idx + 10]:
-        # Claim text doesn't match expected position, try to find it
-        match_pos = text.find(claim.text)
-        if match_pos == -1:
-            # Can't find the claim text, don't modify
-            return text
-        
-        # Update indices based on found position
-        claim.start_idx = match_pos
-        claim.end_idx = match_pos + len(claim.text)
+    start, end = span
     
     # Check if the claim is a complete sentence
     is_complete_sentence = False
     
     # Look for sentence-ending punctuation
-    if claim.end_idx < len(text) and text[claim.end_idx - 1] in '.!?':
+    if end < len(text) and text[end - 1] in '.!?':
         is_complete_sentence = True
     
     # Determine how to remove the claim
     if is_complete_sentence:
         # Remove the entire sentence including any trailing space
-        end = claim.end_idx
         while end < len(text) and text[end].isspace():
             end += 1
-        
-        return text[:claim.start_idx] + text[end:]
-    else:
-        # Remove just the claim text
-        return text[:claim.start_idx] + text[claim.end_idx:]
\ No newline at end of file
+    
+    return start, end, ""
\ No newline at end of file
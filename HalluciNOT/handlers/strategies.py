@@ -7,14 +7,48 @@ This module is responsible for selecting and implementing appropriate
 intervention strategies when hallucinations are detected in LLM responses.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
+import functools
 import logging
 
-from ..utils.common import Claim, Intervention, InterventionType, VerificationResult
+import numpy as np
+
+from ..utils.common import Claim, Intervention, InterventionType, SourceReference, VerificationResult
+from ._kernels import (
+    _NONE,
+    _UNCERTAINTY,
+    _CORRECTION,
+    _REMOVAL,
+    _SOURCE_REQUEST,
+    _CLARIFICATION,
+    score_interventions_numpy,
+    get_interventions_jit
+)
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# A selected intervention before its Intervention is built: the claim, the
+# intervention type code, the intervention confidence and the best source
+_Selection = Tuple[Claim, int, float, Optional[SourceReference]]
+
+# Intervention types by the integer codes used internally for selection;
+# comparing and hashing ints avoids the Python-level Enum.__hash__
+_INTERVENTION_TYPES = (
+    InterventionType.NONE,
+    InterventionType.UNCERTAINTY,
+    InterventionType.CORRECTION,
+    InterventionType.REMOVAL,
+    InterventionType.SOURCE_REQUEST,
+    InterventionType.CLARIFICATION
+)
+
+# Intervention codes of the confidence buckets below the hallucination
+# threshold, below the uncertain threshold, and above both; the first bucket
+# is refined per claim
+_LOW_BUCKET = 0
+_BUCKET_CODES = np.array([_NONE, _UNCERTAINTY, _NONE])
+
 
 class InterventionSelector:
     """
@@ -38,6 +72,13 @@ class InterventionSelector:
         self.uncertain_threshold = self.config.get("uncertain_threshold", 0.7)
         self.intervention_aggressiveness = self.config.get("intervention_aggressiveness", 0.5)
         
+        # Batches of at least this many claims are classified with vectorized math
+        self.vectorize_min_claims = self.config.get("vectorize_min_claims", 16)
+        
+        # Compile the batch intervention confidence kernel with numba (opt-in:
+        # compiling costs far more than a batch takes to classify)
+        self.use_numba = self.config.get("use_numba", False)
+        
         logger.debug("InterventionSelector initialized with config: %s", self.config)
     
     def select_interventions(self, claims: List[Claim]) -> List[Intervention]:
@@ -52,75 +93,179 @@ class InterventionSelector:
         """
         logger.debug("Selecting interventions for %d claims", len(claims))
         
-        interventions = []
-        
-        for claim in claims:
-            intervention = self._select_claim_intervention(claim)
-            if intervention.intervention_type != InterventionType.NONE:
-                interventions.append(intervention)
+        if len(claims) >= self.vectorize_min_claims:
+            interventions = self.select_interventions_batch(claims)
+        else:
+            # Claims at or above both thresholds need no intervention, so
+            # only the ones below are looked at
+            threshold = max(self.hallucination_threshold, self.uncertain_threshold)
+            interventions = self._build_interventions([
+                self._select_claim_intervention(claim)
+                for claim in claims
+                if claim.confidence_score < threshold
+            ])
         
         logger.info("Selected %d interventions for %d claims", 
                   len(interventions), len(claims))
         
         return interventions
     
-    def _select_claim_intervention(self, claim: Claim) -> Intervention:
+    def select_interventions_batch(self, claims: List[Claim]) -> List[Intervention]:
+        """
+        Select interventions for a list of claims with NumPy.
+        
+        Produces the same interventions as selecting them claim by claim,
+        but decides the intervention types and confidences as array
+        operations over the whole batch. Intervention objects are only
+        built for the claims that need one.
+        
+        Args:
+            claims: List of claims with confidence scores
+            
+        Returns:
+            List of recommended interventions
+        """
+        confidence, num_sources, best_alignment, best_sources = self._vectorize_claims(claims)
+        
+        # Bucket the claims by confidence threshold in one pass (a claim below
+        # the hallucination threshold is low even if above the uncertain one)
+        thresholds = [
+            self.hallucination_threshold,
+            max(self.hallucination_threshold, self.uncertain_threshold)
+        ]
+        buckets = np.digitize(confidence, thresholds)
+        codes = _BUCKET_CODES[buckets]
+        
+        # Low-confidence claims: uncertainty with partial support, otherwise
+        # removal or (with a source to correct from) correction
+        low = np.flatnonzero(buckets == _LOW_BUCKET)
+        if low.size:
+            has_source = num_sources[low] > 0
+            if self.intervention_aggressiveness > 0.7:
+                unsupported_code = _REMOVAL
+            else:
+                unsupported_code = np.where(has_source, _CORRECTION, _REMOVAL)
+            codes[low] = np.where(has_source & (confidence[low] > 0.1), _UNCERTAINTY, unsupported_code)
+        
+        # Confidence in each intervention (see _calculate_intervention_confidence)
+        kernel = (get_interventions_jit() if self.use_numba else None) or score_interventions_numpy
+        intervention_confidence = kernel(codes, confidence, num_sources, best_alignment)
+        
+        selected = np.flatnonzero(codes != _NONE)
+        return self._build_interventions([
+            (claims[i], code, score, best_sources[i])
+            for i, code, score in zip(
+                selected.tolist(),
+                codes[selected].tolist(),
+                intervention_confidence[selected].tolist()
+            )
+        ])
+    
+    def _build_interventions(self, selections: List[_Selection]) -> List[Intervention]:
+        """
+        Build the interventions for the selected claims.
+        
+        Selection only decides types and confidences; the recommendation,
+        corrected text and explanation strings are generated here, in one
+        pass over all the selections.
+        
+        Args:
+            selections: (claim, type code, confidence, best source) tuples
+            
+        Returns:
+            List of interventions, in the order of the selections
+        """
+        return [
+            Intervention(
+                claim_id=claim.id,
+                intervention_type=_INTERVENTION_TYPES[code],
+                confidence=score,
+                recommendation=self._generate_recommendation(claim, code, best_source),
+                corrected_text=self._generate_corrected_text(claim, code, best_source) if code == _CORRECTION else None,
+                explanation=self._generate_explanation(claim, code, best_source) if code != _NONE else None
+            )
+            for claim, code, score, best_source in selections
+        ]
+    
+    def _vectorize_claims(
+        self,
+        claims: List[Claim]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Optional[SourceReference]]]:
+        """
+        Gather the claim attributes intervention selection depends on.
+        
+        Returns:
+            Arrays of confidence scores, source counts, and best source
+            alignment scores (0 for claims without sources), and the best
+            source of each claim
+        """
+        n = len(claims)
+        best_sources = [claim.best_source for claim in claims]
+        confidence = np.fromiter((claim.confidence_score for claim in claims), dtype=np.float64, count=n)
+        num_sources = np.fromiter((len(claim.sources) for claim in claims), dtype=np.int64, count=n)
+        best_alignment = np.fromiter(
+            (source.alignment_score if source is not None else 0.0 for source in best_sources),
+            dtype=np.float64,
+            count=n
+        )
+        return confidence, num_sources, best_alignment, best_sources
+    
+    def _select_claim_intervention(self, claim: Claim) -> _Selection:
         """
         Select an appropriate intervention for a single claim.
         
         The intervention is based on the claim's confidence score,
         claim type, and other factors.
+        
+        Returns:
+            (claim, type code, confidence, best source) tuple for
+            _build_interventions
         """
         confidence = claim.confidence_score
         
         # Determine intervention type based on confidence
         if confidence < self.hallucination_threshold:
             # Low confidence suggests a hallucination
-            intervention_type = self._determine_low_confidence_intervention(claim)
+            code = self._determine_low_confidence_intervention(claim)
         elif confidence < self.uncertain_threshold:
             # Medium confidence suggests uncertainty
-            intervention_type = InterventionType.UNCERTAINTY
+            code = _UNCERTAINTY
         else:
             # High confidence suggests no intervention needed
-            intervention_type = InterventionType.NONE
-        
-        # Generate a recommendation based on the intervention type
-        recommendation = self._generate_recommendation(claim, intervention_type)
-        
-        # Create the intervention
-        intervention = Intervention(
-            claim_id=claim.id,
-            intervention_type=intervention_type,
-            confidence=self._calculate_intervention_confidence(claim, intervention_type),
-            recommendation=recommendation,
-            corrected_text=self._generate_corrected_text(claim, intervention_type) if intervention_type == InterventionType.CORRECTION else None,
-            explanation=self._generate_explanation(claim, intervention_type) if intervention_type != InterventionType.NONE else None
-        )
+            code = _NONE
         
-        return intervention
+        # Find the best source once for the intervention's helpers
+        best_source = claim.best_source
+        
+        confidence = self._calculate_intervention_confidence(claim, code, best_source)
+        return claim, code, confidence, best_source
     
-    def _determine_low_confidence_intervention(self, claim: Claim) -> InterventionType:
+    def _determine_low_confidence_intervention(self, claim: Claim) -> int:
         """
         Determine the best intervention for a low-confidence claim.
         
         Different types of claims may benefit from different interventions.
+        
+        Returns:
+            Integer code of the intervention type
         """
         # If we have partial support, use uncertainty
         if claim.sources and claim.confidence_score > 0.1:
-            return InterventionType.UNCERTAINTY
+            return _UNCERTAINTY
         
         # If we have no sources at all, consider whether to remove or correct
         if self.intervention_aggressiveness > 0.7:
             # Aggressive approach: remove unsupported claims
-            return InterventionType.REMOVAL
+            return _REMOVAL
         else:
             # Conservative approach: try to correct if possible
-            return InterventionType.CORRECTION if claim.has_source else InterventionType.REMOVAL
+            return _CORRECTION if claim.has_source else _REMOVAL
     
     def _generate_recommendation(
         self, 
         claim: Claim, 
-        intervention_type: InterventionType
+        code: int,
+        best_source: Optional[SourceReference]
     ) -> str:
         """
         Generate a recommendation for handling the claim.
@@ -128,33 +273,17 @@ class InterventionSelector:
         The recommendation is a human-readable guidance for how
         to address the potential hallucination.
         """
-        if intervention_type == InterventionType.NONE:
-            return "No intervention needed - claim is well-supported"
-        
-        if intervention_type == InterventionType.CORRECTION:
-            if claim.has_source:
-                return f"Replace with corrected information from source: {claim.best_source.chunk_id}"
-            else:
-                return "Replace with corrected information or remove (no source available)"
+        chunk_id = None
+        if code == _CORRECTION and best_source is not None:
+            chunk_id = best_source.chunk_id
         
-        if intervention_type == InterventionType.UNCERTAINTY:
-            return "Add uncertainty qualification to indicate limited source support"
-        
-        if intervention_type == InterventionType.REMOVAL:
-            return "Remove this claim as it lacks sufficient source support"
-        
-        if intervention_type == InterventionType.SOURCE_REQUEST:
-            return "Request additional sources to verify this claim"
-        
-        if intervention_type == InterventionType.CLARIFICATION:
-            return "Seek clarification on this claim before proceeding"
-        
-        return "Unknown intervention type"
+        return _recommendation_text(code, chunk_id)
     
     def _calculate_intervention_confidence(
         self, 
         claim: Claim, 
-        intervention_type: InterventionType
+        code: int,
+        best_source: Optional[SourceReference]
     ) -> float:
         """
         Calculate confidence in the recommended intervention.
@@ -162,39 +291,18 @@ class InterventionSelector:
         This represents how confident we are that this is the
         right intervention for this claim.
         """
-        # Base confidence in the intervention
-        base_confidence = 0.7
-        
         # Adjust based on claim confidence and intervention type
-        if intervention_type == InterventionType.NONE:
-            # Higher claim confidence means higher intervention confidence
-            return min(1.0, claim.confidence_score + 0.1)
-            
-        if intervention_type == InterventionType.CORRECTION:
-            # Confidence in correction depends on having good sources
-            if claim.has_source and claim.best_source.alignment_score > 0.7:
-                return 0.9  # High confidence if we have a good source
-            return 0.6  # Lower confidence otherwise
-        
-        if intervention_type == InterventionType.UNCERTAINTY:
-            # High confidence in uncertainty for borderline cases
-            if 0.2 < claim.confidence_score < 0.6:
-                return 0.9
-            return 0.7
-        
-        if intervention_type == InterventionType.REMOVAL:
-            # Higher confidence in removal for very low confidence claims
-            if claim.confidence_score < 0.1:
-                return 0.9
+        handler = _CONFIDENCE_HANDLERS.get(code)
+        if handler is None:
+            # Default (base) confidence for other intervention types
             return 0.7
-        
-        # Default confidence for other intervention types
-        return base_confidence
+        return handler(claim, best_source)
     
     def _generate_corrected_text(
         self, 
         claim: Claim, 
-        intervention_type: InterventionType
+        code: int,
+        best_source: Optional[SourceReference]
     ) -> Optional[str]:
         """
         Generate corrected text for a claim if correction is recommended.
@@ -202,15 +310,13 @@ class InterventionSelector:
         This uses the best available source to create a corrected version
         of the claim that is better supported by evidence.
         """
-        if intervention_type != InterventionType.CORRECTION:
+        if code != _CORRECTION:
             return None
         
-        if not claim.has_source:
+        # The best source is used for correction
+        if best_source is None:
             return None
         
-        # Get the best source for correction
-        best_source = claim.best_source
-        
         # This is a simplified approach - in practice, would use more
         # sophisticated techniques for generating corrections
         
@@ -221,7 +327,8 @@ class InterventionSelector:
     def _generate_explanation(
         self, 
         claim: Claim, 
-        intervention_type: InterventionType
+        code: int,
+        best_source: Optional[SourceReference]
     ) -> Optional[str]:
         """
         Generate an explanation for the recommended intervention.
@@ -229,31 +336,179 @@ class InterventionSelector:
         This explanation provides context for why a particular
         intervention was recommended.
         """
-        if intervention_type == InterventionType.NONE:
+        if code == _NONE:
             return None
         
-        if intervention_type == InterventionType.CORRECTION:
-            if claim.has_source:
-                source = claim.best_source
-                return (f"Claim has low confidence score ({claim.confidence_score:.2f}) but "
-                        f"a relevant source was found. Source excerpt: '{source.text_excerpt}' "
-                        f"has alignment score {source.alignment_score:.2f}")
-            else:
-                return (f"Claim has low confidence score ({claim.confidence_score:.2f}) and "
-                        "no supporting sources were found.")
-        
-        if intervention_type == InterventionType.UNCERTAINTY:
-            return (f"Claim has borderline confidence score ({claim.confidence_score:.2f}). "
-                    f"Has {len(claim.sources)} partial sources, but support is limited.")
-        
-        if intervention_type == InterventionType.REMOVAL:
-            return (f"Claim has very low confidence score ({claim.confidence_score:.2f}) and "
-                    f"insufficient source support ({len(claim.sources)} sources).")
-        
-        if intervention_type == InterventionType.SOURCE_REQUEST:
-            return (f"Claim requires additional sources to verify. Current confidence: {claim.confidence_score:.2f}")
-        
-        if intervention_type == InterventionType.CLARIFICATION:
-            return (f"Claim is ambiguous and may benefit from clarification. Confidence: {claim.confidence_score:.2f}")
+        # Round the scores to their displayed precision so that claims with
+        # the same explanation share a cache entry
+        excerpt = alignment_score = None
+        if code == _CORRECTION and best_source is not None:
+            excerpt = best_source.text_excerpt
+            alignment_score = round(best_source.alignment_score, 2)
+        
+        return _explanation_text(
+            code,
+            round(claim.confidence_score, 2),
+            len(claim.sources),
+            excerpt,
+            alignment_score
+        )
+
+
+def _none_confidence(claim: Claim, best_source: Optional[SourceReference]) -> float:
+    """Higher claim confidence means higher intervention confidence."""
+    return min(1.0, claim.confidence_score + 0.1)
+
+
+def _correction_confidence(claim: Claim, best_source: Optional[SourceReference]) -> float:
+    """Confidence in correction depends on having good sources."""
+    if best_source is not None and best_source.alignment_score > 0.7:
+        return 0.9  # High confidence if we have a good source
+    return 0.6  # Lower confidence otherwise
+
+
+def _uncertainty_confidence(claim: Claim, best_source: Optional[SourceReference]) -> float:
+    """High confidence in uncertainty for borderline cases."""
+    if 0.2 < claim.confidence_score < 0.6:
+        return 0.9
+    return 0.7
+
+
+def _removal_confidence(claim: Claim, best_source: Optional[SourceReference]) -> float:
+    """Higher confidence in removal for very low confidence claims."""
+    if claim.confidence_score < 0.1:
+        return 0.9
+    return 0.7
+
+
+# Intervention confidence by intervention type code
+_CONFIDENCE_HANDLERS: Dict[int, Callable[[Claim, Optional[SourceReference]], float]] = {
+    _NONE: _none_confidence,
+    _CORRECTION: _correction_confidence,
+    _UNCERTAINTY: _uncertainty_confidence,
+    _REMOVAL: _removal_confidence
+}
+
+# Recommendations that don't depend on the claim, by intervention type code
+_RECOMMENDATIONS: Dict[int, str] = {
+    _NONE: "No intervention needed - claim is well-supported",
+    _UNCERTAINTY: "Add uncertainty qualification to indicate limited source support",
+    _REMOVAL: "Remove this claim as it lacks sufficient source support",
+    _SOURCE_REQUEST: "Request additional sources to verify this claim",
+    _CLARIFICATION: "Seek clarification on this claim before proceeding"
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _recommendation_text(code: int, chunk_id: Optional[str]) -> str:
+    """
+    Build the recommendation for an intervention.
+    
+    Args:
+        code: Integer code of the intervention type
+        chunk_id: Chunk of the best source, for corrections with a source
         
-        return f"Intervention selected due to low confidence score: {claim.confidence_score:.2f}"
\ No newline at end of file
+    Returns:
+        Recommendation text
+    """
+    if code == _CORRECTION:
+        if chunk_id is not None:
+            return f"Replace with corrected information from source: {chunk_id}"
+        return "Replace with corrected information or remove (no source available)"
+    
+    return _RECOMMENDATIONS.get(code, "Unknown intervention type")
+
+
+def _explain_correction(
+    confidence_score: float,
+    num_sources: int,
+    excerpt: Optional[str],
+    alignment_score: Optional[float]
+) -> str:
+    """Explain why a correction is recommended."""
+    if alignment_score is not None:
+        return (f"Claim has low confidence score ({confidence_score:.2f}) but "
+                f"a relevant source was found. Source excerpt: '{excerpt}' "
+                f"has alignment score {alignment_score:.2f}")
+    return (f"Claim has low confidence score ({confidence_score:.2f}) and "
+            "no supporting sources were found.")
+
+
+def _explain_uncertainty(
+    confidence_score: float,
+    num_sources: int,
+    excerpt: Optional[str],
+    alignment_score: Optional[float]
+) -> str:
+    """Explain why an uncertainty qualification is recommended."""
+    return (f"Claim has borderline confidence score ({confidence_score:.2f}). "
+            f"Has {num_sources} partial sources, but support is limited.")
+
+
+def _explain_removal(
+    confidence_score: float,
+    num_sources: int,
+    excerpt: Optional[str],
+    alignment_score: Optional[float]
+) -> str:
+    """Explain why a removal is recommended."""
+    return (f"Claim has very low confidence score ({confidence_score:.2f}) and "
+            f"insufficient source support ({num_sources} sources).")
+
+
+def _explain_source_request(
+    confidence_score: float,
+    num_sources: int,
+    excerpt: Optional[str],
+    alignment_score: Optional[float]
+) -> str:
+    """Explain why a source request is recommended."""
+    return f"Claim requires additional sources to verify. Current confidence: {confidence_score:.2f}"
+
+
+def _explain_clarification(
+    confidence_score: float,
+    num_sources: int,
+    excerpt: Optional[str],
+    alignment_score: Optional[float]
+) -> str:
+    """Explain why a clarification request is recommended."""
+    return f"Claim is ambiguous and may benefit from clarification. Confidence: {confidence_score:.2f}"
+
+
+# Explanation builders by intervention type code; all take the arguments of _explanation_text
+_EXPLANATION_HANDLERS: Dict[int, Callable[..., str]] = {
+    _CORRECTION: _explain_correction,
+    _UNCERTAINTY: _explain_uncertainty,
+    _REMOVAL: _explain_removal,
+    _SOURCE_REQUEST: _explain_source_request,
+    _CLARIFICATION: _explain_clarification
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _explanation_text(
+    code: int,
+    confidence_score: float,
+    num_sources: int,
+    excerpt: Optional[str],
+    alignment_score: Optional[float]
+) -> str:
+    """
+    Build the explanation for an intervention.
+    
+    Args:
+        code: Integer code of the intervention type
+        confidence_score: Confidence score of the claim
+        num_sources: Number of sources of the claim
+        excerpt: Excerpt of the best source, for corrections with a source
+        alignment_score: Alignment score of the best source, for corrections
+            with a source
+        
+    Returns:
+        Explanation text
+    """
+    handler = _EXPLANATION_HANDLERS.get(code)
+    if handler is None:
+        return f"Intervention selected due to low confidence score: {confidence_score:.2f}"
+    return handler(confidence_score, num_sources, excerpt, alignment_score)
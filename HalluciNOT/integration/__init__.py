@@ -5,8 +5,28 @@ This module provides integration with external document processing systems,
 particularly ByteMeSumAI.
 """
 
-try:
-    from .bytemesumai import ByteMeSumAIAdapter, ByteMeSumAIDocumentStore, VerificationMetadataEnricher
-    __all__ = ["ByteMeSumAIAdapter", "ByteMeSumAIDocumentStore", "VerificationMetadataEnricher"]
-except ImportError:
-    __all__ = []
\ No newline at end of file
+import importlib
+
+__all__ = ["ByteMeSumAIAdapter", "ByteMeSumAIDocumentStore", "VerificationMetadataEnricher"]
+
+# Integrations are imported on first access (PEP 562), so an unused or
+# unavailable integration costs nothing at import time
+_LAZY_IMPORTS = {
+    "ByteMeSumAIAdapter": ".bytemesumai",
+    "ByteMeSumAIDocumentStore": ".bytemesumai",
+    "VerificationMetadataEnricher": ".bytemesumai",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -7,28 +7,9 @@ This example demonstrates how to integrate HalluciNOT with ByteMeSumAI
 for verifying LLM responses against document chunks processed by ByteMeSumAI.
 """
 
-import sys
-import os
 import logging
 from typing import List, Dict, Any, Optional
 
-# Add the parent directory to the path to access the package
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from hallucinot import (
-    VerificationProcessor,
-    ByteMeSumAIAdapter,
-    VerificationMetadataEnricher,
-    ByteMeSumAIDocumentStore,
-    highlight_verification_result
-)
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
 logger = logging.getLogger(__name__)
 
 # Mock ByteMeSumAI classes for demonstration purposes
@@ -136,6 +117,15 @@ def create_sample_bytemesumai_document():
     return document
 
 def main():
+    # Imported here so that importing this module stays cheap
+    from hallucinot import (
+        VerificationProcessor,
+        ByteMeSumAIAdapter,
+        VerificationMetadataEnricher,
+        ByteMeSumAIDocumentStore,
+        highlight_verification_result
+    )
+    
     # Create a sample ByteMeSumAI document
     bytemesumai_document = create_sample_bytemesumai_document()
     print(f"Created ByteMeSumAI document with {len(bytemesumai_document.chunks)} chunks")
@@ -169,7 +159,7 @@ def main():
     print("\nVerification Summary:")
     print(f"Overall confidence score: {verification_result.confidence_score:.2f}")
     print(f"Hallucination score: {verification_result.hallucination_score:.2f}")
-    print(f"Claims verified: {sum(1 for c in verification_result.claims if c.has_source)}/{len(verification_result.claims)}")
+    print(f"Claims verified: {verification_result.n_claims_with_source}/{len(verification_result.claims)}")
     
     # Method 2: Using VerificationMetadataEnricher for enhanced verification
     print("\nMethod 2: Using VerificationMetadataEnricher")
@@ -198,7 +188,7 @@ def main():
     print("\nEnhanced Verification Summary:")
     print(f"Overall confidence score: {enhanced_verification_result.confidence_score:.2f}")
     print(f"Hallucination score: {enhanced_verification_result.hallucination_score:.2f}")
-    print(f"Claims verified: {sum(1 for c in enhanced_verification_result.claims if c.has_source)}/{len(enhanced_verification_result.claims)}")
+    print(f"Claims verified: {enhanced_verification_result.n_claims_with_source}/{len(enhanced_verification_result.claims)}")
     
     # Print detailed claim information for enhanced verification
     print("\nDetailed Claim Analysis (Enhanced):")
@@ -240,4 +230,10 @@ def main():
     print("\nSaved HTML verification report to enhanced_verification_report.html")
 
 if __name__ == "__main__":
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     main()
\ No newline at end of file
@@ -7,9 +7,14 @@ This module provides the main entry point for the verification process,
 coordinating the extraction, mapping, scoring, and intervention components.
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, TextIO, Union
+from collections import OrderedDict
+import hashlib
 import logging
+import os
+import pickle
 import uuid
+import weakref
 
 from .claim_extraction.extractor import ClaimExtractor, ClaimMerger
 from .source_mapping.mapper import SourceMapper
@@ -57,13 +62,24 @@ class VerificationProcessor:
         # Default settings
         self.enable_claim_merging = self.config.get("enable_claim_merging", True)
         self.auto_generate_report = self.config.get("auto_generate_report", False)
+        self.verify_cache_size = self.config.get("verify_cache_size", 0)  # Cached verifications (0 disables)
+        
+        # Scored claims of recent verifications, keyed by response and document
+        # store. Opt-in, since the key ignores component settings: changing e.g.
+        # source_mapper.min_alignment_score afterwards keeps serving claims
+        # scored under the old settings until clear_cache() is called
+        self._verify_cache = OrderedDict()
+        
+        # Created on first use, when reports are generated
+        self._report_generator = None
         
         logger.debug("VerificationProcessor initialized with config: %s", self.config)
     
     def verify(
         self, 
         text: str,
-        document_store: DocumentStore
+        document_store: DocumentStore,
+        parallel: bool = False
     ) -> VerificationResult:
         """
         Verify an LLM response against a document store.
@@ -77,6 +93,10 @@ class VerificationProcessor:
         Args:
             text: The LLM-generated text to verify
             document_store: Collection of document chunks to verify against
+            parallel: Whether to map the claims to sources with one thread
+                per CPU. Only worth it when embedding or searching releases
+                the GIL (e.g. a remote embed_batch); with the built-in
+                DocumentStore it is slightly slower than mapping in turn
             
         Returns:
             VerificationResult with claims, confidence scores, and interventions
@@ -84,6 +104,81 @@ class VerificationProcessor:
         logger.info("Starting verification of text (%d characters) against %d document chunks", 
                   len(text), document_store.count)
         
+        # Reuse the claims of an earlier verification of the same text
+        # against the same document store, if there was one
+        key = self._verify_cache_key(text, document_store)
+        claims = self._get_cached_claims(key, document_store)
+        
+        if claims is None:
+            claims = self._score_claims([self._extract_text_claims(text)], document_store, parallel)[0]
+            self._cache_claims(key, document_store, claims)
+        else:
+            logger.debug("Reusing cached claims for text")
+        
+        return self._build_result(text, claims, document_store)
+    
+    def verify_batch(
+        self,
+        texts: List[str],
+        document_store: DocumentStore,
+        parallel: bool = False
+    ) -> List[VerificationResult]:
+        """
+        Verify several LLM responses against a document store.
+        
+        Claims are extracted from all responses in one batch, then mapped
+        to sources and scored together, so per-call overhead is paid once
+        rather than once per response. Claims are only merged within a
+        response.
+        
+        Args:
+            texts: The LLM-generated texts to verify
+            document_store: Collection of document chunks to verify against
+            parallel: Whether to map the claims to sources with one thread
+                per CPU (see verify)
+            
+        Returns:
+            One VerificationResult per text, in the same order
+        """
+        logger.info("Starting verification of %d texts against %d document chunks",
+                  len(texts), document_store.count)
+        
+        keys = [self._verify_cache_key(text, document_store) for text in texts]
+        claims_per_text = [self._get_cached_claims(key, document_store) for key in keys]
+        
+        # Extract, map and score the claims of the texts that weren't cached
+        pending = [i for i, claims in enumerate(claims_per_text) if claims is None]
+        if pending:
+            extracted = self.extract_claims([texts[i] for i in pending])
+            if self.enable_claim_merging:
+                extracted = [
+                    self.claim_merger.merge_claims(claims) if claims else claims
+                    for claims in extracted
+                ]
+            
+            for i, claims in zip(pending, self._score_claims(extracted, document_store, parallel)):
+                claims_per_text[i] = claims
+                self._cache_claims(keys[i], document_store, claims)
+        
+        return [
+            self._build_result(text, claims, document_store)
+            for text, claims in zip(texts, claims_per_text)
+        ]
+    
+    def clear_cache(self):
+        """
+        Forget cached verifications.
+        
+        Call this after modifying the chunks of a document store in place, or
+        after changing the settings of any component (extractor, merger,
+        mapper, scorer or intervention selector); adding chunks already
+        invalidates the cached verifications for a store.
+        """
+        self._verify_cache.clear()
+        self.source_mapper.clear_cache()
+    
+    def _extract_text_claims(self, text: str) -> List[Claim]:
+        """Extract claims from text, and optionally merge related claims."""
         # Extract claims from the text
         claims = self.extract_claims(text)
         logger.info("Extracted %d claims from text", len(claims))
@@ -93,14 +188,55 @@ class VerificationProcessor:
             claims = self.claim_merger.merge_claims(claims)
             logger.info("Merged into %d claims", len(claims))
         
+        return claims
+    
+    def _score_claims(
+        self,
+        claims_per_text: List[List[Claim]],
+        document_store: DocumentStore,
+        parallel: bool = False
+    ) -> List[List[Claim]]:
+        """
+        Map the claims of several texts to sources and score them together.
+        
+        Args:
+            claims_per_text: Claims of each text
+            document_store: Document store to search for sources
+            parallel: Whether to map the claims with one thread per CPU
+                (no speedup with the built-in DocumentStore)
+            
+        Returns:
+            Mapped and scored claims of each text
+        """
+        # Flatten the claims; they are split back up by text after scoring
+        all_claims = [claim for claims in claims_per_text for claim in claims]
+        
         # Map claims to sources
-        claims = self.map_claims_to_sources(claims, document_store)
-        logger.info("Mapped %d claims to sources", len(claims))
+        all_claims = self.map_claims_to_sources(
+            all_claims, document_store, os.cpu_count() if parallel else None
+        )
+        logger.info("Mapped %d claims to sources", len(all_claims))
         
         # Score claim confidence
-        claims = self.score_claim_confidence(claims)
-        logger.info("Scored confidence for %d claims", len(claims))
+        all_claims = self.score_claim_confidence(all_claims)
+        logger.info("Scored confidence for %d claims", len(all_claims))
+        
+        scored = []
+        start = 0
+        for claims in claims_per_text:
+            end = start + len(claims)
+            scored.append(all_claims[start:end])
+            start = end
         
+        return scored
+    
+    def _build_result(
+        self,
+        text: str,
+        claims: List[Claim],
+        document_store: DocumentStore
+    ) -> VerificationResult:
+        """Select interventions for scored claims and assemble the verification result."""
         # Select interventions for hallucinations
         interventions = self.select_interventions(claims)
         logger.info("Selected %d interventions", len(interventions))
@@ -119,30 +255,90 @@ class VerificationProcessor:
             }
         )
         
-        # Optionally generate report
+        # Optionally attach a report generator; result.get_report() builds the
+        # report on first use
         if self.auto_generate_report:
-            from .visualization.reporting import ReportGenerator
-            report_generator = ReportGenerator()
-            result.report = report_generator.generate_report(result)
+            result._report_generator = self._get_report_generator()
         
         return result
     
-    def extract_claims(self, text: str) -> List[Claim]:
+    def _get_report_generator(self):
+        """Get the report generator for automatically generated reports."""
+        if self._report_generator is None:
+            from .visualization.reporting import ReportGenerator
+            self._report_generator = ReportGenerator()
+        return self._report_generator
+    
+    def _verify_cache_key(self, text: str, document_store: DocumentStore) -> tuple:
+        """
+        Compute the verification cache key of a text and document store.
+        
+        Component settings are deliberately not part of the key; see
+        clear_cache.
+        """
+        return (
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+            id(document_store),
+            document_store.count
+        )
+    
+    def _get_cached_claims(self, key: tuple, document_store: DocumentStore) -> Optional[List[Claim]]:
+        """
+        Look up the cached scored claims for a verification cache key.
+        
+        Entries are stored pickled, so every hit returns fresh Claim objects
+        that callers are free to modify.
+        """
+        entry = self._verify_cache.get(key)
+        
+        # The store reference guards against a new store reusing an old id
+        if entry is None or entry[0]() is not document_store:
+            return None
+        
+        self._verify_cache.move_to_end(key)
+        return pickle.loads(entry[1])
+    
+    def _cache_claims(self, key: tuple, document_store: DocumentStore, claims: List[Claim]):
+        """Store scored claims in the verification cache."""
+        if not self.verify_cache_size:
+            return
+        
+        try:
+            store_ref = weakref.ref(document_store)
+        except TypeError:
+            return
+        
+        self._verify_cache[key] = (
+            store_ref, pickle.dumps(claims, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        self._verify_cache.move_to_end(key)
+        if len(self._verify_cache) > self.verify_cache_size:
+            self._verify_cache.popitem(last=False)
+    
+    def extract_claims(
+        self, 
+        text: Union[str, List[str]]
+    ) -> Union[List[Claim], List[List[Claim]]]:
         """
         Extract claims from text.
         
         Args:
-            text: Text to extract claims from
+            text: Text to extract claims from, or a list of texts to
+                extract from in a single batch
             
         Returns:
-            List of extracted claims
+            List of extracted claims, or one list of claims per text
+            when a list of texts is given
         """
+        if isinstance(text, list):
+            return list(self.claim_extractor.extract_claims_batch(text))
         return self.claim_extractor.extract_claims(text)
     
     def map_claims_to_sources(
         self, 
         claims: List[Claim],
-        document_store: DocumentStore
+        document_store: DocumentStore,
+        num_workers: Optional[int] = None
     ) -> List[Claim]:
         """
         Map claims to sources in the document store.
@@ -150,11 +346,13 @@ class VerificationProcessor:
         Args:
             claims: Claims to map to sources
             document_store: Document store to search for sources
+            num_workers: Number of threads mapping claims at once (defaults
+                to the mapper's num_workers setting)
             
         Returns:
             Claims with source references added
         """
-        return self.source_mapper.map_to_sources(claims, document_store)
+        return self.source_mapper.map_to_sources(claims, document_store, num_workers)
     
     def score_claim_confidence(self, claims: List[Claim]) -> List[Claim]:
         """
@@ -183,20 +381,23 @@ class VerificationProcessor:
     def highlight_verification_result(
         self, 
         verification_result: VerificationResult,
-        format: str = "html"
-    ) -> str:
+        format: str = "html",
+        out: Optional[TextIO] = None
+    ) -> Union[str, TextIO]:
         """
         Generate highlighted visualization of verification result.
         
         Args:
             verification_result: Verification result to visualize
             format: Output format ('html', 'markdown', or 'text')
+            out: Text stream to write the output to, instead of returning
+                it as a string
             
         Returns:
-            Highlighted text with confidence indicators
+            Highlighted text with confidence indicators, or out if given
         """
         from .visualization.highlighter import highlight_verification_result
-        return highlight_verification_result(verification_result, format)
+        return highlight_verification_result(verification_result, format, out)
     
     def generate_corrected_response(
         self, 
@@ -219,23 +420,26 @@ class VerificationProcessor:
     def generate_report(
         self, 
         verification_result: VerificationResult,
-        format: str = "html"
-    ) -> Union[str, VerificationReport]:
+        format: str = "html",
+        out: Optional[TextIO] = None
+    ) -> Union[str, VerificationReport, TextIO]:
         """
         Generate a detailed report on verification results.
         
         Args:
             verification_result: Verification result to report on
             format: Output format ('html', 'json', or 'object')
+            out: Text stream to write an HTML report to as it is generated,
+                instead of returning it as a string
             
         Returns:
-            Report in the requested format
+            Report in the requested format, or out if given
         """
         from .visualization.reporting import ReportGenerator
         report_generator = ReportGenerator()
         
         if format == "html":
-            return report_generator.generate_html_report(verification_result)
+            return report_generator.generate_html_report(verification_result, out)
         elif format == "json":
             return report_generator.generate_json_report(verification_result)
         else:
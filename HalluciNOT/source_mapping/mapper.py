@@ -8,16 +8,133 @@ document chunks in the source material. It identifies which parts of the
 source documents support or contradict each claim.
 """
 
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import List, Dict, Any, Optional, Set, FrozenSet, Tuple, Iterable
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cached_property
+import heapq
 import logging
+import math
+import sys
 import uuid
 import re
+import weakref
 
-from ..utils.common import Claim, DocumentChunk, DocumentStore, SourceReference, ClaimType
+import numpy as np
+
+from ..utils.common import Claim, DocumentChunk, DocumentStore, SourceReference, ClaimType, embed_in_batches
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Patterns used for searching and scoring, compiled once
+_WORD3_RE = re.compile(r'\b[A-Za-z]{3,}\b')
+_WORD4_RE = re.compile(r'\b[A-Za-z]{4,}\b')
+_NUM_RE = re.compile(r'\d+(?:\.\d+)?')
+_DATE_RE = re.compile(r'\b(?:19|20)\d{2}\b|\b\d{1,2}/\d{1,2}/\d{2,4}\b')
+_MONTH_RE = re.compile(
+    r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\b',
+    re.IGNORECASE
+)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=[.?!])\s')
+
+# Excerpts up to this length are interned, so the many claims sourced from
+# the same chunk share one excerpt string
+_MAX_INTERNED_EXCERPT = 4096
+
+
+@dataclass(frozen=True)
+class _ClaimFeatures:
+    """Claim-side scoring features, extracted once per claim."""
+    words: Set[str]            # Lowercased words of 3+ letters
+    word_counts: Dict[str, int]  # Occurrences of each of those words
+    important_words: Set[str]  # Lowercased words of 4+ letters, for excerpts
+    numbers: List[float]       # Values of the numbers, so "5" matches "5.0"
+    dates: List[str]
+    months: List[str]          # Lowercased month names
+    entity_texts: List[str]    # Lowercased entity texts
+    
+    @classmethod
+    def from_claim(cls, claim: Claim) -> "_ClaimFeatures":
+        text_lower = claim.text.lower()
+        word_counts = Counter(_WORD3_RE.findall(text_lower))
+        return cls(
+            words=set(word_counts),
+            word_counts=word_counts,
+            important_words=set(_WORD4_RE.findall(text_lower)),
+            numbers=[float(number) for number in _NUM_RE.findall(claim.text)],
+            dates=_DATE_RE.findall(claim.text),
+            months=[month.lower() for month in _MONTH_RE.findall(claim.text)],
+            entity_texts=[entity["text"].lower() for entity in claim.entities]
+        )
+
+
+@dataclass(frozen=True)
+class _ChunkFeatures:
+    """Chunk-side scoring features, cached on the chunk across claims."""
+    text: str                  # Text the features were extracted from
+    lower_text: str
+    words: FrozenSet[str]      # Lowercased words of 3+ letters
+    numbers: Set[float]        # Values of the numbers
+    dates: Set[str]
+    months: Set[str]           # Lowercased month names
+    
+    @classmethod
+    def of(cls, chunk: DocumentChunk) -> "_ChunkFeatures":
+        features = chunk._features
+        if features is None or features.text is not chunk.text:
+            text = chunk.text
+            features = cls(
+                text=text,
+                lower_text=chunk.text_lower,
+                words=chunk.text_words,
+                numbers={float(number) for number in _NUM_RE.findall(text)},
+                dates=set(_DATE_RE.findall(text)),
+                months={month.lower() for month in _MONTH_RE.findall(text)}
+            )
+            chunk._features = features
+        return features
+    
+    @cached_property
+    def sentence_index(self) -> Tuple[List[str], Dict[str, List[int]]]:
+        """
+        The chunk's sentences, and the sentences using each word.
+        
+        Built on first use, for excerpt extraction.
+        
+        Returns:
+            Sentences of the text, and a mapping of each lowercased word of
+            4+ letters to the positions of the sentences of 10 or more
+            characters that contain it
+        """
+        sentences = _SENTENCE_SPLIT_RE.split(self.text)
+        postings: Dict[str, List[int]] = {}
+        for position, sentence in enumerate(sentences):
+            if len(sentence) < 10:  # Skip very short sentences
+                continue
+            for word in set(_WORD4_RE.findall(sentence.lower())):
+                postings.setdefault(word, []).append(position)
+        return sentences, postings
+
+
+def _validation_key(claim: Claim) -> tuple:
+    """Key of everything about a claim that its sources depend on."""
+    embedding = claim.embedding
+    return (
+        claim.type,
+        claim.text,
+        tuple(entity["text"].lower() for entity in claim.entities),
+        None if embedding is None else np.asarray(embedding, dtype=np.float64).tobytes()
+    )
+
+
+def _normalize(embedding: List[float]) -> np.ndarray:
+    """L2-normalize an embedding, leaving an all-zero one as it is."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
 
 class SourceMapper:
     """
@@ -43,6 +160,62 @@ class SourceMapper:
         self.use_semantic_search = self.config.get("use_semantic_search", True)
         self.enable_entity_matching = self.config.get("enable_entity_matching", True)
         
+        # Word similarity behind generic scores: "jaccard" (distinct words)
+        # or "cosine" (word counts, so repeated words weigh more)
+        self.generic_similarity = self.config.get("generic_similarity", "jaccard")
+        
+        # Optional function embedding a list of texts, used to embed claims
+        # for semantic search, and the maximum number of texts per call
+        self.embed_batch = self.config.get("embed_batch")
+        self.embedding_batch_size = self.config.get("embedding_batch_size", 20)
+        
+        # Optional directory caching claim embeddings on disk, and the name of
+        # the embedding model, which keeps the embeddings of models apart (so
+        # the cache is only used with a model name)
+        self.embedding_cache_dir = self.config.get("embedding_cache_dir")
+        self.embedding_model = self.config.get("embedding_model", "")
+        if self.embedding_cache_dir is not None and not self.embedding_model:
+            logger.warning("embedding_cache_dir needs an embedding_model, not caching claim embeddings")
+            self.embedding_cache_dir = None
+        
+        # Number of threads mapping claims at once (1 maps them in turn). Only
+        # pays off when embed_batch or a custom store releases the GIL (e.g.
+        # a remote embedding service); the built-in DocumentStore search is
+        # pure Python, so threads add overhead without any speedup
+        self.num_workers = self.config.get("num_workers", 1)
+        
+        # Validation cache: claims identical to a recently mapped claim (same
+        # type, text, entities and embedding) reuse its sources. Opt-in: each
+        # mapped claim's sources are copied into it, and the key ignores the
+        # mapper settings, so call clear_cache() after changing them
+        self.validation_cache_size = self.config.get("validation_cache_size", 0)  # Cached claims (0 disables)
+        
+        # Validation cache state: (weakref to the document store, its chunk
+        # count), and sources by claim key in LRU order
+        self._validation_cache_store: Optional[tuple] = None
+        self._validation_cache: "OrderedDict[tuple, List[SourceReference]]" = OrderedDict()
+        
+        # Semantic cache: claims whose embedding is at least this similar to
+        # a recently mapped claim of the same type reuse its sources
+        self.semantic_cache_size = self.config.get("semantic_cache_size", 0)  # Cached claims (0 disables)
+        self.semantic_cache_threshold = self.config.get("semantic_cache_threshold", 0.95)
+        
+        # Semantic cache state: (weakref to the document store, its chunk
+        # count), normalized embeddings and claim type ordinals by slot (-1
+        # for empty slots), sources by slot, and slots in LRU order
+        self._semantic_cache_store: Optional[tuple] = None
+        self._semantic_cache_embeddings: Optional[np.ndarray] = None
+        self._semantic_cache_types: Optional[np.ndarray] = None
+        self._semantic_cache_sources: List[Optional[List[SourceReference]]] = []
+        self._semantic_cache_lru: "OrderedDict[int, None]" = OrderedDict()
+        
+        # Type-specific alignment scorers; other claim types use the
+        # generic score
+        self._type_scorers = {
+            ClaimType.NUMERICAL: self._score_numerical_claim,
+            ClaimType.TEMPORAL: self._score_temporal_claim,
+        }
+        
         # Initialize components if needed
         self._initialize_components()
         
@@ -57,7 +230,8 @@ class SourceMapper:
     def map_to_sources(
         self, 
         claims: List[Claim],
-        document_store: DocumentStore
+        document_store: DocumentStore,
+        num_workers: Optional[int] = None
     ) -> List[Claim]:
         """
         Map claims to their potential sources in the document store.
@@ -65,6 +239,10 @@ class SourceMapper:
         Args:
             claims: List of claims to map to sources
             document_store: Collection of document chunks to search for sources
+            num_workers: Number of threads mapping claims at once (defaults
+                to the num_workers setting). Threads only help when searching
+                releases the GIL; with the built-in DocumentStore they are
+                slower than mapping the claims in turn
             
         Returns:
             List of claims with source references added
@@ -72,26 +250,65 @@ class SourceMapper:
         logger.debug("Mapping %d claims to sources in document store with %d chunks", 
                    len(claims), document_store.count)
         
-        # Process each claim to find matching sources
+        # Embed all the claims up front, in as few calls as possible
+        if self.use_semantic_search and self.embed_batch is not None:
+            self._embed_claims(claims)
+        
+        # Skip building the per-claim debug arguments unless they are logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        use_semantic_cache = self.semantic_cache_size > 0
+        if use_semantic_cache:
+            self._check_semantic_cache_store(document_store)
+        
+        # Claims identical to one mapped earlier, in a previous call or in
+        # this one, reuse its sources; only the others are mapped
+        to_map = range(len(claims))
+        use_validation_cache = self.validation_cache_size > 0
+        if use_validation_cache:
+            keys, to_map, duplicates = self._probe_validation_cache(claims, document_store)
+        
+        # Search for the embedded claims to map all at once
+        semantic_sources = None
+        if self.use_semantic_search:
+            semantic_sources = self._semantic_search_batch(claims, document_store, to_map)
+        
+        def map_claim(i: int) -> None:
+            self._map_claim(
+                claims[i], document_store, semantic_sources.get(i) if semantic_sources else None, debug
+            )
+        
+        # Claims are independent, so they can be mapped by a pool of threads
+        # sharing the store's indexes, built up front. The semantic cache
+        # depends on the order claims are mapped in, so it keeps the
+        # mapping sequential
+        num_workers = min(num_workers or self.num_workers, len(to_map))
+        if num_workers > 1 and not use_semantic_cache:
+            logger.debug("Mapping %d claims with %d threads", len(to_map), num_workers)
+            document_store.build_index()
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                for _ in executor.map(map_claim, to_map):
+                    pass
+        else:
+            # Process each claim to find matching sources
+            for i in to_map:
+                claim = claims[i]
+                # Reuse the sources of a near-duplicate claim mapped earlier
+                cached_sources = None
+                if use_semantic_cache and claim.embedding is not None:
+                    cached_sources = self._probe_semantic_cache(claim)
+                if cached_sources is not None:
+                    claim.sources = cached_sources
+                else:
+                    map_claim(i)
+                    if use_semantic_cache and claim.embedding is not None:
+                        self._add_to_semantic_cache(claim)
+        
+        if use_validation_cache:
+            self._add_to_validation_cache(claims, keys, to_map, duplicates)
+        
+        # Add verification notes
         for claim in claims:
-            # Get potential sources for this claim
-            potential_sources = self._find_potential_sources(claim, document_store)
-            logger.debug("Found %d potential sources for claim: %s", 
-                       len(potential_sources), claim.text[:50])
-            
-            # Calculate alignment scores for each potential source
-            scored_sources = self._score_sources(claim, potential_sources)
-            logger.debug("Scored %d sources for claim", len(scored_sources))
-            
-            # Filter sources by minimum alignment score
-            valid_sources = [s for s in scored_sources 
-                            if s.alignment_score >= self.min_alignment_score]
-            
-            # Sort by alignment score and limit to max sources per claim
-            valid_sources.sort(key=lambda s: s.alignment_score, reverse=True)
-            claim.sources = valid_sources[:self.max_sources_per_claim]
-            
-            # Add verification notes
             if claim.sources:
                 claim.verification_notes = f"Found {len(claim.sources)} supporting sources"
             else:
@@ -99,23 +316,183 @@ class SourceMapper:
         
         return claims
     
+    def _map_claim(
+        self,
+        claim: Claim,
+        document_store: DocumentStore,
+        semantic_sources: Optional[List[DocumentChunk]],
+        debug: bool
+    ) -> None:
+        """Find, score and select the sources of one claim."""
+        # Get potential sources for this claim
+        potential_sources = self._find_potential_sources(claim, document_store, semantic_sources)
+        if debug:
+            logger.debug("Found %d potential sources for claim: %s", 
+                       len(potential_sources), claim.text[:50])
+        
+        # Score the potential sources and keep the best-aligned ones above
+        # the minimum alignment score, up to max sources per claim
+        claim.sources = self._select_sources(claim, potential_sources, document_store)
+        if debug:
+            logger.debug("Kept %d sources for claim", len(claim.sources))
+    
+    def clear_cache(self) -> None:
+        """
+        Forget the sources of previously mapped claims.
+        
+        Call this after modifying the chunks of a document store in place, or
+        after changing the mapper's settings (e.g. min_alignment_score);
+        adding chunks already invalidates the cached sources for a store.
+        """
+        self._validation_cache.clear()
+        self._semantic_cache_embeddings = None
+    
+    def _probe_validation_cache(
+        self,
+        claims: List[Claim],
+        document_store: DocumentStore
+    ) -> Tuple[List[tuple], List[int], List[Tuple[int, int]]]:
+        """
+        Reuse the cached sources of claims identical to ones mapped before.
+        
+        Claims found in the cache get copies of the cached sources.
+        
+        Returns:
+            The cache key of each claim, the positions of the claims to map,
+            and (position, position of the identical claim to map) pairs
+            for the claims repeating one to map
+        """
+        cached = self._validation_cache_store
+        if cached is None or cached[0]() is not document_store or cached[1] != document_store.count:
+            self._validation_cache.clear()
+            self._validation_cache_store = (weakref.ref(document_store), document_store.count)
+        
+        cache = self._validation_cache
+        keys = [_validation_key(claim) for claim in claims]
+        to_map = []
+        duplicates = []
+        first_positions: Dict[tuple, int] = {}
+        for i, key in enumerate(keys):
+            sources = cache.get(key)
+            if sources is not None:
+                cache.move_to_end(key)
+                claims[i].sources = [replace(source, context=dict(source.context)) for source in sources]
+            elif key in first_positions:
+                duplicates.append((i, first_positions[key]))
+            else:
+                first_positions[key] = i
+                to_map.append(i)
+        
+        logger.debug("Mapping %d of %d claims, the others repeat mapped claims", len(to_map), len(claims))
+        
+        return keys, to_map, duplicates
+    
+    def _add_to_validation_cache(
+        self,
+        claims: List[Claim],
+        keys: List[tuple],
+        mapped: List[int],
+        duplicates: List[Tuple[int, int]]
+    ) -> None:
+        """Cache the sources of newly mapped claims and copy them to their duplicates."""
+        for i, first in duplicates:
+            claims[i].sources = [replace(source, context=dict(source.context)) for source in claims[first].sources]
+        
+        cache = self._validation_cache
+        for i in mapped:
+            cache[keys[i]] = [replace(source, context=dict(source.context)) for source in claims[i].sources]
+            cache.move_to_end(keys[i])
+        while len(cache) > self.validation_cache_size:
+            cache.popitem(last=False)
+    
+    def _check_semantic_cache_store(self, document_store: DocumentStore) -> None:
+        """Empty the semantic cache if it holds sources from another store."""
+        cached = self._semantic_cache_store
+        if cached is None or cached[0]() is not document_store or cached[1] != document_store.count:
+            self._semantic_cache_embeddings = None
+            self._semantic_cache_store = (weakref.ref(document_store), document_store.count)
+    
+    def _probe_semantic_cache(self, claim: Claim) -> Optional[List[SourceReference]]:
+        """
+        Look up the sources of a cached claim similar to this one.
+        
+        Returns:
+            Copies of the sources of the most similar cached claim of the
+            same type, if it is similar enough, otherwise None
+        """
+        embeddings = self._semantic_cache_embeddings
+        query = _normalize(claim.embedding)
+        if embeddings is None or embeddings.shape[1] != len(query):
+            return None
+        
+        scores = embeddings @ query
+        scores[self._semantic_cache_types != claim.type_idx] = -np.inf
+        slot = int(np.argmax(scores))
+        if scores[slot] < self.semantic_cache_threshold:
+            return None
+        
+        self._semantic_cache_lru.move_to_end(slot)
+        return [replace(source, context=dict(source.context)) for source in self._semantic_cache_sources[slot]]
+    
+    def _add_to_semantic_cache(self, claim: Claim) -> None:
+        """Cache a mapped claim's sources, evicting the least recently used entry."""
+        query = _normalize(claim.embedding)
+        embeddings = self._semantic_cache_embeddings
+        if embeddings is None or embeddings.shape[1] != len(query):
+            size = self.semantic_cache_size
+            embeddings = self._semantic_cache_embeddings = np.zeros((size, len(query)), dtype=np.float32)
+            self._semantic_cache_types = np.full(size, -1, dtype=np.int64)
+            self._semantic_cache_sources = [None] * size
+            self._semantic_cache_lru = OrderedDict()
+        
+        lru = self._semantic_cache_lru
+        if len(lru) < len(embeddings):
+            slot = len(lru)
+        else:
+            slot, _ = lru.popitem(last=False)
+        
+        embeddings[slot] = query
+        self._semantic_cache_types[slot] = claim.type_idx
+        self._semantic_cache_sources[slot] = [
+            replace(source, context=dict(source.context)) for source in claim.sources
+        ]
+        lru[slot] = None
+    
+    def _embed_claims(self, claims: List[Claim]) -> None:
+        """Embed the claims that don't have an embedding yet, in batches."""
+        pending = [claim for claim in claims if claim.embedding is None]
+        if not pending:
+            return
+        
+        embeddings = embed_in_batches(
+            [claim.text for claim in pending], self.embed_batch, self.embedding_batch_size,
+            self.embedding_cache_dir, self.embedding_model
+        )
+        for claim, embedding in zip(pending, embeddings):
+            claim.embedding = embedding
+    
     def _find_potential_sources(
         self, 
         claim: Claim,
-        document_store: DocumentStore
+        document_store: DocumentStore,
+        semantic_sources: Optional[List[DocumentChunk]] = None
     ) -> List[DocumentChunk]:
         """
         Find potential source chunks for a claim.
         
         This is the first filtering step, using search techniques to
         narrow down the set of chunks that might support the claim.
+        Semantic search results already found for the claim, if given,
+        are used instead of searching again.
         """
         # TODO: Implement more sophisticated source finding
         
         if self.use_semantic_search:
             # Use semantic search if available
-            # This would typically involve comparing embeddings
-            potential_sources = self._semantic_search(claim, document_store)
+            if semantic_sources is not None:
+                potential_sources = semantic_sources
+            else:
+                potential_sources = self._semantic_search(claim, document_store)
         else:
             # Fall back to keyword-based search
             potential_sources = self._keyword_search(claim, document_store)
@@ -124,12 +501,13 @@ class SourceMapper:
         if self.enable_entity_matching and claim.entities:
             entity_sources = self._entity_search(claim, document_store)
             
-            # Combine sources, avoiding duplicates
-            seen_ids = {chunk.id for chunk in potential_sources}
-            for chunk in entity_sources:
-                if chunk.id not in seen_ids:
-                    potential_sources.append(chunk)
-                    seen_ids.add(chunk.id)
+            # Combine sources by ID, avoiding duplicates and keeping the
+            # search order (dicts preserve insertion order)
+            if entity_sources:
+                combined = {chunk.id: chunk for chunk in potential_sources}
+                for chunk in entity_sources:
+                    combined.setdefault(chunk.id, chunk)
+                potential_sources = list(combined.values())
         
         return potential_sources
     
@@ -141,19 +519,45 @@ class SourceMapper:
         """
         Find potential sources using semantic search.
         
-        This would typically use embeddings to find semantically
-        similar chunks, but is simplified here for demonstration.
+        Claims with an embedding are matched to the chunks with the most
+        similar embeddings; other claims fall back to the document store's
+        text search.
         """
-        # TODO: Implement actual semantic search
-        # This is a placeholder that just uses the document store's search
-        
-        # In a real implementation, we might:
-        # 1. Generate an embedding for the claim
-        # 2. Compare to chunk embeddings using cosine similarity
-        # 3. Return the top N matches
+        if claim.embedding is not None and hasattr(document_store, "search_by_embedding"):
+            return document_store.search_by_embedding(claim.embedding, limit=10)
         
         return document_store.search(claim.text, limit=10)
     
+    def _semantic_search_batch(
+        self,
+        claims: List[Claim],
+        document_store: DocumentStore,
+        positions: Optional[Iterable[int]] = None
+    ) -> Dict[int, List[DocumentChunk]]:
+        """
+        Run the semantic search of all the embedded claims in one query.
+        
+        Args:
+            claims: Claims to search for
+            document_store: Document store to search
+            positions: Positions of the claims to search for (all of them
+                by default)
+        
+        Returns:
+            Potential sources by index of the claim, for the claims with
+            embeddings
+        """
+        if positions is None:
+            positions = range(len(claims))
+        embedded = [i for i in positions if claims[i].embedding is not None]
+        if not embedded or not hasattr(document_store, "search_by_embeddings"):
+            return {}
+        
+        results = document_store.search_by_embeddings(
+            [claims[i].embedding for i in embedded], limit=10
+        )
+        return dict(zip(embedded, results))
+    
     def _keyword_search(
         self, 
         claim: Claim,
@@ -165,26 +569,19 @@ class SourceMapper:
         Extracts important keywords from the claim and searches
         for chunks containing those keywords.
         """
-        # Extract important words from the claim
-        # This is a simplified approach - would be more sophisticated in practice
-        words = re.findall(r'\b[A-Za-z]{3,}\b', claim.text)
-        
-        # Focus on less common words which are more distinctive
-        # Again, this is simplified - would use TF-IDF or similar in practice
-        keywords = [w for w in words if len(w) > 4][:5]
-        
-        if not keywords:
-            # Fall back to using all words if no distinctive keywords found
-            keywords = words[:5]
-        
-        # Search for chunks containing these keywords
-        # This is a simplified approach - would be more sophisticated in practice
-        matching_chunks = []
-        for chunk in document_store.get_all_chunks():
-            if any(keyword.lower() in chunk.text.lower() for keyword in keywords):
-                matching_chunks.append(chunk)
-        
-        return matching_chunks[:10]  # Limit to 10 matches
+        # Extract candidate keywords from the claim, skipping words that no
+        # chunk contains as they can't match anything
+        words = dict.fromkeys(w.lower() for w in _WORD3_RE.findall(claim.text))
+        frequencies = {word: document_store.document_frequency(word) for word in words}
+        frequencies = {word: frequency for word, frequency in frequencies.items() if frequency}
+        
+        # Focus on the rarest words (highest IDF, which falls as the document
+        # frequency rises), the most distinctive ones, longer words first
+        # among equally rare ones
+        keywords = sorted(frequencies, key=lambda word: (frequencies[word], -len(word)))[:5]
+        
+        # Search for chunks containing these keywords (limit to 10 matches)
+        return document_store.find_chunks_containing(keywords, limit=10)
     
     def _entity_search(
         self, 
@@ -196,126 +593,138 @@ class SourceMapper:
         
         Searches for chunks containing the same entities as the claim.
         """
-        matching_chunks = []
-        
         # Extract entity texts
         entity_texts = [entity["text"].lower() for entity in claim.entities]
         
         if not entity_texts:
             return []
         
-        # Look for chunks containing these entities
-        for chunk in document_store.get_all_chunks():
-            chunk_text_lower = chunk.text.lower()
-            if any(entity in chunk_text_lower for entity in entity_texts):
-                matching_chunks.append(chunk)
-        
-        return matching_chunks[:10]  # Limit to 10 matches
+        # Look for chunks containing these entities (limit to 10 matches)
+        return document_store.find_chunks_containing(entity_texts, limit=10)
     
-    def _score_sources(
-        self, 
+    def _select_sources(
+        self,
         claim: Claim,
-        chunks: List[DocumentChunk]
+        chunks: List[DocumentChunk],
+        document_store: Optional[DocumentStore] = None
     ) -> List[SourceReference]:
         """
-        Score potential source chunks based on alignment with the claim.
+        Score potential source chunks and keep the best-aligned ones.
         
-        Creates SourceReference objects with alignment scores.
-        """
-        scored_sources = []
+        Chunks are scored first, so excerpts are only extracted for the
+        chunks kept.
         
-        for chunk in chunks:
-            # Calculate alignment score
-            alignment_score = self._calculate_alignment_score(claim, chunk)
-            
-            # Create a SourceReference if the score is high enough
-            if alignment_score > 0:
-                # Extract the most relevant excerpt from the chunk
-                excerpt = self._extract_relevant_excerpt(claim, chunk)
-                
-                source_ref = SourceReference(
-                    chunk_id=chunk.id,
-                    document_id=chunk.source_document,
-                    text_excerpt=excerpt,
-                    alignment_score=alignment_score,
-                    context={
-                        "boundary_type": chunk.boundary_type.value if chunk.boundary_type else None,
-                        "parent_section": chunk.parent_section
-                    }
-                )
-                
-                scored_sources.append(source_ref)
-        
-        return scored_sources
+        Returns:
+            Up to max_sources_per_claim sources, best aligned first
+        """
+        features = _ClaimFeatures.from_claim(claim)
+        scores = self._alignment_scores(claim, chunks, document_store, features)
+        
+        min_score = self.min_alignment_score
+        best = heapq.nlargest(
+            self.max_sources_per_claim,
+            (i for i, score in enumerate(scores) if score > 0 and score >= min_score),
+            key=scores.__getitem__
+        )
+        return [self._create_source_reference(claim, chunks[i], scores[i], features) for i in best]
     
-    def _calculate_alignment_score(
-        self, 
+    def _alignment_scores(
+        self,
         claim: Claim,
-        chunk: DocumentChunk
-    ) -> float:
+        chunks: List[DocumentChunk],
+        document_store: Optional[DocumentStore],
+        features: _ClaimFeatures
+    ) -> List[float]:
         """
-        Calculate an alignment score between a claim and a document chunk.
+        Calculate the alignment score of each chunk with the claim.
         
-        The score represents how well the chunk supports the claim.
+        A score represents how well the chunk supports the claim.
         """
         # TODO: Implement more sophisticated alignment scoring
         # This is a simplified placeholder implementation
-        
-        # Different claim types might use different scoring approaches
-        if claim.type == ClaimType.NUMERICAL:
-            return self._score_numerical_claim(claim, chunk)
-        elif claim.type == ClaimType.TEMPORAL:
-            return self._score_temporal_claim(claim, chunk)
-        else:
-            return self._score_generic_claim(claim, chunk)
+        generic_scores = self._score_generic_claims(features, chunks, document_store)
+        type_scorer = self._type_scorers.get(claim.type)
+        
+        if type_scorer is not None:
+            if generic_scores is None:
+                return [type_scorer(features, chunk) for chunk in chunks]
+            return [type_scorer(features, chunk, score) for chunk, score in zip(chunks, generic_scores)]
+        if generic_scores is not None:
+            return list(generic_scores)
+        return [self._score_generic_claim(features, chunk) for chunk in chunks]
+    
+    def _create_source_reference(
+        self,
+        claim: Claim,
+        chunk: DocumentChunk,
+        alignment_score: float,
+        features: _ClaimFeatures
+    ) -> SourceReference:
+        """Create a reference to a chunk, with its most relevant excerpt."""
+        # Extract the most relevant excerpt from the chunk
+        excerpt = self._extract_relevant_excerpt(claim, chunk, features)
+        if len(excerpt) <= _MAX_INTERNED_EXCERPT:
+            excerpt = sys.intern(excerpt)
+        
+        return SourceReference(
+            chunk_id=chunk.id,
+            document_id=chunk.source_document,
+            text_excerpt=excerpt,
+            alignment_score=alignment_score,
+            context={
+                "boundary_type": chunk.boundary_type.value if chunk.boundary_type else None,
+                "parent_section": chunk.parent_section
+            }
+        )
     
     def _score_numerical_claim(
         self, 
-        claim: Claim,
-        chunk: DocumentChunk
+        features: _ClaimFeatures,
+        chunk: DocumentChunk,
+        generic_score: Optional[float] = None
     ) -> float:
         """Score alignment for numerical claims."""
-        # Extract numbers from claim and chunk
-        claim_numbers = re.findall(r'\d+(\.\d+)?', claim.text)
-        chunk_numbers = re.findall(r'\d+(\.\d+)?', chunk.text)
+        # Numbers from claim and chunk
+        claim_numbers = features.numbers
+        chunk_numbers = _ChunkFeatures.of(chunk).numbers
         
         # If the claim has numbers but the chunk doesn't, poor alignment
         if claim_numbers and not chunk_numbers:
             return 0.0
         
-        # Check if any of the same numbers appear in both
-        shared_numbers = set(claim_numbers).intersection(set(chunk_numbers))
+        # Check if any of the same values appear in both
+        shared_numbers = chunk_numbers.intersection(claim_numbers)
         if shared_numbers:
             # Score based on the proportion of shared numbers
             return min(1.0, len(shared_numbers) / len(claim_numbers))
         
         # Fall back to generic scoring
-        return self._score_generic_claim(claim, chunk) * 0.8  # Penalty for no number match
+        if generic_score is None:
+            generic_score = self._score_generic_claim(features, chunk)
+        return generic_score * 0.8  # Penalty for no number match
     
     def _score_temporal_claim(
         self, 
-        claim: Claim,
-        chunk: DocumentChunk
+        features: _ClaimFeatures,
+        chunk: DocumentChunk,
+        generic_score: Optional[float] = None
     ) -> float:
         """Score alignment for temporal claims."""
-        # Extract dates/times from claim and chunk
+        # Dates/times and month names from claim and chunk
         # This is a simplified approach - would be more sophisticated in practice
-        date_pattern = r'\b(19|20)\d{2}\b|\b\d{1,2}/\d{1,2}/\d{2,4}\b'
-        claim_dates = re.findall(date_pattern, claim.text)
-        chunk_dates = re.findall(date_pattern, chunk.text)
-        
-        # Also look for month names
-        month_pattern = r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b'
-        claim_months = re.findall(month_pattern, claim.text, re.IGNORECASE)
-        chunk_months = re.findall(month_pattern, chunk.text, re.IGNORECASE)
+        claim_dates = features.dates
+        claim_months = features.months
+        chunk_features = _ChunkFeatures.of(chunk)
+        chunk_dates = chunk_features.dates
+        chunk_months = chunk_features.months
         
         # If the claim has dates but the chunk doesn't, poor alignment
         if (claim_dates or claim_months) and not (chunk_dates or chunk_months):
             return 0.0
         
         # Check for shared dates/months
-        shared_dates = set(claim_dates).intersection(set(chunk_dates))
-        shared_months = set(map(str.lower, claim_months)).intersection(set(map(str.lower, chunk_months)))
+        shared_dates = chunk_dates.intersection(claim_dates)
+        shared_months = chunk_months.intersection(claim_months)
         
         if shared_dates or shared_months:
             # Score based on the proportion of shared temporal references
@@ -324,11 +733,13 @@ class SourceMapper:
             return min(1.0, shared_count / total_count)
         
         # Fall back to generic scoring
-        return self._score_generic_claim(claim, chunk) * 0.8  # Penalty for no date match
+        if generic_score is None:
+            generic_score = self._score_generic_claim(features, chunk)
+        return generic_score * 0.8  # Penalty for no date match
     
     def _score_generic_claim(
         self, 
-        claim: Claim,
+        features: _ClaimFeatures,
         chunk: DocumentChunk
     ) -> float:
         """
@@ -338,26 +749,35 @@ class SourceMapper:
         more sophisticated techniques like semantic similarity.
         """
         # Count word overlap between claim and chunk
-        claim_words = set(re.findall(r'\b[A-Za-z]{3,}\b', claim.text.lower()))
-        chunk_words = set(re.findall(r'\b[A-Za-z]{3,}\b', chunk.text.lower()))
+        claim_words = features.words
+        chunk_features = _ChunkFeatures.of(chunk)
+        chunk_words = chunk_features.words
         
         if not claim_words:
             return 0.0
         
-        # Calculate Jaccard similarity
-        intersection = claim_words.intersection(chunk_words)
-        union = claim_words.union(chunk_words)
-        
-        if not union:
-            return 0.0
-        
-        jaccard = len(intersection) / len(union)
+        if self.generic_similarity == "cosine":
+            # Calculate cosine similarity of the word counts
+            chunk_counts = Counter(_WORD3_RE.findall(chunk_features.lower_text))
+            dot = sum(count * chunk_counts[word] for word, count in features.word_counts.items())
+            norms = (math.sqrt(sum(count * count for count in features.word_counts.values()))
+                     * math.sqrt(sum(count * count for count in chunk_counts.values())))
+            similarity = dot / norms if norms else 0.0
+        else:
+            # Calculate Jaccard similarity
+            intersection = claim_words.intersection(chunk_words)
+            union = claim_words.union(chunk_words)
+            
+            if not union:
+                return 0.0
+            
+            similarity = len(intersection) / len(union)
         
         # Boost score if important entities are matched
         entity_boost = 0.0
-        if claim.entities and self.enable_entity_matching:
-            entity_texts = [entity["text"].lower() for entity in claim.entities]
-            chunk_text_lower = chunk.text.lower()
+        if features.entity_texts and self.enable_entity_matching:
+            entity_texts = features.entity_texts
+            chunk_text_lower = chunk_features.lower_text
             
             matched_entities = sum(1 for entity in entity_texts 
                                   if entity in chunk_text_lower)
@@ -366,12 +786,59 @@ class SourceMapper:
                 entity_boost = 0.2 * min(1.0, matched_entities / len(entity_texts))
         
         # Combine scores
-        return min(1.0, jaccard + entity_boost)
+        return min(1.0, similarity + entity_boost)
+    
+    def _score_generic_claims(
+        self,
+        features: _ClaimFeatures,
+        chunks: List[DocumentChunk],
+        document_store: Optional[DocumentStore]
+    ) -> Optional[List[float]]:
+        """
+        Score generic alignment of a claim with many chunks at once.
+        
+        Computes the same scores as _score_generic_claim, with the word
+        overlaps of all the chunks counted from the document store's word
+        index instead of tokenizing each chunk.
+        
+        Returns:
+            Generic score of each chunk, or None if the chunks can't be
+            scored from the store
+        """
+        cosine = self.generic_similarity == "cosine"
+        method = "word_cosine" if cosine else "word_jaccard"
+        if document_store is None or not chunks or not hasattr(document_store, method):
+            return None
+        
+        claim_words = features.words
+        if not claim_words:
+            return [0.0] * len(chunks)
+        
+        if cosine:
+            similarity = document_store.word_cosine(features.word_counts, chunks)
+        else:
+            similarity = document_store.word_jaccard(claim_words, chunks)
+        if similarity is None:
+            return None
+        scores = similarity.tolist()
+        
+        # Boost scores where important entities are matched
+        if features.entity_texts and self.enable_entity_matching:
+            entity_texts = features.entity_texts
+            for i, chunk in enumerate(chunks):
+                chunk_text_lower = _ChunkFeatures.of(chunk).lower_text
+                matched_entities = sum(1 for entity in entity_texts 
+                                      if entity in chunk_text_lower)
+                if matched_entities:
+                    scores[i] += 0.2 * min(1.0, matched_entities / len(entity_texts))
+        
+        return [min(1.0, score) for score in scores]
     
     def _extract_relevant_excerpt(
         self, 
         claim: Claim, 
-        chunk: DocumentChunk
+        chunk: DocumentChunk,
+        features: Optional[_ClaimFeatures] = None
     ) -> str:
         """
         Extract the most relevant excerpt from a chunk for a claim.
@@ -386,29 +853,22 @@ class SourceMapper:
             return chunk.text
         
         # Try to find important words from the claim in the chunk
-        important_words = set(re.findall(r'\b[A-Za-z]{4,}\b', claim.text.lower()))
-        
-        best_sentence = ""
-        best_score = 0
-        
-        # Split chunk into sentences and find the one with most claim words
-        sentences = re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s', chunk.text)
-        
-        for sentence in sentences:
-            if len(sentence) < 10:  # Skip very short sentences
-                continue
-                
-            sentence_words = set(re.findall(r'\b[A-Za-z]{4,}\b', sentence.lower()))
-            overlap = sentence_words.intersection(important_words)
-            
-            score = len(overlap) / max(1, len(important_words))
-            
-            if score > best_score:
-                best_score = score
-                best_sentence = sentence
+        if features is None:
+            features = _ClaimFeatures.from_claim(claim)
+        important_words = features.important_words
+        
+        # Find the first sentence with the most claim words, counting the
+        # claim words of each sentence from the chunk's cached word index
+        sentences, postings = _ChunkFeatures.of(chunk).sentence_index
+        overlap = Counter()
+        for word in important_words:
+            positions = postings.get(word)
+            if positions:
+                overlap.update(positions)
         
         # If no good sentence found, return the first part of the chunk
-        if not best_sentence:
+        if not overlap:
             return chunk.text[:200] + "..."
         
-        return best_sentence.strip()
\ No newline at end of file
+        best_position = max(overlap, key=lambda position: (overlap[position], -position))
+        return sentences[best_position].strip()
\ No newline at end of file
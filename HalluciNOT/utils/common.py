@@ -6,10 +6,71 @@ verification process, including claims, document chunks, verification
 results, and intervention strategies.
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Tuple, Iterable, Set, FrozenSet, Callable
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 import datetime
+import hashlib
+import importlib.util
+import logging
+import math
+import operator
+import os
+import re
+import sys
+import threading
+
+import numpy as np
+
+# Optional FAISS index for embedding search in large document stores. Only
+# probed here: faiss itself is imported by the first store large enough to
+# index, so importing HalluciNOT doesn't pay for loading it
+_HAS_FAISS = importlib.util.find_spec("faiss") is not None
+
+# Optional Aho-Corasick automaton for checking many terms in one sweep
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    _HAS_AHOCORASICK = False
+
+logger = logging.getLogger(__name__)
+
+# Per-instance objects created in large numbers use __slots__ where the
+# dataclass decorator supports it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Runs of letters in lowercased text, the tokens of the DocumentStore index
+_TOKEN_PATTERN = re.compile(r"[a-z]+")
+
+# Words of three or more letters, as compared by DocumentStore.word_jaccard
+_WORD_PATTERN = re.compile(r"\b[A-Za-z]{3,}\b")
+
+# Stores with fewer embedded chunks are searched with a NumPy matrix product
+# rather than a FAISS index, which isn't worth building for them
+_FAISS_MIN_CHUNKS = 1024
+
+# Okapi BM25 parameters of DocumentStore.search: term frequency saturation
+# and document length normalization
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+
+# FAISS scalar quantizer of each embedding_quantization setting that
+# compresses the stored embeddings ("fp32" keeps them as they are)
+_FAISS_QUANTIZERS = {"fp16": "QT_fp16", "int8": "QT_8bit"}
+
+# FAISS index types of each index_type setting: exact search of every
+# embedding, or approximate search of an HNSW graph, which is sub-linear in
+# the number of chunks
+_FAISS_INDEX_TYPES = ("flat", "hnsw")
+
+# Neighbors of each node of the HNSW graph
+_HNSW_NEIGHBORS = 32
+
+# Queries scored per NumPy matrix product, bounding the score matrix size
+_EMBEDDING_QUERY_BLOCK = 256
 
 
 class ClaimType(Enum):
@@ -22,6 +83,10 @@ class ClaimType(Enum):
     DEFINITIONAL = "definitional"  # Definitions or descriptions
     CITATION = "citation"    # References to external sources
     OTHER = "other"          # Other types of claims
+    
+    def __init__(self, value):
+        # Position in declaration order, for tuple-indexed per-type tables
+        self.ordinal = len(type(self).__members__)
 
 
 class BoundaryType(Enum):
@@ -47,7 +112,7 @@ class InterventionType(Enum):
     CLARIFICATION = "clarification"  # Ask for clarification
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DocumentChunk:
     """
     Represents a chunk of a document used for verification.
@@ -72,6 +137,32 @@ class DocumentChunk:
     related_chunks: List[str] = field(default_factory=list)
     entities: List[Dict[str, Any]] = field(default_factory=list)
     
+    # Scoring features cached by the source mapper, with the text they were
+    # extracted from
+    _features: Any = field(default=None, init=False, repr=False, compare=False)
+    
+    # (text, lowercased text, its words or None) for text_lower and text_words
+    _text_cache: Any = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def text_lower(self) -> str:
+        """The chunk text lowercased, computed once per text."""
+        cache = self._text_cache
+        if cache is None or cache[0] is not self.text:
+            cache = (self.text, self.text.lower(), None)
+            self._text_cache = cache
+        return cache[1]
+    
+    @property
+    def text_words(self) -> FrozenSet[str]:
+        """Distinct lowercased words of three or more letters in the chunk text."""
+        text_lower = self.text_lower
+        cache = self._text_cache
+        if cache[2] is None:
+            cache = (cache[0], text_lower, frozenset(_WORD_PATTERN.findall(text_lower)))
+            self._text_cache = cache
+        return cache[2]
+    
     @property
     def has_verification_metadata(self) -> bool:
         """Check if this chunk has verification-specific metadata."""
@@ -83,7 +174,7 @@ class DocumentChunk:
         ])
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SourceReference:
     """
     Reference to a source document chunk that supports a claim.
@@ -95,7 +186,7 @@ class SourceReference:
     context: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Claim:
     """
     A factual assertion extracted from an LLM response.
@@ -115,6 +206,14 @@ class Claim:
     confidence_score: float = 0.0
     verification_notes: str = ""
     
+    # Embedding of the claim text, for semantic source search
+    embedding: Optional[List[float]] = None
+    
+    @property
+    def type_idx(self) -> int:
+        """Ordinal of the claim type, for indexing per-type tables in hot loops."""
+        return self.type.ordinal
+    
     @property
     def has_source(self) -> bool:
         """Check if this claim has any source references."""
@@ -123,12 +222,11 @@ class Claim:
     @property
     def best_source(self) -> Optional[SourceReference]:
         """Get the source with the highest alignment score."""
-        if not self.sources:
-            return None
-        return max(self.sources, key=lambda s: s.alignment_score)
+        sources = self.sources
+        return max(sources, key=operator.attrgetter("alignment_score")) if sources else None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Intervention:
     """
     A recommended intervention for handling a potential hallucination.
@@ -153,7 +251,7 @@ class VerificationReport:
     verification_summary: str
     detailed_claims: List[Dict[str, Any]]
     generation_timestamp: datetime.datetime = field(
-        default_factory=lambda: datetime.datetime.now()
+        default_factory=lambda: datetime.datetime.now(datetime.timezone.utc)
     )
 
 
@@ -165,30 +263,592 @@ class DocumentStore:
     document storage mechanisms (in-memory, vector database, etc.)
     """
     
-    def __init__(self, chunks: Optional[List[DocumentChunk]] = None):
-        """Initialize with optional list of chunks."""
+    def __init__(
+        self,
+        chunks: Optional[List[DocumentChunk]] = None,
+        embedding_quantization: str = "fp32",
+        embedding_cache_dir: Optional[str] = None,
+        embedding_model: str = "",
+        index_type: str = "flat"
+    ):
+        """
+        Initialize with optional list of chunks.
+        
+        Args:
+            chunks: Initial chunks
+            embedding_quantization: Storage of the embeddings in the FAISS
+                index of large stores: "fp32", "fp16" (half the memory) or
+                "int8" (a quarter), trading a little search accuracy for
+                memory bandwidth
+            embedding_cache_dir: Optional directory caching the embeddings
+                computed by add_chunks on disk, across runs and processes
+                (requires embedding_model)
+            embedding_model: Name of the embedding model, which keeps the
+                cached embeddings of different models apart
+            index_type: FAISS index of large stores: "flat" (exact search)
+                or "hnsw" (approximate nearest neighbor search, much faster
+                above tens of thousands of chunks)
+        """
         self._chunks = chunks or []
+        
+        # The model name is the only thing keeping the cached embeddings of
+        # different models (or dimensions) apart
+        if embedding_cache_dir is not None and not embedding_model:
+            logger.warning("embedding_cache_dir needs an embedding_model, not caching embeddings")
+            embedding_cache_dir = None
+        self.embedding_cache_dir = embedding_cache_dir
+        self.embedding_model = embedding_model
+        
+        if embedding_quantization != "fp32" and embedding_quantization not in _FAISS_QUANTIZERS:
+            logger.warning("Unknown embedding quantization %r, using fp32", embedding_quantization)
+            embedding_quantization = "fp32"
+        self.embedding_quantization = embedding_quantization
+        
+        if index_type not in _FAISS_INDEX_TYPES:
+            logger.warning("Unknown index type %r, using flat", index_type)
+            index_type = "flat"
+        self.index_type = index_type
+        
+        # Chunk by ID for get_chunk (the first chunk with each ID), and the
+        # number of chunks it covers
+        self._by_id: Dict[str, DocumentChunk] = {}
+        self._by_id_count = 0
+        
+        # Inverted index for find_chunks_containing, built on first use:
+        # token -> positions of the chunks containing it, the lowercased
+        # chunk texts, and the number of chunks indexed
+        self._token_index: Optional[Dict[str, Set[int]]] = None
+        self._lower_texts: List[str] = []
+        self._indexed_count = 0
+        
+        # Positions of the chunks with a token containing a given letter run
+        self._run_postings: Dict[str, Set[int]] = {}
+        
+        # Word index for word_jaccard: word -> positions of the chunks using
+        # it, the number of distinct words of each chunk, and the position
+        # of each chunk by object id
+        self._word_postings: Dict[str, np.ndarray] = {}
+        self._word_counts = np.zeros(0, dtype=np.int64)
+        self._positions: Dict[int, int] = {}
+        
+        # Embedding index for search_by_embedding, built on first use:
+        # (number of chunks indexed, L2-normalized embedding matrix, store
+        # positions of its rows, FAISS index or None)
+        self._embedding_index: Optional[tuple] = None
+        
+        # BM25 index for search and word_cosine, built on first use:
+        # (number of chunks indexed, word -> (positions of the chunks using
+        # it, its count in each), number of words of each chunk, average
+        # number of words, L2 norm of each chunk's word counts)
+        self._bm25_index: Optional[tuple] = None
     
     def add_chunk(self, chunk: DocumentChunk) -> None:
         """Add a document chunk to the store."""
+        if self._by_id_count == len(self._chunks):
+            self._by_id.setdefault(chunk.id, chunk)
+            self._by_id_count += 1
         self._chunks.append(chunk)
+        self._token_index = None
+        self._embedding_index = None
+        self._bm25_index = None
+    
+    def add_chunks(
+        self,
+        chunks: Iterable[DocumentChunk],
+        embed_batch: Optional[Callable[[List[str]], Any]] = None,
+        batch_size: int = 20
+    ) -> None:
+        """
+        Add many document chunks to the store.
+        
+        Args:
+            chunks: Chunks to add
+            embed_batch: Optional function embedding a list of texts; chunks
+                without an embedding are embedded with it, in batches (or
+                loaded from the store's embedding cache directory)
+            batch_size: Maximum number of texts per embed_batch call
+        """
+        chunks = list(chunks)
+        if embed_batch is not None:
+            pending = [chunk for chunk in chunks if chunk.embedding is None]
+            embeddings = embed_in_batches(
+                [chunk.text for chunk in pending], embed_batch, batch_size,
+                self.embedding_cache_dir, self.embedding_model
+            )
+            for chunk, embedding in zip(pending, embeddings):
+                chunk.embedding = embedding
+        
+        if self._by_id_count == len(self._chunks):
+            for chunk in chunks:
+                self._by_id.setdefault(chunk.id, chunk)
+            self._by_id_count += len(chunks)
+        self._chunks.extend(chunks)
+        self._token_index = None
+        self._embedding_index = None
+        self._bm25_index = None
     
     def get_chunk(self, chunk_id: str) -> Optional[DocumentChunk]:
         """Get a chunk by its ID."""
-        for chunk in self._chunks:
-            if chunk.id == chunk_id:
-                return chunk
-        return None
+        if self._by_id_count != len(self._chunks):
+            by_id: Dict[str, DocumentChunk] = {}
+            for chunk in self._chunks:
+                by_id.setdefault(chunk.id, chunk)
+            self._by_id = by_id
+            self._by_id_count = len(self._chunks)
+        return self._by_id.get(chunk_id)
     
     def search(self, query: str, limit: int = 5) -> List[DocumentChunk]:
         """
         Search for chunks relevant to a query.
         
-        This is a placeholder for more sophisticated search mechanisms
-        that would be implemented by specific document stores.
+        Chunks are ranked by their Okapi BM25 score for the distinct words
+        of three or more letters in the query, from an index built once
+        and reused across calls. Document stores backed by a search engine
+        can override this with their own ranking.
+        
+        Args:
+            query: Text to search for
+            limit: Maximum number of chunks to return
+            
+        Returns:
+            Chunks sharing a word with the query, best match first (ties in
+            store order)
+        """
+        _, postings, lengths, average_length, _ = self._get_bm25_index()
+        n = len(lengths)
+        if limit <= 0 or n == 0:
+            return []
+        
+        scores = np.zeros(n)
+        norms = _BM25_K1 * (1.0 - _BM25_B + _BM25_B * lengths / average_length)
+        for word in set(_WORD_PATTERN.findall(query.lower())):
+            entry = postings.get(word)
+            if entry is None:
+                continue
+            positions, counts = entry
+            # Non-negative IDF, as in Lucene
+            idf = math.log(1.0 + (n - len(positions) + 0.5) / (len(positions) + 0.5))
+            scores[positions] += idf * counts * (_BM25_K1 + 1.0) / (counts + norms[positions])
+        
+        matches = np.flatnonzero(scores > 0)
+        matches = matches[np.argsort(-scores[matches], kind="stable")[:limit]]
+        return [self._chunks[position] for position in matches.tolist()]
+    
+    def search_by_embedding(
+        self,
+        embedding: List[float],
+        limit: int = 5
+    ) -> List[DocumentChunk]:
+        """
+        Find the chunks whose embeddings are most similar to an embedding.
+        
+        Similarity is cosine similarity, computed as the inner product of
+        L2-normalized vectors. Large stores are searched with a FAISS index
+        (exact, or approximate with index_type="hnsw") when faiss is
+        installed, smaller ones with a NumPy matrix product. Chunks without
+        embeddings are never returned.
+        
+        Args:
+            embedding: Query embedding, with the same dimension as the chunks'
+            limit: Maximum number of chunks to return
+            
+        Returns:
+            Most similar chunks, most similar first
+        """
+        return self.search_by_embeddings([embedding], limit)[0]
+    
+    def search_by_embeddings(
+        self,
+        embeddings: List[List[float]],
+        limit: int = 5
+    ) -> List[List[DocumentChunk]]:
+        """
+        Find the most similar chunks for many embeddings at once.
+        
+        Same as calling search_by_embedding for each embedding, but all the
+        queries go through one FAISS search or a few blocked matrix
+        products instead of one call per query.
+        
+        Args:
+            embeddings: Query embeddings, with the same dimension as the chunks'
+            limit: Maximum number of chunks to return per query
+            
+        Returns:
+            Most similar chunks of each query, most similar first
+        """
+        if not len(embeddings):
+            return []
+        
+        _, matrix, positions, faiss_index = self._get_embedding_index()
+        
+        limit = min(limit, len(positions))
+        if limit <= 0:
+            return [[] for _ in range(len(embeddings))]
+        
+        queries = _normalize_rows(np.asarray(embeddings, dtype=np.float32).reshape(len(embeddings), -1))
+        if faiss_index is not None:
+            _, rows = faiss_index.search(queries, limit)
+        else:
+            rows = np.concatenate([
+                _top_rows(queries[start:start + _EMBEDDING_QUERY_BLOCK] @ matrix.T, limit)
+                for start in range(0, len(queries), _EMBEDDING_QUERY_BLOCK)
+            ])
+        
+        chunks = self._chunks
+        return [
+            [chunks[positions[row]] for row in query_rows if row >= 0]
+            for query_rows in rows.tolist()
+        ]
+    
+    def embedding_matrix(self) -> Tuple[np.ndarray, List[int]]:
+        """
+        Get the embeddings of the chunks as one matrix.
+        
+        The matrix is built on first use and reused until chunks are added.
+        
+        Returns:
+            (N, D) float32 matrix of the L2-normalized embeddings of the N
+            chunks with an embedding, and the store position of the chunk
+            of each row
+        """
+        _, matrix, positions, _ = self._get_embedding_index()
+        return matrix, positions
+    
+    def text_lowers(self) -> List[str]:
+        """
+        Get the lowercased texts of the chunks, in store order.
+        
+        The list is built with the inverted index, on first use.
+        """
+        self._ensure_token_index()
+        return self._lower_texts
+    
+    def _get_bm25_index(self) -> tuple:
+        """Get the BM25 index, building it if it is missing or out of date."""
+        index = self._bm25_index
+        if index is not None and index[0] == len(self._chunks):
+            return index
+        
+        word_index: Dict[str, Tuple[List[int], List[int]]] = {}
+        lengths = []
+        norms = []
+        for position, chunk in enumerate(self._chunks):
+            words = _WORD_PATTERN.findall(chunk.text_lower)
+            word_counts = Counter(words)
+            lengths.append(len(words))
+            norms.append(math.sqrt(sum(count * count for count in word_counts.values())))
+            for word, count in word_counts.items():
+                entry = word_index.get(word)
+                if entry is None:
+                    word_index[word] = ([position], [count])
+                else:
+                    entry[0].append(position)
+                    entry[1].append(count)
+        
+        postings = {
+            word: (np.array(positions, dtype=np.int64), np.array(counts, dtype=np.float64))
+            for word, (positions, counts) in word_index.items()
+        }
+        lengths = np.array(lengths, dtype=np.float64)
+        average_length = max(lengths.mean(), 1.0) if len(lengths) else 1.0
+        
+        norms = np.array(norms, dtype=np.float64)
+        
+        self._bm25_index = (len(self._chunks), postings, lengths, average_length, norms)
+        return self._bm25_index
+    
+    def _get_embedding_index(self) -> tuple:
+        """Get the embedding index, building it if it is missing or out of date."""
+        index = self._embedding_index
+        if index is None or index[0] != len(self._chunks):
+            index = self._build_embedding_index()
+        return index
+    
+    def _build_embedding_index(self) -> tuple:
+        """Stack and normalize the chunk embeddings for search_by_embedding."""
+        positions = [
+            position for position, chunk in enumerate(self._chunks)
+            if chunk.embedding is not None
+        ]
+        if positions:
+            matrix = _normalize_rows(np.asarray(
+                [self._chunks[position].embedding for position in positions],
+                dtype=np.float32
+            ))
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+        
+        faiss_index = None
+        if _HAS_FAISS and len(positions) >= _FAISS_MIN_CHUNKS:
+            import faiss
+            
+            quantizer = _FAISS_QUANTIZERS.get(self.embedding_quantization)
+            if self.index_type == "hnsw":
+                if quantizer is None:
+                    faiss_index = faiss.IndexHNSWFlat(
+                        matrix.shape[1], _HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT
+                    )
+                else:
+                    faiss_index = faiss.IndexHNSWSQ(
+                        matrix.shape[1],
+                        getattr(faiss.ScalarQuantizer, quantizer),
+                        _HNSW_NEIGHBORS,
+                        faiss.METRIC_INNER_PRODUCT
+                    )
+                    faiss_index.train(matrix)
+            elif quantizer is None:
+                faiss_index = faiss.IndexFlatIP(matrix.shape[1])
+            else:
+                faiss_index = faiss.IndexScalarQuantizer(
+                    matrix.shape[1],
+                    getattr(faiss.ScalarQuantizer, quantizer),
+                    faiss.METRIC_INNER_PRODUCT
+                )
+                faiss_index.train(matrix)
+            faiss_index.add(matrix)
+        
+        self._embedding_index = (len(self._chunks), matrix, positions, faiss_index)
+        return self._embedding_index
+    
+    def find_chunks_containing(
+        self,
+        terms: Iterable[str],
+        limit: Optional[int] = None
+    ) -> List[DocumentChunk]:
+        """
+        Find chunks whose text contains any of the terms (case-insensitive).
+        
+        Candidates come from an inverted index of the letter runs in each
+        chunk, built once and reused across calls, so only chunks sharing
+        letters with a term are checked. With pyahocorasick available, the
+        candidates of several terms are checked in one sweep per chunk.
+        Matches are the same as testing every chunk's lowercased text for
+        each term.
+        
+        Args:
+            terms: Substrings to look for
+            limit: Maximum number of chunks to return
+            
+        Returns:
+            Matching chunks, in store order
+        """
+        self._ensure_token_index()
+        lower_texts = self._lower_texts
+        
+        matches: Set[int] = set()
+        unresolved: List[Tuple[str, Iterable[int]]] = []
+        for term in terms:
+            term = term.lower()
+            runs = _TOKEN_PATTERN.findall(term)
+            if not runs:
+                candidates = range(len(lower_texts))
+            else:
+                # A chunk contains the term only if it contains each of its
+                # letter runs, and every occurrence of a run lies inside one
+                # of the chunk's tokens
+                postings = sorted((self._find_run(run) for run in runs), key=len)
+                candidates = postings[0].intersection(*postings[1:])
+                if runs[0] == term:
+                    # A term of letters only is contained exactly where a
+                    # token contains it
+                    matches |= candidates
+                    continue
+            unresolved.append((term, candidates))
+        
+        # The automaton can't hold an empty term, which every chunk contains
+        if _HAS_AHOCORASICK and len(unresolved) > 1 and all(term for term, _ in unresolved):
+            automaton = ahocorasick.Automaton()
+            candidates = set()
+            for term, term_candidates in unresolved:
+                automaton.add_word(term, term)
+                candidates.update(term_candidates)
+            automaton.make_automaton()
+            
+            matches.update(
+                position for position in candidates - matches
+                if next(automaton.iter(lower_texts[position]), None) is not None
+            )
+        else:
+            for term, candidates in unresolved:
+                matches.update(
+                    position for position in candidates
+                    if position not in matches and term in lower_texts[position]
+                )
+        
+        positions = sorted(matches)
+        if limit is not None:
+            positions = positions[:limit]
+        return [self._chunks[position] for position in positions]
+    
+    def document_frequency(self, term: str) -> int:
+        """
+        Get the number of chunks whose text contains a term (case-insensitive).
+        
+        Counts the same matches as find_chunks_containing, from the cached
+        inverted index.
+        """
+        term = term.lower()
+        runs = _TOKEN_PATTERN.findall(term)
+        if len(runs) == 1 and runs[0] == term:
+            self._ensure_token_index()
+            return len(self._find_run(term))
+        return len(self.find_chunks_containing([term]))
+    
+    def idf(self, term: str) -> float:
+        """
+        Get the smoothed inverse document frequency of a term.
+        
+        Rarer terms score higher; a term in every chunk scores 1.0.
+        """
+        n = len(self._chunks)
+        return math.log((1 + n) / (1 + self.document_frequency(term))) + 1.0
+    
+    def word_jaccard(
+        self,
+        words: Set[str],
+        chunks: List[DocumentChunk]
+    ) -> Optional[np.ndarray]:
+        """
+        Compute the Jaccard similarity between a word set and each chunk.
+        
+        A chunk's words are the distinct runs of three or more letters in
+        its lowercased text. Overlaps for all the chunks are counted at once
+        from the cached word index, without tokenizing any chunk text.
+        
+        Args:
+            words: Lowercased words to compare
+            chunks: Chunks of this store to compare against
+            
+        Returns:
+            Jaccard similarity of each chunk, or None if a chunk is not
+            in this store
+        """
+        positions = self._chunk_positions(chunks)
+        if positions is None:
+            return None
+        
+        if not words:
+            return np.zeros(len(positions))
+        
+        postings = [self._word_postings[word] for word in words if word in self._word_postings]
+        if postings:
+            overlap = np.bincount(np.concatenate(postings), minlength=len(self._chunks))[positions]
+        else:
+            overlap = np.zeros(len(positions), dtype=np.int64)
+        
+        return overlap / (len(words) + self._word_counts[positions] - overlap)
+    
+    def word_cosine(
+        self,
+        word_counts: Dict[str, int],
+        chunks: List[DocumentChunk]
+    ) -> Optional[np.ndarray]:
+        """
+        Compute the cosine similarity between word counts and each chunk's.
+        
+        Unlike word_jaccard, repeated words weigh more. A chunk's words are
+        the runs of three or more letters in its lowercased text. Dot
+        products for all the chunks are accumulated at once from the cached
+        BM25 index, without tokenizing any chunk text.
+        
+        Args:
+            word_counts: Number of occurrences of each lowercased word
+            chunks: Chunks of this store to compare against
+            
+        Returns:
+            Cosine similarity of each chunk, or None if a chunk is not in
+            this store
+        """
+        positions = self._chunk_positions(chunks)
+        if positions is None:
+            return None
+        
+        query_norm = math.sqrt(sum(count * count for count in word_counts.values()))
+        if query_norm == 0:
+            return np.zeros(len(positions))
+        
+        _, postings, _, _, norms = self._get_bm25_index()
+        dots = np.zeros(len(norms))
+        for word, count in word_counts.items():
+            entry = postings.get(word)
+            if entry is not None:
+                dots[entry[0]] += count * entry[1]
+        
+        chunk_norms = norms[positions]
+        return np.where(chunk_norms > 0, dots[positions] / (query_norm * np.where(chunk_norms > 0, chunk_norms, 1.0)), 0.0)
+    
+    def _chunk_positions(self, chunks: List[DocumentChunk]) -> Optional[np.ndarray]:
+        """Get the store positions of chunks, or None if one isn't in this store."""
+        self._ensure_token_index()
+        
+        positions = []
+        for chunk in chunks:
+            position = self._positions.get(id(chunk))
+            if position is None or self._chunks[position] is not chunk:
+                return None
+            positions.append(position)
+        return np.array(positions, dtype=np.int64)
+    
+    def _ensure_token_index(self) -> None:
+        """Build the inverted index if it is missing or out of date."""
+        if self._token_index is not None and self._indexed_count == len(self._chunks):
+            return
+        
+        token_index: Dict[str, Set[int]] = {}
+        word_index: Dict[str, List[int]] = {}
+        lower_texts = []
+        word_counts = []
+        for position, chunk in enumerate(self._chunks):
+            text = chunk.text_lower
+            lower_texts.append(text)
+            for token in set(_TOKEN_PATTERN.findall(text)):
+                postings = token_index.get(token)
+                if postings is None:
+                    token_index[token] = {position}
+                else:
+                    postings.add(position)
+            
+            words = chunk.text_words
+            word_counts.append(len(words))
+            for word in words:
+                postings = word_index.get(word)
+                if postings is None:
+                    word_index[word] = [position]
+                else:
+                    postings.append(position)
+        
+        self._token_index = token_index
+        self._lower_texts = lower_texts
+        self._indexed_count = len(self._chunks)
+        self._run_postings = {}
+        self._word_postings = {
+            word: np.array(positions, dtype=np.int64) for word, positions in word_index.items()
+        }
+        self._word_counts = np.array(word_counts, dtype=np.int64)
+        self._positions = {id(chunk): position for position, chunk in enumerate(self._chunks)}
+    
+    def _find_run(self, run: str) -> Set[int]:
+        """Get the positions of the chunks with a token containing a letter run."""
+        postings = self._run_postings.get(run)
+        if postings is None:
+            postings = set()
+            for token, positions in self._token_index.items():
+                if run in token:
+                    postings |= positions
+            self._run_postings[run] = postings
+        return postings
+    
+    def build_index(self) -> None:
+        """
+        Build the search indexes now rather than on first use.
+        
+        Once built, the indexes are only read until chunks are added, so
+        threads can search the store concurrently.
         """
-        # This would be replaced with actual search logic
-        return self._chunks[:limit]
+        self._ensure_token_index()
+        self.get_chunk("")
+        self._get_embedding_index()
+        self._get_bm25_index()
     
     def get_all_chunks(self) -> List[DocumentChunk]:
         """Get all chunks in the store."""
@@ -200,6 +860,125 @@ class DocumentStore:
         return len(self._chunks)
 
 
+def embed_in_batches(
+    texts: List[str],
+    embed_batch: Callable[[List[str]], Any],
+    batch_size: int = 20,
+    cache_dir: Optional[str] = None,
+    model: str = ""
+) -> List[List[float]]:
+    """
+    Embed texts with as few calls to an embedding function as possible.
+    
+    With a cache directory, each embedding is stored there as a .npy file
+    named by a hash of the model name and the text, and only the texts
+    without a stored embedding are embedded.
+    
+    Args:
+        texts: Texts to embed
+        embed_batch: Function embedding a list of texts, returning one
+            vector per text (e.g. a 2-D array)
+        batch_size: Maximum number of texts per call, e.g. a provider limit
+        cache_dir: Optional directory of embeddings cached on disk, shared
+            across runs and processes
+        model: Name of the embedding model, part of the cache key (required
+            with a cache directory)
+        
+    Returns:
+        Embedding of each text
+    
+    Raises:
+        ValueError: If a cache directory is given without a model name
+    """
+    if cache_dir is None:
+        return _embed_uncached(texts, embed_batch, batch_size)
+    
+    # Without a model name, embeddings of different models (and dimensions)
+    # would be read back for each other
+    if not model:
+        raise ValueError("Caching embeddings requires the name of the embedding model")
+    
+    cache_dir = os.path.expanduser(cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    paths = [_embedding_cache_path(cache_dir, model, text) for text in texts]
+    
+    embeddings: List[Optional[List[float]]] = []
+    for path in paths:
+        try:
+            embeddings.append(np.load(path).tolist())
+        except (OSError, ValueError):
+            embeddings.append(None)
+    
+    # Embed each missing text once, even if it occurs several times
+    missing: Dict[str, List[int]] = {}
+    for i, embedding in enumerate(embeddings):
+        if embedding is None:
+            missing.setdefault(paths[i], []).append(i)
+    
+    logger.debug("Found %d of %d embeddings in cache", len(texts) - sum(map(len, missing.values())), len(texts))
+    
+    if missing:
+        positions = list(missing.values())
+        computed = _embed_uncached([texts[group[0]] for group in positions], embed_batch, batch_size)
+        for group, embedding in zip(positions, computed):
+            _save_embedding(paths[group[0]], embedding)
+            for i in group:
+                embeddings[i] = embedding
+    
+    return embeddings
+
+
+def _embed_uncached(
+    texts: List[str],
+    embed_batch: Callable[[List[str]], Any],
+    batch_size: int
+) -> List[List[float]]:
+    """Embed texts with the embedding function, batch_size texts per call."""
+    embeddings = []
+    for start in range(0, len(texts), batch_size):
+        batch = embed_batch(texts[start:start + batch_size])
+        embeddings.extend(np.asarray(batch, dtype=float).tolist())
+    return embeddings
+
+
+def _embedding_cache_path(cache_dir: str, model: str, text: str) -> str:
+    """Get the path of the cached embedding of a text by a model."""
+    key = hashlib.blake2b(f"{model}|{text}".encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{key}.npy")
+
+
+def _save_embedding(path: str, embedding: List[float]) -> None:
+    """
+    Store an embedding in the disk cache.
+    
+    The file is written under a temporary name and then renamed, so other
+    processes reading the cache never see a partly written embedding.
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            np.save(f, np.asarray(embedding, dtype=float))
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning("Could not cache embedding in %s: %s", path, e)
+
+
+def _top_rows(scores: np.ndarray, limit: int) -> np.ndarray:
+    """Get the column indices of the highest scores of each row, highest first."""
+    if limit < scores.shape[1]:
+        top = np.argpartition(-scores, limit - 1, axis=1)[:, :limit]
+    else:
+        top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize the rows of a matrix, leaving all-zero rows as they are."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.ascontiguousarray(matrix / np.where(norms > 0, norms, 1.0), dtype=np.float32)
+
+
 @dataclass
 class VerificationResult:
     """
@@ -211,6 +990,71 @@ class VerificationResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
     report: Optional[VerificationReport] = None
     
+    # Generator (anything with a generate_report(result) method) that builds
+    # the report on the first get_report() call, attached by the processor
+    _report_generator: Any = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def get_report(self) -> Optional[VerificationReport]:
+        """
+        Get the detailed verification report.
+        
+        If a report generator is attached (auto_generate_report), the report
+        is generated on the first call and stored in ``report``.
+        """
+        if self.report is None and self._report_generator is not None:
+            self.report = self._report_generator.generate_report(self)
+        return self.report
+    
+    @property
+    def claims_by_position(self) -> List[Claim]:
+        """
+        Claims sorted by their start position in the response.
+        
+        Sorted on each access, since claim positions can be adjusted in
+        place.
+        """
+        return sorted(self.claims, key=operator.attrgetter("start_idx"))
+    
+    def aggregate_claims(self) -> Tuple[float, int, int]:
+        """
+        Collect the claim statistics behind the overall scores in one pass.
+        
+        The statistics are collected on each call, since claims are updated
+        in place (sources, confidence scores) after the result is built.
+        
+        Returns:
+            Sum of the claim confidence scores, number of claims with
+            sources, and number of low-confidence (potentially
+            hallucinated) claims
+        """
+        # Count claims with low confidence as potential hallucinations
+        hallucination_threshold = 0.5  # Could be configurable
+        
+        confidence_sum = 0.0
+        verified_claims = 0
+        hallucinated_claims = 0
+        for claim in self.claims:
+            confidence = claim.confidence_score
+            confidence_sum += confidence
+            if claim.sources:
+                verified_claims += 1
+            if confidence < hallucination_threshold:
+                hallucinated_claims += 1
+        
+        return confidence_sum, verified_claims, hallucinated_claims
+    
+    @property
+    def n_claims_with_source(self) -> int:
+        """Number of claims supported by at least one source."""
+        return self.aggregate_claims()[1]
+    
+    @property
+    def n_hallucinations(self) -> int:
+        """Number of low-confidence (potentially hallucinated) claims."""
+        return self.aggregate_claims()[2]
+    
     @property
     def confidence_score(self) -> float:
         """
@@ -222,7 +1066,7 @@ class VerificationResult:
             return 0.0
         
         # Simple average for now, but could be more sophisticated
-        return sum(c.confidence_score for c in self.claims) / len(self.claims)
+        return self.aggregate_claims()[0] / len(self.claims)
     
     @property
     def hallucination_score(self) -> float:
@@ -234,12 +1078,7 @@ class VerificationResult:
         if not self.claims:
             return 0.0
         
-        # Count claims with low confidence as potential hallucinations
-        hallucination_threshold = 0.5  # Could be configurable
-        hallucinated_claims = sum(1 for c in self.claims 
-                                 if c.confidence_score < hallucination_threshold)
-        
-        return hallucinated_claims / len(self.claims)
+        return self.aggregate_claims()[2] / len(self.claims)
     
     @property
     def requires_intervention(self) -> bool:
@@ -256,16 +1095,19 @@ class VerificationResult:
     
     def generate_report(self) -> VerificationReport:
         """Generate a detailed verification report."""
-        if self.report:
-            return self.report
+        report = self.get_report()
+        if report:
+            return report
         
         # This would be replaced with actual report generation logic
         # from the ReportGenerator component
+        total_claims = len(self.claims)
+        confidence_sum, verified_claims, hallucinated_claims = self.aggregate_claims()
         return VerificationReport(
-            overall_confidence=self.confidence_score,
-            verified_claims_count=sum(1 for c in self.claims if c.has_source),
-            total_claims_count=len(self.claims),
-            hallucination_score=self.hallucination_score,
+            overall_confidence=confidence_sum / total_claims if total_claims else 0.0,
+            verified_claims_count=verified_claims,
+            total_claims_count=total_claims,
+            hallucination_score=hallucinated_claims / total_claims if total_claims else 0.0,
             verification_summary="Placeholder summary",
             detailed_claims=[{
                 "id": c.id,
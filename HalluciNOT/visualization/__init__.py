@@ -5,7 +5,28 @@ This module provides functionality for highlighting verification results
 and generating detailed reports.
 """
 
+import importlib
+
 from .highlighter import highlight_verification_result, create_confidence_legend
-from .reporting import ReportGenerator
 
-__all__ = ["highlight_verification_result", "create_confidence_legend", "ReportGenerator"]
\ No newline at end of file
+__all__ = ["highlight_verification_result", "create_confidence_legend", "ReportGenerator"]
+
+# The report generator loads its templates when imported, so it is imported
+# on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "ReportGenerator": ".reporting",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
\ No newline at end of file
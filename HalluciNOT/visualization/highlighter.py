@@ -7,60 +7,53 @@ This module provides functionality for highlighting verified claims in
 LLM responses, showing confidence levels and source references.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, TextIO, Union
+import bisect
+import io
+import itertools
 import logging
 import re
 import html
 
 from ..utils.common import VerificationResult, Claim, ClaimType
 
+# Optional C-accelerated HTML escaping. MarkupSafe writes quotes as
+# numeric character references, html.escape as &quot; and &#x27;
+try:
+    from markupsafe import escape as _markup_escape
+    
+    def _escape(text: str) -> str:
+        return str(_markup_escape(text))
+    
+    _HAS_MARKUPSAFE = True
+except ImportError:
+    _escape = html.escape
+    _HAS_MARKUPSAFE = False
+
+# Characters that HTML escaping replaces; text without them is left as is
+_HTML_UNSAFE = re.compile(r"[<>&\"']")
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Lower bounds of the medium and high confidence levels; claims below the
+# first are low confidence
+_CONFIDENCE_THRESHOLDS = (0.3, 0.7)
 
-def highlight_verification_result(
-    verification_result: VerificationResult,
-    format: str = "html"
-) -> str:
-    """
-    Generate a highlighted version of the response showing confidence levels.
-    
-    Args:
-        verification_result: The verification result to visualize
-        format: Output format ('html', 'markdown', or 'text')
-        
-    Returns:
-        Highlighted response with confidence indicators
-    """
-    logger.debug("Generating highlighted response in %s format", format)
-    
-    if format == "html":
-        return _highlight_html(verification_result)
-    elif format == "markdown":
-        return _highlight_markdown(verification_result)
-    else:  # text is the default
-        return _highlight_text(verification_result)
+# Rendering of each confidence level (low, medium, high) in each format
+_HTML_CLASSES = ("low", "medium", "high")
+_MARKDOWN_MARKERS = ("❌", "⚠️", "✓")
+_TEXT_MARKERS = ("X", "!", "✓")
+_TEXT_LEVELS = ("LOW", "MEDIUM", "HIGH")
 
 
-def _highlight_html(verification_result: VerificationResult) -> str:
-    """
-    Generate an HTML-highlighted version of the response.
-    
-    This is the most visually rich format, with color coding,
-    tooltips, and interactive elements.
-    """
-    # Start with the original response text
-    response_text = verification_result.original_response
-    highlighted_text = ""
-    
-    # Sort claims by their position in the text
-    sorted_claims = sorted(verification_result.claims, key=lambda c: c.start_idx)
-    
-    # Track the current position in the text
-    current_pos = 0
-    
-    # Add CSS styles
-    styles = """
+def _confidence_level(score: float) -> int:
+    """Get the confidence level of a score: 0 (low), 1 (medium) or 2 (high)."""
+    return bisect.bisect_right(_CONFIDENCE_THRESHOLDS, score)
+
+
+# CSS styles of the HTML highlighting
+_HTML_STYLES = """
     <style>
         .verified-claim { display: inline; position: relative; }
         .verified-claim span { position: relative; }
@@ -101,221 +94,277 @@ def _highlight_html(verification_result: VerificationResult) -> str:
         .confidence-low { color: #c00; }
     </style>
     """
+
+# HTML legend of the confidence indicators
+_CONFIDENCE_LEGEND = """
+    <div class="confidence-legend">
+        <h3>Confidence Indicators</h3>
+        <ul>
+            <li><span class="verified-high">High confidence</span> - Claim is well-supported by sources</li>
+            <li><span class="verified-medium">Medium confidence</span> - Claim has partial support</li>
+            <li><span class="verified-low">Low confidence</span> - Claim has little or no support</li>
+        </ul>
+    </div>
+    """
+
+
+def highlight_verification_result(
+    verification_result: VerificationResult,
+    format: str = "html",
+    out: Optional[TextIO] = None
+) -> Union[str, TextIO]:
+    """
+    Generate a highlighted version of the response showing confidence levels.
     
-    # Process each claim and add highlighting
-    for i, claim in enumerate(sorted_claims):
-        # Add any text between the last claim and this one
-        highlighted_text += html.escape(response_text[current_pos:claim.start_idx])
-        
-        # Get the claim text
-        claim_text = response_text[claim.start_idx:claim.end_idx]
+    Args:
+        verification_result: The verification result to visualize
+        format: Output format ('html', 'markdown', or 'text')
+        out: Text stream to write the output to as it is generated,
+            instead of returning it as a string
         
-        # Determine confidence class
-        if claim.confidence_score >= 0.7:
-            confidence_class = "high"
-        elif claim.confidence_score >= 0.3:
-            confidence_class = "medium"
-        else:
-            confidence_class = "low"
+    Returns:
+        Highlighted response with confidence indicators, or out if given
+    """
+    logger.debug("Generating highlighted response in %s format", format)
+    
+    if format == "html":
+        return _highlight_html(verification_result, out)
+    elif format == "markdown":
+        return _highlight_markdown(verification_result, out)
+    else:  # text is the default
+        return _highlight_text(verification_result, out)
+
+
+def _split_spans(verification_result: VerificationResult) -> Tuple[List[Claim], List[str], List[str]]:
+    """
+    Cut the response into the text between claims and the text of claims.
+    
+    Args:
+        verification_result: The verification result to cut
         
-        # Create the tooltip content
-        tooltip = f"""
+    Returns:
+        Claims, gaps and claim texts, in position order. There is one more
+        gap than claims: the text before the first claim, between each two
+        claims (empty if they touch or overlap), and after the last claim
+    """
+    response_text = verification_result.original_response
+    claims = verification_result.claims_by_position
+    
+    starts = [claim.start_idx for claim in claims]
+    ends = [claim.end_idx for claim in claims]
+    
+    # Each gap runs from the end of a claim to the start of the next one
+    gaps = [response_text[start:end] for start, end in zip([0] + ends, starts + [len(response_text)])]
+    claim_texts = [response_text[start:end] for start, end in zip(starts, ends)]
+    
+    return claims, gaps, claim_texts
+
+
+def _highlight_html(
+    verification_result: VerificationResult,
+    out: Optional[TextIO] = None
+) -> Union[str, TextIO]:
+    """
+    Generate an HTML-highlighted version of the response.
+    
+    This is the most visually rich format, with color coding,
+    tooltips, and interactive elements.
+    """
+    # Write to the given stream, or collect the output in a new one
+    owned = out is None
+    if owned:
+        out = io.StringIO()
+    write = out.write
+    
+    # Wrap the response in a div with styles
+    write(_HTML_STYLES)
+    write("<div class='verification-result'>")
+    
+    # Without claims, there is nothing to highlight
+    response_text = verification_result.original_response
+    needs_escape = _HTML_UNSAFE.search(response_text) is not None
+    if not verification_result.claims:
+        write(_escape(response_text) if needs_escape else response_text)
+        write("</div>")
+        return out.getvalue() if owned else out
+    
+    # Escape the pieces of the response only if it has characters to escape
+    claims, gaps, claim_texts = _split_spans(verification_result)
+    if needs_escape:
+        gaps = [_escape(gap) for gap in gaps]
+        claim_texts = [_escape(claim_text) for claim_text in claim_texts]
+    
+    for gap, claim_html, claim in zip(gaps, claim_texts, claims):
+        write(gap)
+        _render_html_claim(out, claim_html, claim)
+    write(gaps[-1])
+    
+    write("</div>")
+    return out.getvalue() if owned else out
+
+
+def _render_html_claim(out: TextIO, claim_html: str, claim: Claim) -> None:
+    """Write a highlighted claim, given its escaped text, with its tooltip to the HTML output."""
+    write = out.write
+    confidence_score = claim.confidence_score
+    best_source = claim.best_source
+    notes = claim.verification_notes
+    confidence_class = _HTML_CLASSES[_confidence_level(confidence_score)]
+    
+    # Create the highlighted claim HTML, with its tooltip
+    write(f"""
+        <span class="verified-claim">
+            <span class="verified-{confidence_class}">{claim_html}</span>
+            """)
+    write(f"""
         <div class="tooltip">
             <div><strong>Claim Type:</strong> {claim.type.value}</div>
             <div class="confidence">
                 <strong>Confidence:</strong> 
-                <span class="confidence-{confidence_class}">{claim.confidence_score:.2f}</span>
+                <span class="confidence-{confidence_class}">{confidence_score:.2f}</span>
             </div>
-        """
-        
-        # Add source information if available
-        if claim.has_source:
-            best_source = claim.best_source
-            tooltip += f"""
-            <div><strong>Source:</strong> {html.escape(best_source.document_id)}</div>
-            <div class="source-excerpt">{html.escape(best_source.text_excerpt)}</div>
-            """
-        else:
-            tooltip += f"""
+        """)
+    
+    # Add source information if available
+    if best_source is not None:
+        write(f"""
+            <div><strong>Source:</strong> {_escape(best_source.document_id)}</div>
+            <div class="source-excerpt">{_escape(best_source.text_excerpt)}</div>
+            """)
+    else:
+        write("""
             <div class="source-excerpt">No direct source found for this claim.</div>
-            """
-        
-        # Add verification notes
-        if claim.verification_notes:
-            tooltip += f"""
-            <div><strong>Notes:</strong> {html.escape(claim.verification_notes)}</div>
-            """
-        
-        tooltip += "</div>"
-        
-        # Create the highlighted claim HTML
-        highlighted_claim = f"""
-        <span class="verified-claim">
-            <span class="verified-{confidence_class}">{html.escape(claim_text)}</span>
-            {tooltip}
-        </span>
-        """
-        
-        highlighted_text += highlighted_claim
-        
-        # Update current position
-        current_pos = claim.end_idx
+            """)
     
-    # Add any remaining text after the last claim
-    highlighted_text += html.escape(response_text[current_pos:])
+    # Add verification notes
+    if notes:
+        write(f"""
+            <div><strong>Notes:</strong> {_escape(notes)}</div>
+            """)
     
-    # Wrap in a div with styles
-    return f"{styles}<div class='verification-result'>{highlighted_text}</div>"
+    write("""</div>
+        </span>
+        """)
 
 
-def _highlight_markdown(verification_result: VerificationResult) -> str:
+def _highlight_markdown(
+    verification_result: VerificationResult,
+    out: Optional[TextIO] = None
+) -> Union[str, TextIO]:
     """
     Generate a Markdown-highlighted version of the response.
     
     This uses Markdown formatting for highlighting, which works
     in environments that support Markdown but not HTML.
     """
-    # Start with the original response text
-    response_text = verification_result.original_response
-    highlighted_text = ""
+    # Write to the given stream, or collect the output in a new one
+    owned = out is None
+    if owned:
+        out = io.StringIO()
+    write = out.write
     
-    # Sort claims by their position in the text
-    sorted_claims = sorted(verification_result.claims, key=lambda c: c.start_idx)
+    # Without claims, there is nothing to highlight or annotate
+    if not verification_result.claims:
+        write(verification_result.original_response)
+        write("\n\n---\n\n")
+        return out.getvalue() if owned else out
     
-    # Track the current position in the text
-    current_pos = 0
+    # Mark each claim with a footnote reference and its confidence marker,
+    # and collect its footnote, in one pass over the claims
+    claims, gaps, claim_texts = _split_spans(verification_result)
+    marked_claims = []
+    footnotes = []
     
-    # Process each claim and add highlighting
-    for i, claim in enumerate(sorted_claims):
-        # Add any text between the last claim and this one
-        highlighted_text += response_text[current_pos:claim.start_idx]
-        
-        # Get the claim text
-        claim_text = response_text[claim.start_idx:claim.end_idx]
+    for ref_num, (claim, text) in enumerate(zip(claims, claim_texts), 1):
+        confidence_score = claim.confidence_score
+        best_source = claim.best_source
+        notes = claim.verification_notes
         
-        # Determine confidence marker
-        if claim.confidence_score >= 0.7:
-            marker = "✓"  # High confidence
-        elif claim.confidence_score >= 0.3:
-            marker = "⚠️"  # Medium confidence
-        else:
-            marker = "❌"  # Low confidence
-        
-        # Create a reference for footnotes
-        ref_num = i + 1
-        
-        # Add the highlighted claim with footnote reference
-        highlighted_claim = f"{claim_text}[{marker}^{ref_num}]"
-        highlighted_text += highlighted_claim
-        
-        # Update current position
-        current_pos = claim.end_idx
-    
-    # Add any remaining text after the last claim
-    highlighted_text += response_text[current_pos:]
-    
-    # Add footnotes at the end
-    highlighted_text += "\n\n---\n\n"
-    
-    for i, claim in enumerate(sorted_claims):
-        ref_num = i + 1
-        footnote = f"^{ref_num}: "
+        marked_claims.append(f"{text}[{_MARKDOWN_MARKERS[_confidence_level(confidence_score)]}^{ref_num}]")
         
         # Add confidence information
-        footnote += f"Confidence: {claim.confidence_score:.2f} | Type: {claim.type.value}"
+        footnotes.append(f"^{ref_num}: Confidence: {confidence_score:.2f} | Type: {claim.type.value}")
         
         # Add source information if available
-        if claim.has_source:
-            best_source = claim.best_source
-            footnote += f"\n\nSource: {best_source.document_id}\n\n> {best_source.text_excerpt}"
+        if best_source is not None:
+            footnotes.append(f"\n\nSource: {best_source.document_id}\n\n> {best_source.text_excerpt}")
         else:
-            footnote += "\n\n> No direct source found for this claim."
+            footnotes.append("\n\n> No direct source found for this claim.")
         
         # Add verification notes
-        if claim.verification_notes:
-            footnote += f"\n\nNotes: {claim.verification_notes}"
+        if notes:
+            footnotes.append(f"\n\nNotes: {notes}")
         
-        highlighted_text += f"{footnote}\n\n"
+        footnotes.append("\n\n")
+    
+    out.writelines(itertools.chain.from_iterable(zip(gaps, marked_claims)))
+    write(gaps[-1])
     
-    return highlighted_text
+    # Add footnotes at the end
+    write("\n\n---\n\n")
+    out.writelines(footnotes)
+    
+    return out.getvalue() if owned else out
 
 
-def _highlight_text(verification_result: VerificationResult) -> str:
+def _highlight_text(
+    verification_result: VerificationResult,
+    out: Optional[TextIO] = None
+) -> Union[str, TextIO]:
     """
     Generate a plain text highlighted version of the response.
     
     This uses simple text markers for highlighting, suitable for
     environments that don't support HTML or Markdown.
     """
-    # Start with the original response text
-    response_text = verification_result.original_response
-    highlighted_text = ""
+    # Write to the given stream, or collect the output in a new one
+    owned = out is None
+    if owned:
+        out = io.StringIO()
+    write = out.write
     
-    # Sort claims by their position in the text
-    sorted_claims = sorted(verification_result.claims, key=lambda c: c.start_idx)
+    # Without claims, there is nothing to highlight or annotate
+    if not verification_result.claims:
+        write(verification_result.original_response)
+        write("\n\n---\n\n")
+        return out.getvalue() if owned else out
     
-    # Track the current position in the text
-    current_pos = 0
+    # Mark each claim with a reference and its confidence marker, and
+    # collect its annotation, in one pass over the claims
+    claims, gaps, claim_texts = _split_spans(verification_result)
+    marked_claims = []
+    annotations = []
     
-    # Process each claim and add highlighting
-    for i, claim in enumerate(sorted_claims):
-        # Add any text between the last claim and this one
-        highlighted_text += response_text[current_pos:claim.start_idx]
+    for ref_num, (claim, text) in enumerate(zip(claims, claim_texts), 1):
+        confidence_score = claim.confidence_score
+        level = _confidence_level(confidence_score)
+        best_source = claim.best_source
+        notes = claim.verification_notes
         
-        # Get the claim text
-        claim_text = response_text[claim.start_idx:claim.end_idx]
+        marked_claims.append(f"{text} [{_TEXT_MARKERS[level]}{ref_num}]")
         
-        # Determine confidence marker
-        if claim.confidence_score >= 0.7:
-            marker = "✓"  # High confidence
-        elif claim.confidence_score >= 0.3:
-            marker = "!"  # Medium confidence
-        else:
-            marker = "X"  # Low confidence
-        
-        # Create a reference for annotations
-        ref_num = i + 1
-        
-        # Add the highlighted claim with reference
-        highlighted_claim = f"{claim_text} [{marker}{ref_num}]"
-        highlighted_text += highlighted_claim
-        
-        # Update current position
-        current_pos = claim.end_idx
-    
-    # Add any remaining text after the last claim
-    highlighted_text += response_text[current_pos:]
-    
-    # Add annotations at the end
-    highlighted_text += "\n\n---\n\n"
-    
-    for i, claim in enumerate(sorted_claims):
-        ref_num = i + 1
-        
-        # Determine confidence marker
-        if claim.confidence_score >= 0.7:
-            confidence_text = "HIGH"
-        elif claim.confidence_score >= 0.3:
-            confidence_text = "MEDIUM"
-        else:
-            confidence_text = "LOW"
-        
-        annotation = f"[{ref_num}] Confidence: {confidence_text} ({claim.confidence_score:.2f}) | Type: {claim.type.value}"
+        annotations.append(f"[{ref_num}] Confidence: {_TEXT_LEVELS[level]} ({confidence_score:.2f}) | Type: {claim.type.value}")
         
         # Add source information if available
-        if claim.has_source:
-            best_source = claim.best_source
-            annotation += f"\nSource: {best_source.document_id}\n\n\"{best_source.text_excerpt}\""
+        if best_source is not None:
+            annotations.append(f"\nSource: {best_source.document_id}\n\n\"{best_source.text_excerpt}\"")
         else:
-            annotation += "\nNo direct source found for this claim."
+            annotations.append("\nNo direct source found for this claim.")
         
         # Add verification notes
-        if claim.verification_notes:
-            annotation += f"\nNotes: {claim.verification_notes}"
+        if notes:
+            annotations.append(f"\nNotes: {notes}")
         
-        highlighted_text += f"{annotation}\n\n"
+        annotations.append("\n\n")
+    
+    out.writelines(itertools.chain.from_iterable(zip(gaps, marked_claims)))
+    write(gaps[-1])
+    
+    # Add annotations at the end
+    write("\n\n---\n\n")
+    out.writelines(annotations)
     
-    return highlighted_text
+    return out.getvalue() if owned else out
 
 
 def create_confidence_legend() -> str:
@@ -325,13 +374,4 @@ def create_confidence_legend() -> str:
     Returns:
         HTML string with the confidence legend
     """
-    return """
-    <div class="confidence-legend">
-        <h3>Confidence Indicators</h3>
-        <ul>
-            <li><span class="verified-high">High confidence</span> - Claim is well-supported by sources</li>
-            <li><span class="verified-medium">Medium confidence</span> - Claim has partial support</li>
-            <li><span class="verified-low">Low confidence</span> - Claim has little or no support</li>
-        </ul>
-    </div>
-    """
\ No newline at end of file
+    return _CONFIDENCE_LEGEND
\ No newline at end of file
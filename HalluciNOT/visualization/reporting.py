@@ -7,16 +7,204 @@ This module provides functionality for generating detailed reports on
 verification results, including summary statistics and visualization.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, TextIO, Union, Callable, Iterable
 import logging
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+import bisect
+import functools
+import io
 import json
 
-from ..utils.common import VerificationResult, VerificationReport, Claim, ClaimType
+from ..utils.common import VerificationResult, VerificationReport, Claim, ClaimType, InterventionType
+from .highlighter import _HTML_CLASSES, _confidence_level, _escape
+
+# Optional fast JSON serialization of reports
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    _HAS_ORJSON = False
+
+# Optional compiled templates for HTML reports, loaded on the first render
+try:
+    import jinja2
+    from markupsafe import Markup
+    _HAS_JINJA2 = True
+except ImportError:
+    jinja2 = None
+    Markup = None
+    _HAS_JINJA2 = False
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+def _template_bytecode_cache():
+    """
+    Get a cache of compiled template bytecode shared across runs.
+    
+    The cache lives in a per-user directory of the system temp directory,
+    so later processes load the compiled templates instead of compiling
+    them again. Returns None if that directory can't be used.
+    """
+    try:
+        return jinja2.FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logger.debug("Not caching compiled report templates: %s", e)
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _template_env():
+    """
+    Create the Jinja2 environment of the report templates.
+    
+    Created on the first render rather than at import, so importing the
+    module neither reads the templates nor touches the bytecode cache.
+    """
+    return jinja2.Environment(
+        loader=jinja2.PackageLoader(__package__, "templates"),
+        bytecode_cache=_template_bytecode_cache(),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=50,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True
+    )
+
+
+def _get_template(name: str):
+    """
+    Get a compiled report template.
+    
+    Returns None when Jinja2 is not installed or the template is missing
+    (e.g. an install without the package data), so callers fall back to
+    the writers.
+    """
+    if not _HAS_JINJA2:
+        return None
+    try:
+        return _template_env().get_template(name)
+    except (jinja2.TemplateNotFound, ValueError) as e:
+        # PackageLoader raises ValueError when the templates directory is missing
+        logger.debug("Report template %s not available, using the writer instead: %s", name, e)
+        return None
+
+
+# Start of the HTML report, up to the header content (used when Jinja2 is
+# not installed; templates/report.html.j2 holds the same layout)
+_REPORT_HEAD = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Verification Report</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }
+                .report-container { max-width: 800px; margin: 0 auto; }
+                .report-header { background-color: #f4f4f4; padding: 15px; border-radius: 5px; }
+                .report-summary { margin-top: 20px; padding: 15px; background-color: #e9f7fe; border-radius: 5px; }
+                .confidence-high { color: #0c0; }
+                .confidence-medium { color: #cc0; }
+                .confidence-low { color: #c00; }
+                .claim-card { border: 1px solid #ddd; border-radius: 5px; margin-bottom: 15px; padding: 15px; }
+                .claim-high { border-left: 5px solid #0c0; }
+                .claim-medium { border-left: 5px solid #cc0; }
+                .claim-low { border-left: 5px solid #c00; }
+                .source-excerpt { background-color: #f9f9f9; border-left: 3px solid #ddd; padding: 10px; margin: 10px 0; }
+                .intervention { background-color: #fff8e1; padding: 10px; border-radius: 5px; margin-top: 10px; }
+                .metrics { display: flex; justify-content: space-between; margin: 20px 0; }
+                .metric-card { text-align: center; padding: 15px; background-color: #f4f4f4; border-radius: 5px; width: 30%; }
+                .metric-value { font-size: 24px; font-weight: bold; margin: 10px 0; }
+                .footer { margin-top: 30px; font-size: 0.8em; color: #666; text-align: center; }
+            </style>
+        </head>
+        <body>
+            <div class="report-container">
+                <div class="report-header">
+                    <h1>Verification Report</h1>
+                    """
+
+# End of the HTML report
+_REPORT_FOOTER = """
+                <div class="footer">
+                    <p>Generated by HalluciNOT Verification System</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+# Lower bounds of the moderate and high overall confidence levels
+_SUMMARY_CONFIDENCE_THRESHOLDS = (0.5, 0.8)
+
+# Upper bounds of the no and minor hallucination levels
+_SUMMARY_HALLUCINATION_THRESHOLDS = (0.1, 0.3)
+
+
+@functools.lru_cache(maxsize=1024)
+def _summary_text(
+    total_count: int,
+    verified_count: int,
+    confidence_level: int,
+    hallucination_level: int,
+    hallucination_percent: int,
+    intervention_counts: Optional[Tuple[int, int, int, int]]
+) -> str:
+    """
+    Build the text of a verification summary.
+    
+    The summary only depends on these few values, so it is cached for
+    results that are reported repeatedly or share the same figures.
+    
+    Args:
+        total_count: Number of claims
+        verified_count: Number of claims supported by sources
+        confidence_level: Overall confidence level, 0 (low), 1 (moderate)
+            or 2 (high)
+        hallucination_level: Hallucination level, 0 (none), 1 (minor) or
+            2 (significant)
+        hallucination_percent: Percentage of hallucinated claims
+        intervention_counts: Total, correction, uncertainty and removal
+            intervention counts, or None to leave out recommendations
+    """
+    # Overall confidence assessment
+    if confidence_level == 2:
+        summary = f"The response has high factual accuracy, with {verified_count}/{total_count} claims supported by source material."
+    elif confidence_level == 1:
+        summary = f"The response has moderate factual accuracy, with {verified_count}/{total_count} claims supported by source material."
+    else:
+        summary = f"The response has low factual accuracy, with only {verified_count}/{total_count} claims supported by source material."
+    
+    # Hallucination assessment
+    if hallucination_level == 0:
+        summary += " No significant hallucinations were detected."
+    elif hallucination_level == 1:
+        summary += f" Minor hallucinations were detected ({hallucination_percent}% of claims)."
+    else:
+        summary += f" Significant hallucinations were detected ({hallucination_percent}% of claims)."
+    
+    # Add recommendations
+    if intervention_counts is not None:
+        intervention_count, correction_count, uncertainty_count, removal_count = intervention_counts
+        
+        summary += f"\n\nRecommended interventions: {intervention_count} total"
+        
+        if correction_count > 0:
+            summary += f", {correction_count} corrections"
+        
+        if uncertainty_count > 0:
+            summary += f", {uncertainty_count} uncertainty qualifications"
+        
+        if removal_count > 0:
+            summary += f", {removal_count} removals"
+        
+        summary += "."
+    
+    return summary
+
 
 class ReportGenerator:
     """
@@ -39,6 +227,7 @@ class ReportGenerator:
         self.include_source_excerpts = self.config.get("include_source_excerpts", True)
         self.detailed_claim_analysis = self.config.get("detailed_claim_analysis", True)
         self.include_suggestions = self.config.get("include_suggestions", True)
+        self.num_workers = self.config.get("num_workers", 1)  # Worker processes of generate_many
         
         logger.debug("ReportGenerator initialized with config: %s", self.config)
     
@@ -54,25 +243,30 @@ class ReportGenerator:
         """
         logger.debug("Generating verification report")
         
-        # Calculate overall summary metrics
-        verified_claims_count = sum(1 for c in verification_result.claims if c.has_source)
+        # Calculate overall summary metrics in a single pass over the claims
         total_claims_count = len(verification_result.claims)
+        confidence_sum, verified_claims_count, hallucinated_count = verification_result.aggregate_claims()
+        overall_confidence = confidence_sum / total_claims_count if total_claims_count else 0.0
+        hallucination_score = hallucinated_count / total_claims_count if total_claims_count else 0.0
         
         # Generate detailed claim information
         detailed_claims = self._generate_detailed_claims(verification_result) if self.detailed_claim_analysis else []
         
         # Generate verification summary
-        verification_summary = self._generate_summary(verification_result)
+        verification_summary = self._generate_summary(
+            verification_result,
+            (overall_confidence, verified_claims_count, hallucination_score)
+        )
         
         # Create the report
         report = VerificationReport(
-            overall_confidence=verification_result.confidence_score,
+            overall_confidence=overall_confidence,
             verified_claims_count=verified_claims_count,
             total_claims_count=total_claims_count,
-            hallucination_score=verification_result.hallucination_score,
+            hallucination_score=hallucination_score,
             verification_summary=verification_summary,
             detailed_claims=detailed_claims,
-            generation_timestamp=datetime.now()
+            generation_timestamp=datetime.now(timezone.utc)
         )
         
         logger.info("Generated verification report with overall confidence: %.2f", 
@@ -80,6 +274,50 @@ class ReportGenerator:
         
         return report
     
+    def generate_many(
+        self,
+        verification_results: Iterable[VerificationResult],
+        format: str = "html",
+        num_workers: Optional[int] = None
+    ) -> List[Union[str, VerificationReport]]:
+        """
+        Generate reports for several verification results at once.
+        
+        With more than one worker the reports are generated by a pool of
+        processes. Rendering holds the interpreter lock throughout (MarkupSafe
+        and orjson don't release it, and Jinja2 templates run as Python
+        code), so threads would not generate reports in parallel. Results and
+        reports are pickled to and from the workers, which only pays off for
+        large batches.
+        
+        Args:
+            verification_results: The verification results to report on
+            format: Report format ('html', 'json', or 'object')
+            num_workers: Number of worker processes (defaults to the
+                num_workers setting)
+            
+        Returns:
+            Reports in the requested format, in the order of the results
+        """
+        if format == "html":
+            generate = self.generate_html_report
+        elif format == "json":
+            generate = self.generate_json_report
+        elif format == "object":
+            generate = self.generate_report
+        else:
+            raise ValueError(f"Unsupported report format: {format}")
+        
+        verification_results = list(verification_results)
+        num_workers = min(num_workers or self.num_workers, len(verification_results))
+        if num_workers <= 1:
+            return [generate(verification_result) for verification_result in verification_results]
+        
+        logger.debug("Generating %d %s reports with %d workers", len(verification_results), format, num_workers)
+        
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            return list(executor.map(generate, verification_results))
+    
     def _generate_detailed_claims(self, verification_result: VerificationResult) -> List[Dict[str, Any]]:
         """
         Generate detailed information for each claim.
@@ -88,13 +326,23 @@ class ReportGenerator:
         """
         detailed_claims = []
         
+        # Intervention of each claim (the first one, if a claim has several)
+        interventions_by_claim = {
+            intervention.claim_id: intervention
+            for intervention in reversed(verification_result.interventions)
+        }
+        
+        include_source_excerpts = self.include_source_excerpts
+        
         for claim in verification_result.claims:
+            claim_id = claim.id
+            sources = claim.sources
             claim_info = {
-                "id": claim.id,
+                "id": claim_id,
                 "text": claim.text,
                 "type": claim.type.value,
                 "confidence_score": claim.confidence_score,
-                "has_source": claim.has_source,
+                "has_source": len(sources) > 0,
                 "verification_notes": claim.verification_notes,
                 "position": {
                     "start_idx": claim.start_idx,
@@ -102,144 +350,205 @@ class ReportGenerator:
                 }
             }
             
-            # Add source information if available
-            if claim.has_source and self.include_source_excerpts:
-                sources_info = []
-                for source in claim.sources:
-                    source_info = {
+            # Add source information, with excerpts, if available and requested
+            if sources and include_source_excerpts:
+                claim_info["sources"] = [
+                    {
                         "document_id": source.document_id,
                         "chunk_id": source.chunk_id,
                         "alignment_score": source.alignment_score,
+                        "text_excerpt": source.text_excerpt
                     }
-                    
-                    # Include excerpt if requested
-                    if self.include_source_excerpts:
-                        source_info["text_excerpt"] = source.text_excerpt
-                    
-                    sources_info.append(source_info)
-                
-                claim_info["sources"] = sources_info
+                    for source in sources
+                ]
             
             # Add intervention information if available
-            for intervention in verification_result.interventions:
-                if intervention.claim_id == claim.id:
-                    claim_info["intervention"] = {
-                        "type": intervention.intervention_type.value,
-                        "confidence": intervention.confidence,
-                        "recommendation": intervention.recommendation,
-                        "explanation": intervention.explanation
-                    }
-                    break
+            intervention = interventions_by_claim.get(claim_id)
+            if intervention is not None:
+                claim_info["intervention"] = {
+                    "type": intervention.intervention_type.value,
+                    "confidence": intervention.confidence,
+                    "recommendation": intervention.recommendation,
+                    "explanation": intervention.explanation
+                }
             
             detailed_claims.append(claim_info)
         
         return detailed_claims
     
-    def _generate_summary(self, verification_result: VerificationResult) -> str:
+    def _generate_summary(
+        self,
+        verification_result: VerificationResult,
+        scores: Optional[Tuple[float, int, float]] = None
+    ) -> str:
         """
         Generate a human-readable summary of the verification results.
         
         This includes overall confidence, hallucination assessment,
         and recommendations.
+        
+        Args:
+            verification_result: The verification result to summarize
+            scores: Overall confidence, number of verified claims, and
+                hallucination score, if already computed
         """
-        claims = verification_result.claims
-        verified_count = sum(1 for c in claims if c.has_source)
-        total_count = len(claims)
+        total_count = len(verification_result.claims)
         
         if total_count == 0:
             return "No verifiable claims were found in this response."
         
-        # Overall confidence assessment
-        confidence_score = verification_result.confidence_score
-        
-        if confidence_score >= 0.8:
-            confidence_desc = "high"
-            summary = f"The response has high factual accuracy, with {verified_count}/{total_count} claims supported by source material."
-        elif confidence_score >= 0.5:
-            confidence_desc = "moderate"
-            summary = f"The response has moderate factual accuracy, with {verified_count}/{total_count} claims supported by source material."
-        else:
-            confidence_desc = "low"
-            summary = f"The response has low factual accuracy, with only {verified_count}/{total_count} claims supported by source material."
-        
-        # Hallucination assessment
-        hallucination_score = verification_result.hallucination_score
-        
-        if hallucination_score <= 0.1:
-            summary += " No significant hallucinations were detected."
-        elif hallucination_score <= 0.3:
-            summary += f" Minor hallucinations were detected ({int(hallucination_score * 100)}% of claims)."
-        else:
-            summary += f" Significant hallucinations were detected ({int(hallucination_score * 100)}% of claims)."
+        if scores is None:
+            confidence_sum, verified_count, hallucinated_count = verification_result.aggregate_claims()
+            scores = (confidence_sum / total_count, verified_count, hallucinated_count / total_count)
+        confidence_score, verified_count, hallucination_score = scores
         
-        # Add recommendations if requested
+        # Count the interventions of each type in a single pass
+        intervention_counts = None
         if self.include_suggestions and verification_result.interventions:
-            intervention_count = len(verification_result.interventions)
-            correction_count = sum(1 for i in verification_result.interventions if i.intervention_type.value == "correction")
-            uncertainty_count = sum(1 for i in verification_result.interventions if i.intervention_type.value == "uncertainty")
-            removal_count = sum(1 for i in verification_result.interventions if i.intervention_type.value == "removal")
-            
-            summary += f"\n\nRecommended interventions: {intervention_count} total"
-            
-            if correction_count > 0:
-                summary += f", {correction_count} corrections"
-            
-            if uncertainty_count > 0:
-                summary += f", {uncertainty_count} uncertainty qualifications"
-            
-            if removal_count > 0:
-                summary += f", {removal_count} removals"
-            
-            summary += "."
+            type_counts = Counter(
+                intervention.intervention_type for intervention in verification_result.interventions
+            )
+            intervention_counts = (
+                len(verification_result.interventions),
+                type_counts[InterventionType.CORRECTION],
+                type_counts[InterventionType.UNCERTAINTY],
+                type_counts[InterventionType.REMOVAL]
+            )
         
-        return summary
+        return _summary_text(
+            total_count,
+            verified_count,
+            bisect.bisect_right(_SUMMARY_CONFIDENCE_THRESHOLDS, confidence_score),
+            bisect.bisect_left(_SUMMARY_HALLUCINATION_THRESHOLDS, hallucination_score),
+            int(hallucination_score * 100),
+            intervention_counts
+        )
     
-    def generate_html_report(self, verification_result: VerificationResult) -> str:
+    def generate_html_report(
+        self,
+        verification_result: VerificationResult,
+        out: Optional[TextIO] = None
+    ) -> Union[str, TextIO]:
         """
         Generate an HTML report for the verification result.
         
         Args:
             verification_result: The verification result to report on
+            out: Text stream to write the report to as it is generated,
+                instead of returning it as a string
             
         Returns:
-            HTML string with the formatted report
+            HTML string with the formatted report, or out if given
         """
         report = self.generate_report(verification_result)
         
-        # Create HTML content
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Verification Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }}
-                .report-container {{ max-width: 800px; margin: 0 auto; }}
-                .report-header {{ background-color: #f4f4f4; padding: 15px; border-radius: 5px; }}
-                .report-summary {{ margin-top: 20px; padding: 15px; background-color: #e9f7fe; border-radius: 5px; }}
-                .confidence-high {{ color: #0c0; }}
-                .confidence-medium {{ color: #cc0; }}
-                .confidence-low {{ color: #c00; }}
-                .claim-card {{ border: 1px solid #ddd; border-radius: 5px; margin-bottom: 15px; padding: 15px; }}
-                .claim-high {{ border-left: 5px solid #0c0; }}
-                .claim-medium {{ border-left: 5px solid #cc0; }}
-                .claim-low {{ border-left: 5px solid #c00; }}
-                .source-excerpt {{ background-color: #f9f9f9; border-left: 3px solid #ddd; padding: 10px; margin: 10px 0; }}
-                .intervention {{ background-color: #fff8e1; padding: 10px; border-radius: 5px; margin-top: 10px; }}
-                .metrics {{ display: flex; justify-content: space-between; margin: 20px 0; }}
-                .metric-card {{ text-align: center; padding: 15px; background-color: #f4f4f4; border-radius: 5px; width: 30%; }}
-                .metric-value {{ font-size: 24px; font-weight: bold; margin: 10px 0; }}
-                .footer {{ margin-top: 30px; font-size: 0.8em; color: #666; text-align: center; }}
-            </style>
-        </head>
-        <body>
-            <div class="report-container">
-                <div class="report-header">
-                    <h1>Verification Report</h1>
-                    <p>Generated on: {report.generation_timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>
+        # Write to the given stream, or collect the report in a new one
+        owned = out is None
+        if owned:
+            out = io.StringIO()
+        write = out.write
+        
+        # Render the compiled template, which escapes all report text
+        template = _get_template("report.html.j2")
+        if template is not None:
+            template.stream(
+                report=report, cls=self._get_confidence_class, claim_card=self._render_claim_card
+            ).dump(out)
+            return out.getvalue() if owned else out
+        
+        write(_REPORT_HEAD)
+        write(f"""<p>Generated on: {report.generation_timestamp.isoformat(' ', 'seconds')}</p>
                 </div>
-                
-                <div class="metrics">
+                """)
+        self._write_metrics(write, report)
+        self._write_summary(write, report)
+        self._write_claims(write, report)
+        write(_REPORT_FOOTER)
+        
+        return out.getvalue() if owned else out
+    
+    def generate_html_patch(
+        self,
+        previous_report: VerificationReport,
+        verification_result: VerificationResult
+    ) -> List[Dict[str, str]]:
+        """
+        Generate the changes to an HTML report for an updated verification result.
+        
+        Instead of rendering the whole report again, only the parts of the
+        report that differ from the previous one are rendered. Each change
+        replaces the element matching its target selector with its HTML:
+        the metrics, the summary, a single claim card, or the whole claim
+        analysis when claims were added, removed or reordered.
+        
+        Args:
+            previous_report: The report the HTML currently shows
+            verification_result: The updated verification result
+            
+        Returns:
+            List of {"op": "replace", "target": selector, "html": html} changes
+        """
+        report = self.generate_report(verification_result)
+        patch = []
+        
+        # Overall metrics
+        if (
+            report.overall_confidence != previous_report.overall_confidence
+            or report.verified_claims_count != previous_report.verified_claims_count
+            or report.total_claims_count != previous_report.total_claims_count
+            or report.hallucination_score != previous_report.hallucination_score
+        ):
+            patch.append(self._replace("#report-metrics", "_metrics.html.j2", self._write_metrics, report=report))
+        
+        if report.verification_summary != previous_report.verification_summary:
+            patch.append(self._replace("#report-summary", "_summary.html.j2", self._write_summary, report=report))
+        
+        # Replace changed claim cards in place while the claims stay the same,
+        # otherwise the whole claim analysis
+        previous_claims = previous_report.detailed_claims
+        claims = report.detailed_claims
+        if [claim_info["id"] for claim_info in claims] != [claim_info["id"] for claim_info in previous_claims]:
+            patch.append(self._replace("#claim-analysis", "_claims.html.j2", self._write_claims, report=report))
+        else:
+            for previous_info, claim_info in zip(previous_claims, claims):
+                if claim_info != previous_info:
+                    patch.append(self._replace(
+                        f"#claim-{claim_info['id']}", None, self._write_claim_card, claim_info=claim_info
+                    ))
+        
+        logger.debug("Generated HTML report patch with %d changes", len(patch))
+        
+        return patch
+    
+    def _replace(
+        self,
+        target: str,
+        template_name: Optional[str],
+        writer: Callable[..., None],
+        **context: Any
+    ) -> Dict[str, str]:
+        """
+        Render a part of the HTML report as a replace change for its target.
+        
+        The part is rendered from its template, or with its writer when
+        Jinja2 or the template is not available; both take the same context
+        variables.
+        """
+        template = _get_template(template_name) if template_name is not None else None
+        if template is not None:
+            html = template.render(
+                cls=self._get_confidence_class, claim_card=self._render_claim_card, **context
+            )
+        else:
+            out = io.StringIO()
+            writer(out.write, **context)
+            html = out.getvalue()
+        return {"op": "replace", "target": target, "html": html}
+    
+    def _write_metrics(self, write: Callable[[str], Any], report: VerificationReport) -> None:
+        """Write the overall metrics of the HTML report."""
+        write(f"""
+                <div class="metrics" id="report-metrics">
                     <div class="metric-card">
                         <h3>Overall Confidence</h3>
                         <div class="metric-value confidence-{self._get_confidence_class(report.overall_confidence)}">
@@ -261,82 +570,96 @@ class ReportGenerator:
                         </div>
                     </div>
                 </div>
-                
-                <div class="report-summary">
+                """)
+    
+    def _write_summary(self, write: Callable[[str], Any], report: VerificationReport) -> None:
+        """Write the summary of the HTML report."""
+        write(f"""
+                <div class="report-summary" id="report-summary">
                     <h2>Summary</h2>
-                    <p>{report.verification_summary}</p>
+                    <p>{_escape(report.verification_summary)}</p>
                 </div>
-        """
+        """)
+    
+    def _write_claims(self, write: Callable[[str], Any], report: VerificationReport) -> None:
+        """Write the claim analysis of the HTML report."""
+        write("""
+                <div id="claim-analysis">""")
         
         if report.detailed_claims:
-            html_content += """
+            write("""
                 <h2>Claim Analysis</h2>
-            """
+            """)
             
             for claim_info in report.detailed_claims:
-                confidence = claim_info["confidence_score"]
-                confidence_class = self._get_confidence_class(confidence)
-                
-                html_content += f"""
-                <div class="claim-card claim-{confidence_class}">
-                    <h3>Claim: "{claim_info["text"]}"</h3>
-                    <p><strong>Type:</strong> {claim_info["type"]}</p>
+                self._write_claim_card(write, claim_info)
+        
+        write("""
+                </div>
+                """)
+    
+    def _render_claim_card(self, claim_info: Dict[str, Any]) -> "Markup":
+        """
+        Render the card of a claim for the report templates.
+        
+        Cards all have the same shape and there can be thousands of them,
+        so the templates render them with _write_claim_card, several times
+        faster than a Jinja2 include per card.
+        """
+        parts: List[str] = []
+        self._write_claim_card(parts.append, claim_info)
+        return Markup("".join(parts))
+    
+    def _write_claim_card(self, write: Callable[[str], Any], claim_info: Dict[str, Any]) -> None:
+        """Write the card of a claim in the HTML report."""
+        confidence = claim_info["confidence_score"]
+        confidence_class = self._get_confidence_class(confidence)
+        
+        write(f"""
+                <div class="claim-card claim-{confidence_class}" id="claim-{_escape(claim_info["id"])}">
+                    <h3>Claim: "{_escape(claim_info["text"])}"</h3>
+                    <p><strong>Type:</strong> {_escape(claim_info["type"])}</p>
                     <p><strong>Confidence:</strong> <span class="confidence-{confidence_class}">{confidence:.2f}</span></p>
-                """
-                
-                if "sources" in claim_info and claim_info["sources"]:
-                    html_content += f"""
+                """)
+        
+        if "sources" in claim_info and claim_info["sources"]:
+            write(f"""
                     <h4>Sources:</h4>
-                    """
-                    
-                    for source in claim_info["sources"]:
-                        html_content += f"""
+                    """)
+            
+            for source in claim_info["sources"]:
+                write(f"""
                         <div>
-                            <p><strong>Document:</strong> {source["document_id"]}</p>
+                            <p><strong>Document:</strong> {_escape(source["document_id"])}</p>
                             <p><strong>Alignment:</strong> {source["alignment_score"]:.2f}</p>
                             <div class="source-excerpt">
-                                {source.get("text_excerpt", "No excerpt available")}
+                                {_escape(source.get("text_excerpt", "No excerpt available"))}
                             </div>
                         </div>
-                        """
-                else:
-                    html_content += """
+                        """)
+        else:
+            write("""
                     <p><strong>Sources:</strong> No supporting sources found</p>
-                    """
-                
-                if "intervention" in claim_info:
-                    intervention = claim_info["intervention"]
-                    html_content += f"""
+                    """)
+        
+        if "intervention" in claim_info:
+            intervention = claim_info["intervention"]
+            write(f"""
                     <div class="intervention">
-                        <h4>Recommended Intervention: {intervention["type"]}</h4>
-                        <p><strong>Recommendation:</strong> {intervention["recommendation"]}</p>
-                        {"<p><strong>Explanation:</strong> " + intervention["explanation"] + "</p>" if "explanation" in intervention and intervention["explanation"] else ""}
+                        <h4>Recommended Intervention: {_escape(intervention["type"])}</h4>
+                        <p><strong>Recommendation:</strong> {_escape(intervention["recommendation"])}</p>
+                        {"<p><strong>Explanation:</strong> " + _escape(intervention["explanation"]) + "</p>" if "explanation" in intervention and intervention["explanation"] else ""}
                     </div>
-                    """
-                
-                html_content += """
-                </div>
-                """
+                    """)
         
-        html_content += """
-                <div class="footer">
-                    <p>Generated by HalluciNOT Verification System</p>
+        write("""
                 </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html_content
+                """)
     
-    def _get_confidence_class(self, score: float) -> str:
+    @staticmethod
+    def _get_confidence_class(score: float) -> str:
         """Get the CSS class for a confidence score."""
-        if score >= 0.7:
-            return "high"
-        elif score >= 0.3:
-            return "medium"
-        else:
-            return "low"
+        return _HTML_CLASSES[_confidence_level(score)]
     
     def generate_json_report(self, verification_result: VerificationResult) -> str:
         """
@@ -361,5 +684,10 @@ class ReportGenerator:
             "generation_timestamp": report.generation_timestamp.isoformat()
         }
         
-        # Convert to JSON
+        # Convert to JSON (with orjson, non-ASCII characters are written as
+        # UTF-8 rather than escaped)
+        if _HAS_ORJSON:
+            return orjson.dumps(
+                report_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
         return json.dumps(report_dict, indent=2)
\ No newline at end of file
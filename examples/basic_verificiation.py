@@ -129,7 +129,7 @@ def main():
     print("\nVerification Result:")
     print(f"Overall confidence score: {result.confidence_score:.2f}")
     print(f"Hallucination score: {result.hallucination_score:.2f}")
-    print(f"Claims verified: {sum(1 for c in result.claims if c.has_source)}/{len(result.claims)}")
+    print(f"Claims verified: {result.n_claims_with_source}/{len(result.claims)}")
     
     # Print claim details
     print("\nDetailed Claim Analysis:")
@@ -165,14 +165,24 @@ def main():
     print("\nCorrected Response:")
     print(corrected)
     
-    # Generate HTML report
-    html_report = verifier.generate_report(result, format="html")
-    
-    # Save the HTML report to a file
+    # Write the HTML report straight to a file as it is generated
     with open("verification_report.html", "w") as f:
-        f.write(html_report)
+        verifier.generate_report(result, format="html", out=f)
     
     print("\nSaved HTML verification report to verification_report.html")
+    
+    # Verify several responses in one batch, extracting, mapping and scoring
+    # all their claims together
+    follow_up_responses = [
+        "The perceptron was invented by Frank Rosenblatt in 1957.",
+        "Transformers were introduced by Vaswani et al. in 2015.",
+        "Backpropagation was popularized by Rumelhart, Hinton and Williams in 1986."
+    ]
+    
+    print("\nVerifying follow-up responses in one batch...")
+    batch_results = verifier.verify_batch(follow_up_responses, document_store)
+    for response, batch_result in zip(follow_up_responses, batch_results):
+        print(f"  {batch_result.confidence_score:.2f} confidence: {response}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+"""Tests for claim extraction."""
+
+import random
+from contextlib import contextmanager
+
+import pytest
+
+from HalluciNOT.claim_extraction.extractor import ClaimExtractor, ClaimMerger
+from HalluciNOT.utils.common import Claim, ClaimType
+
+# Words mixing ASCII with text where Unicode-aware and ASCII-only \b, \w
+# and \d disagree (accented letters, Arabic-Indic and fullwidth digits)
+_WORDS = (
+    "The revenue grew 25% in 2021 because of Paris . is a the according to "
+    "more than Naïve al. ٣٤ ２０１８ Ünïcode café was has founded million "
+    "three Kelvin İstanbul on 3/4/2020 since 1999 dollars"
+).split()
+
+
+def _sentences(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(2, 12))]
+        yield " ".join(words) + rng.choice([".", "", "?"])
+
+
+@pytest.fixture(scope="module")
+def extractors():
+    pytest.importorskip("hyperscan")
+    fast = ClaimExtractor({"use_spacy": False, "use_hyperscan": True})
+    plain = ClaimExtractor({"use_spacy": False, "use_hyperscan": False})
+    assert fast._feature_db is not None and plain._feature_db is None
+    return fast, plain
+
+
+def test_scan_rule_features_matches_re_path(extractors):
+    fast, plain = extractors
+    for sentence in _sentences(2000):
+        features = fast._scan_rule_features(sentence)
+        assert fast._is_factual_claim_text(sentence, features=features) == \
+            plain._is_factual_claim_text(sentence), sentence
+        assert fast._determine_claim_type_text(sentence, features=features) == \
+            plain._determine_claim_type_text(sentence), sentence
+
+
+@pytest.mark.parametrize("sentence", ["Naïve al.", "It rose by ٣٤ points.", "Sales doubled in ２０１８."])
+def test_scan_rule_features_skips_non_ascii(extractors, sentence):
+    fast, plain = extractors
+    assert fast._scan_rule_features(sentence) is None
+    assert [(c.text, c.type) for c in fast.extract_claims(sentence)] == \
+        [(c.text, c.type) for c in plain.extract_claims(sentence)]
+
+
+def test_hyperscan_extraction_matches_re_extraction(extractors):
+    fast, plain = extractors
+    for sentence in _sentences(2000, seed=1):
+        assert [(c.text, c.type) for c in fast.extract_claims(sentence)] == \
+            [(c.text, c.type) for c in plain.extract_claims(sentence)], sentence
+
+
+class _RecordingPipeline:
+    """Stand-in for a spaCy pipeline that records open select_pipes contexts."""
+
+    pipe_names = ["tok2vec", "ner"]
+
+    def __init__(self):
+        self.open_contexts = 0
+
+    @contextmanager
+    def select_pipes(self, enable):
+        self.open_contexts += 1
+        try:
+            yield
+        finally:
+            self.open_contexts -= 1
+
+    def pipe(self, texts, batch_size=None, n_process=None):
+        return iter(texts)
+
+
+def test_extract_claims_batch_closes_pipeline_contexts_before_yielding(monkeypatch):
+    extractor = ClaimExtractor({"use_spacy": False})
+    nlp = _RecordingPipeline()
+    monkeypatch.setattr(extractor, "use_spacy", True)
+    monkeypatch.setattr(extractor, "nlp", nlp)
+    monkeypatch.setattr(extractor, "_claims_from_doc", lambda doc: [doc])
+
+    batches = extractor.extract_claims_batch(["a", "b", "c"])
+    assert next(batches) == ["a"]
+    assert nlp.open_contexts == 0
+    assert not extractor._nlp_lock.locked()
+
+    # Abandoning the iteration leaves nothing open either
+    del batches
+    assert nlp.open_contexts == 0
+
+
+def _merge_groups_loop(sorted_claims, max_distance, merge_same_type):
+    """The claim-by-claim grouping the array version replaced."""
+    groups = []
+    current = [0]
+    for i in range(1, len(sorted_claims)):
+        previous, claim = sorted_claims[current[-1]], sorted_claims[i]
+        if claim.start_idx - previous.end_idx <= max_distance and \
+                (not merge_same_type or claim.type == previous.type):
+            current.append(i)
+        else:
+            groups.append((current[0], current[-1] + 1))
+            current = [i]
+    groups.append((current[0], current[-1] + 1))
+    return groups
+
+
+@pytest.mark.parametrize("merge_same_type", [False, True])
+def test_merge_groups_match_claim_by_claim_grouping(merge_same_type):
+    rng = random.Random(2)
+    merger = ClaimMerger({"max_distance": 20, "merge_same_type": merge_same_type})
+    for _ in range(200):
+        claims = []
+        for i in range(rng.randint(2, 30)):
+            start = rng.randint(0, 500)
+            claims.append(Claim(
+                id=f"c{i}", text="x", type=rng.choice([ClaimType.NUMERICAL, ClaimType.OTHER]),
+                start_idx=start, end_idx=start + rng.randint(0, 60)
+            ))
+        claims.sort(key=lambda claim: claim.start_idx)
+        assert merger._find_merge_groups(claims) == \
+            _merge_groups_loop(claims, merger.max_distance, merge_same_type)
+
+
+def test_cached_extraction_returns_fresh_claims():
+    extractor = ClaimExtractor({"use_spacy": False, "cache_size": 8})
+    text = "The revenue grew 25% in 2021. Paris is the capital of France."
+    first = extractor.extract_claims(text)
+    second = extractor.extract_claims(text)
+
+    assert [(c.text, c.type) for c in second] == [(c.text, c.type) for c in first]
+    assert not {c.id for c in first} & {c.id for c in second}
+    assert all(a is not b for a, b in zip(first, second))
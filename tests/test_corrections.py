@@ -0,0 +1,25 @@
+"""Tests for the response correction helpers."""
+
+import random
+
+import pytest
+
+from HalluciNOT.handlers import corrections
+from HalluciNOT.handlers.corrections import _find_first_occurrences
+
+_PATTERNS = ["neural", "network", "net", "work", "1943", "McCulloch", "a", "", "absent", "n n"]
+
+
+@pytest.mark.parametrize("use_ahocorasick", [False, True])
+def test_find_first_occurrences_matches_str_find(monkeypatch, use_ahocorasick):
+    if use_ahocorasick:
+        pytest.importorskip("ahocorasick")
+    monkeypatch.setattr(corrections, "_HAS_AHOCORASICK", use_ahocorasick)
+
+    rng = random.Random(0)
+    words = "The first neural network model was by McCulloch and Pitts in 1943 n n".split()
+    for _ in range(300):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 20)))
+        patterns = rng.sample(_PATTERNS, rng.randint(1, 5))
+        expected = {pattern: text.find(pattern) for pattern in patterns if pattern in text}
+        assert _find_first_occurrences(text, patterns) == expected, (text, patterns)
@@ -0,0 +1,131 @@
+"""Tests for DocumentStore's indexed lookups against direct scans."""
+
+import random
+import re
+
+import numpy as np
+import pytest
+
+from HalluciNOT.utils import common
+from HalluciNOT.utils.common import DocumentChunk, DocumentStore
+
+_WORDS = (
+    "Frank Rosenblatt invented the perceptron in 1957 . revenue grew 3.5% "
+    "to $2.1 million e-mail Café naïve neural networks were popularized by "
+    "Rumelhart Hinton and Williams"
+).split()
+
+_TERMS = [
+    "rosenblatt", "frank rosenblatt", "3.5", "e-mail", "café", "net", "$2.1",
+    "perceptron in", "zzz", "", " the ", "1957 .",
+]
+
+
+def _chunks(count=60, seed=0):
+    rng = random.Random(seed)
+    return [
+        DocumentChunk(
+            id=f"chunk{i}",
+            text=" ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 15))),
+            source_document=f"doc{i % 4}",
+        )
+        for i in range(count)
+    ]
+
+
+def _containing(chunks, terms):
+    terms = [term.lower() for term in terms]
+    return [chunk for chunk in chunks if any(term in chunk.text.lower() for term in terms)]
+
+
+@pytest.mark.parametrize("use_ahocorasick", [False, True])
+def test_find_chunks_containing_matches_scan(monkeypatch, use_ahocorasick):
+    if use_ahocorasick:
+        pytest.importorskip("ahocorasick")
+    monkeypatch.setattr(common, "_HAS_AHOCORASICK", use_ahocorasick)
+
+    chunks = _chunks()
+    store = DocumentStore(chunks)
+    rng = random.Random(1)
+    for _ in range(200):
+        terms = rng.sample(_TERMS, rng.randint(1, 4))
+        assert store.find_chunks_containing(terms) == _containing(chunks, terms), terms
+
+
+def test_document_frequency_matches_scan():
+    chunks = _chunks()
+    store = DocumentStore(chunks)
+    for term in _TERMS:
+        assert store.document_frequency(term) == len(_containing(chunks, [term])), term
+
+
+def test_word_jaccard_matches_word_sets():
+    chunks = _chunks()
+    store = DocumentStore(chunks)
+    words = {"rosenblatt", "perceptron", "million", "absent"}
+    expected = []
+    for chunk in chunks:
+        chunk_words = set(re.findall(r"\b[A-Za-z]{3,}\b", chunk.text.lower()))
+        expected.append(len(words & chunk_words) / len(words | chunk_words))
+    np.testing.assert_allclose(store.word_jaccard(words, chunks), expected)
+
+
+def _embedded_store(monkeypatch, use_faiss):
+    if use_faiss:
+        pytest.importorskip("faiss")
+        monkeypatch.setattr(common, "_FAISS_MIN_CHUNKS", 0)
+    else:
+        monkeypatch.setattr(common, "_HAS_FAISS", False)
+
+    rng = np.random.RandomState(0)
+    chunks = _chunks()
+    for chunk in chunks[:-5]:
+        chunk.embedding = rng.rand(16).tolist()
+    return chunks, DocumentStore(chunks), rng.rand(8, 16)
+
+
+def _most_similar(chunks, query, limit):
+    embedded = [chunk for chunk in chunks if chunk.embedding is not None]
+    matrix = np.array([chunk.embedding for chunk in embedded])
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    similarities = matrix @ (query / np.linalg.norm(query))
+    return [embedded[row].id for row in np.argsort(-similarities)[:limit]]
+
+
+@pytest.mark.parametrize("use_faiss", [False, True])
+def test_search_by_embedding_matches_brute_force(monkeypatch, use_faiss):
+    chunks, store, queries = _embedded_store(monkeypatch, use_faiss)
+    for query in queries:
+        found = store.search_by_embedding(query.tolist(), limit=5)
+        assert [chunk.id for chunk in found] == _most_similar(chunks, query, 5)
+
+
+@pytest.mark.parametrize("use_faiss", [False, True])
+def test_search_by_embeddings_matches_brute_force(monkeypatch, use_faiss):
+    chunks, store, queries = _embedded_store(monkeypatch, use_faiss)
+    for query, found in zip(queries, store.search_by_embeddings(queries.tolist(), limit=5)):
+        assert [chunk.id for chunk in found] == _most_similar(chunks, query, 5)
+
+
+def test_embedding_cache_keeps_models_apart(tmp_path):
+    texts = ["alpha", "beta", "alpha"]
+    calls = []
+
+    def embed(width):
+        def embed_batch(batch):
+            calls.append(list(batch))
+            return [[float(len(text))] * width for text in batch]
+        return embed_batch
+
+    with pytest.raises(ValueError):
+        common.embed_in_batches(texts, embed(2), cache_dir=str(tmp_path))
+
+    small = common.embed_in_batches(texts, embed(2), cache_dir=str(tmp_path), model="small")
+    assert calls == [["alpha", "beta"]]
+    assert common.embed_in_batches(texts, embed(2), cache_dir=str(tmp_path), model="small") == small
+    assert len(calls) == 1
+
+    large = common.embed_in_batches(texts, embed(4), cache_dir=str(tmp_path), model="large")
+    assert [len(embedding) for embedding in large] == [4, 4, 4]
+
+    assert DocumentStore(embedding_cache_dir=str(tmp_path)).embedding_cache_dir is None
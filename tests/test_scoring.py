@@ -0,0 +1,73 @@
+"""Tests for the vectorized confidence scoring and intervention selection."""
+
+import random
+
+import pytest
+
+from HalluciNOT.confidence.scorer import ConfidenceScorer
+from HalluciNOT.handlers.strategies import InterventionSelector
+from HalluciNOT.utils.common import Claim, ClaimType, SourceReference
+
+# Claim counts that always take, or never take, the vectorized path
+_ALWAYS = {"vectorize_min_claims": 0}
+_NEVER = {"vectorize_min_claims": 10 ** 9}
+
+
+def _claims(count=300, seed=0):
+    rng = random.Random(seed)
+    claims = []
+    for i in range(count):
+        sources = [
+            SourceReference(
+                chunk_id=f"chunk{rng.randint(0, 9)}",
+                document_id="doc",
+                text_excerpt=rng.choice(["Paris in 1889", "The tower", "Eiffel built it", ""]),
+                alignment_score=rng.choice([0.0, 0.3, 0.5, 0.6, 0.7, 0.75, 0.9, rng.random()]),
+            )
+            for _ in range(rng.choice([0, 0, 1, 2, 3, 5]))
+        ]
+        claims.append(Claim(
+            id=f"c{i}",
+            text="x" * rng.choice([20, 100, 101, 150]),
+            type=rng.choice(list(ClaimType)),
+            start_idx=0,
+            end_idx=1,
+            entities=[{"text": text} for text in rng.sample(["Paris", "eiffel", "1889"], rng.randint(0, 2))],
+            sources=sources,
+            confidence_score=rng.choice([0.0, 0.05, 0.1, 0.2, 0.3, 0.5, 0.6, 0.7, 0.9, rng.random()]),
+        ))
+    return claims
+
+
+def _scores(config):
+    return [claim.confidence_score for claim in ConfidenceScorer(config).score_claims(_claims())]
+
+
+def test_batch_confidence_matches_per_claim_scores():
+    expected = _scores({**_NEVER, "use_numba": False})
+    assert _scores({**_ALWAYS, "use_numba": False}) == pytest.approx(expected)
+
+
+def test_numba_confidence_matches_numpy_scores():
+    pytest.importorskip("numba")
+    expected = _scores({**_ALWAYS, "use_numba": False})
+    assert _scores({**_ALWAYS, "use_numba": True}) == pytest.approx(expected)
+
+
+def _interventions(config):
+    interventions = InterventionSelector(config).select_interventions(_claims())
+    return [
+        (i.claim_id, i.intervention_type, i.confidence, i.recommendation, i.corrected_text, i.explanation)
+        for i in interventions
+    ]
+
+
+@pytest.mark.parametrize("aggressiveness", [0.5, 0.8])
+def test_batch_interventions_match_per_claim_selection(aggressiveness):
+    config = {"use_numba": False, "intervention_aggressiveness": aggressiveness}
+    assert _interventions({**config, **_ALWAYS}) == _interventions({**config, **_NEVER})
+
+
+def test_numba_interventions_match_numpy_selection():
+    pytest.importorskip("numba")
+    assert _interventions({**_ALWAYS, "use_numba": True}) == _interventions({**_ALWAYS, "use_numba": False})
@@ -0,0 +1,93 @@
+"""Tests for the derived values of claims and verification results."""
+
+from HalluciNOT.utils.common import Claim, ClaimType, SourceReference, VerificationResult
+
+
+def _source(chunk_id, alignment_score):
+    return SourceReference(
+        chunk_id=chunk_id, document_id="doc", text_excerpt=chunk_id, alignment_score=alignment_score
+    )
+
+
+def _result(count=4):
+    claims = [
+        Claim(id=f"c{i}", text=f"Claim {i}.", type=ClaimType.OTHER, start_idx=10 * i, end_idx=10 * i + 8)
+        for i in range(count)
+    ]
+    return VerificationResult(original_response="", claims=claims, interventions=[])
+
+
+def test_scores_follow_in_place_claim_updates():
+    result = _result()
+    assert (result.confidence_score, result.hallucination_score) == (0.0, 1.0)
+    assert result.n_claims_with_source == 0
+
+    for claim in result.claims:
+        claim.confidence_score = 1.0
+        claim.sources = [_source("a", 0.9)]
+
+    assert (result.confidence_score, result.hallucination_score) == (1.0, 0.0)
+    assert result.n_claims_with_source == 4
+    assert result.n_hallucinations == 0
+
+
+def test_type_idx_follows_type_reassignment():
+    claim = _result(1).claims[0]
+    assert claim.type_idx == ClaimType.OTHER.ordinal
+
+    claim.type = ClaimType.NUMERICAL
+    assert claim.type_idx == ClaimType.NUMERICAL.ordinal
+
+
+def test_best_source_follows_source_updates():
+    claim = _result(1).claims[0]
+    assert claim.best_source is None
+
+    claim.sources = [_source("a", 0.4), _source("b", 0.6)]
+    assert claim.best_source.chunk_id == "b"
+
+    # In-place changes to the sources and their scores are picked up too
+    claim.sources[0] = _source("c", 0.9)
+    assert claim.best_source.chunk_id == "c"
+    claim.sources[0].alignment_score = 0.0
+    claim.sources.append(_source("e", 0.7))
+    assert claim.best_source.chunk_id == "e"
+
+
+def test_claims_by_position_follows_position_updates():
+    result = _result(3)
+    assert [claim.id for claim in result.claims_by_position] == ["c0", "c1", "c2"]
+
+    result.claims[0].start_idx, result.claims[0].end_idx = 40, 48
+    assert [claim.id for claim in result.claims_by_position] == ["c1", "c2", "c0"]
+
+
+def test_get_claim_by_id_follows_claim_updates():
+    result = _result(2)
+    assert result.get_claim_by_id("c1") is result.claims[1]
+
+    replacement = Claim(id="c9", text="Other.", type=ClaimType.OTHER, start_idx=0, end_idx=6)
+    result.claims[1] = replacement
+    assert result.get_claim_by_id("c1") is None
+    assert result.get_claim_by_id("c9") is replacement
+
+    result.claims[0].id = "renamed"
+    assert result.get_claim_by_id("c0") is None
+    assert result.get_claim_by_id("renamed") is result.claims[0]
+
+
+def test_get_report_generates_once_with_attached_generator():
+    result = _result(2)
+    assert result.report is None and result.get_report() is None
+
+    calls = []
+
+    class _Generator:
+        def generate_report(self, verification_result):
+            calls.append(verification_result)
+            return "report"
+
+    result._report_generator = _Generator()
+    assert result.get_report() == "report"
+    assert result.get_report() == "report" and result.report == "report"
+    assert calls == [result]
@@ -0,0 +1,121 @@
+"""Tests for the optional fast paths of highlighting and reporting."""
+
+import html
+import json
+import re
+
+import pytest
+
+from HalluciNOT.visualization import highlighter, reporting
+from HalluciNOT.visualization.reporting import ReportGenerator
+from HalluciNOT.utils.common import (
+    Claim, ClaimType, Intervention, InterventionType, SourceReference, VerificationResult
+)
+
+_RESPONSE = 'The "Eiffel" tower <b>opened</b> in 1889 & cost 7.8M francs. It\'s 330 m tall. Ünïcode claim.'
+
+
+def _result():
+    spans = [(0, 60), (61, 77), (78, len(_RESPONSE))]
+    claims = []
+    for i, (start, end) in enumerate(spans):
+        claims.append(Claim(
+            id=f"c{i}",
+            text=_RESPONSE[start:end],
+            type=[ClaimType.TEMPORAL, ClaimType.NUMERICAL, ClaimType.OTHER][i],
+            start_idx=start,
+            end_idx=end,
+            sources=[
+                SourceReference(
+                    chunk_id=f"chunk{i}",
+                    document_id=f"doc <{i}> & 'x'",
+                    text_excerpt=f'Excerpt "{i}" <i>with</i> markup & quotes\'',
+                    alignment_score=0.4 * i,
+                )
+            ] if i else [],
+            confidence_score=[0.1, 0.5, 0.9][i],
+            verification_notes="Note <with> & markup",
+        ))
+    interventions = [
+        Intervention(
+            claim_id="c0",
+            intervention_type=InterventionType.REMOVAL,
+            confidence=0.9,
+            recommendation="Remove <this> & that",
+            explanation='No "source" found',
+        )
+    ]
+    return VerificationResult(original_response=_RESPONSE, claims=claims, interventions=interventions)
+
+
+def _normalize(page):
+    page = re.sub(r"Generated on:[^<]*", "", page)
+    return re.sub(r"\s+", "", page)
+
+
+def test_jinja2_report_matches_fallback(monkeypatch):
+    pytest.importorskip("jinja2")
+    result = _result()
+    generator = ReportGenerator()
+    with_templates = generator.generate_html_report(result)
+
+    monkeypatch.setattr(reporting, "_HAS_JINJA2", False)
+    assert _normalize(with_templates) == _normalize(generator.generate_html_report(result))
+
+
+def test_jinja2_patch_matches_fallback(monkeypatch):
+    pytest.importorskip("jinja2")
+    generator = ReportGenerator()
+    previous = generator.generate_report(_result())
+    changed = _result()
+    changed.claims[1].confidence_score = 0.2
+    with_templates = generator.generate_html_patch(previous, changed)
+
+    monkeypatch.setattr(reporting, "_HAS_JINJA2", False)
+    fallback = generator.generate_html_patch(previous, changed)
+    assert [change["target"] for change in with_templates] == [change["target"] for change in fallback]
+    assert [_normalize(change["html"]) for change in with_templates] == \
+        [_normalize(change["html"]) for change in fallback]
+
+
+def test_orjson_report_matches_json(monkeypatch):
+    pytest.importorskip("orjson")
+    result = _result()
+    generator = ReportGenerator()
+    report = generator.generate_report(result)
+    monkeypatch.setattr(generator, "generate_report", lambda verification_result: report)
+    with_orjson = generator.generate_json_report(result)
+
+    monkeypatch.setattr(reporting, "_HAS_ORJSON", False)
+    assert json.loads(with_orjson) == json.loads(generator.generate_json_report(result))
+
+
+@pytest.mark.parametrize("text", ["plain", "<b>&amp;</b>", "\"quoted\" 'single'", "Ünïcode & <>"])
+def test_escape_matches_html_escape(text):
+    escaped = highlighter._escape(text)
+    assert html.unescape(escaped) == text
+    assert not re.search(r"[<>\"']", escaped)
+    assert html.unescape(html.escape(text)) == html.unescape(escaped)
+
+
+@pytest.mark.parametrize("format", ["html", "markdown", "text"])
+def test_highlight_is_unchanged_by_escape_implementation(monkeypatch, format):
+    pytest.importorskip("markupsafe")
+    result = _result()
+    with_markupsafe = highlighter.highlight_verification_result(result, format)
+
+    monkeypatch.setattr(highlighter, "_escape", html.escape)
+    assert html.unescape(with_markupsafe) == \
+        html.unescape(highlighter.highlight_verification_result(result, format))
+
+
+def test_missing_templates_fall_back_to_writers(monkeypatch):
+    jinja2 = pytest.importorskip("jinja2")
+    result = _result()
+    generator = ReportGenerator()
+    monkeypatch.setattr(reporting, "_HAS_JINJA2", False)
+    fallback = generator.generate_html_report(result)
+
+    monkeypatch.setattr(reporting, "_HAS_JINJA2", True)
+    monkeypatch.setattr(reporting, "_template_env", lambda: jinja2.Environment(loader=jinja2.DictLoader({})))
+    assert generator.generate_html_report(result) == fallback